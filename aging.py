@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+
+# ✅ FIFO matching of deposits, returns and cashback against sales
+# Debits (opening balances and sales) and credits (deposits, returns,
+# cashback) are laid out per customer on one cumulative amount axis, in
+# date order. Every customer gets its own stretch of a single global axis, so
+# all customers are matched in one sort + searchsorted pass: each segment
+# between consecutive cumulative totals belongs to exactly one debit and at
+# most one credit. Amounts are matched in whole paisa (int64) to stay exact.
+# Undated rows (e.g. opening balances without a date) are older than every
+# dated one: they are matched first and aged in the oldest bucket.
+AGING_BUCKETS = [(0, 30, "0-30 days"), (31, 60, "31-60 days"), (61, 90, "61-90 days"), (91, None, "90+ days")]
+CREDIT_TERMS_DAYS = 30
+DSO_WINDOW_DAYS = 90
+
+
+def _to_paisa(values):
+    return np.round(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+
+
+# One row per debit / credit item: customer, date (NaT first), amount (paisa > 0), executive
+def _items(df):
+    ledger = df[df["customer_name"].notna()]
+    ledger = ledger.assign(_row=np.arange(len(ledger)))
+    debit = _to_paisa(ledger["openning_balance"]) + _to_paisa(ledger["sales_amount"])
+    credit = _to_paisa(ledger["paid_amount"]) + _to_paisa(ledger["sales_return"]) + _to_paisa(ledger["customer_cashback"])
+    # Negative opening balances are advances: they count as credits
+    net_debit, net_credit = np.maximum(debit, 0) + np.maximum(-credit, 0), np.maximum(credit, 0) + np.maximum(-debit, 0)
+
+    columns = ["customer_name", "date", "sales_executive", "_row"]
+    debits = ledger.loc[net_debit > 0, columns].assign(amount=net_debit[net_debit > 0])
+    credits = ledger.loc[net_credit > 0, columns].assign(amount=net_credit[net_credit > 0])
+    debits = debits.sort_values(["customer_name", "date", "_row"], kind="mergesort", na_position="first").reset_index(drop=True)
+    credits = credits.sort_values(["customer_name", "date", "_row"], kind="mergesort", na_position="first").reset_index(drop=True)
+    return debits, credits
+
+
+def _axis_end(items, codes, offset):
+    # End of every item on the global axis (customer offset + running total)
+    return offset[codes] + items.groupby(codes)["amount"].cumsum().to_numpy()
+
+
+# Whether item i[k] exists and belongs to the segment's customer
+def _owned(i, codes, owner):
+    if len(codes) == 0:
+        return np.zeros(len(i), dtype=bool)
+    return (i < len(codes)) & (codes[np.minimum(i, len(codes) - 1)] == owner)
+
+
+# Returns (matches, open_items, unapplied):
+#   matches:    debit date, credit date and matched amount, with the lag in days
+#   open_items: unpaid part of each debit (what makes up the outstanding)
+#   unapplied:  credits left after all debits are paid (customer advances)
+def fifo_match(df):
+    debits, credits = _items(df)
+    customers = pd.Index(pd.concat([debits["customer_name"], credits["customer_name"]]).unique()).sort_values()
+    debit_codes = customers.get_indexer(debits["customer_name"])
+    credit_codes = customers.get_indexer(credits["customer_name"])
+
+    debit_total = np.bincount(debit_codes, weights=debits["amount"], minlength=len(customers)).astype(np.int64)
+    credit_total = np.bincount(credit_codes, weights=credits["amount"], minlength=len(customers)).astype(np.int64)
+    span = np.maximum(debit_total, credit_total)
+    offset = np.concatenate([[0], np.cumsum(span)[:-1]]).astype(np.int64)
+
+    debit_end = _axis_end(debits, debit_codes, offset)
+    credit_end = _axis_end(credits, credit_codes, offset)
+    bounds = np.unique(np.concatenate([debit_end, credit_end, offset, offset + span]))
+    seg_start, seg_end = bounds[:-1], bounds[1:]
+
+    # Owner of each segment: the first item ending after the segment start
+    d = np.searchsorted(debit_end, seg_start, side="right")
+    c = np.searchsorted(credit_end, seg_start, side="right")
+    owner = np.searchsorted(offset, seg_start, side="right") - 1
+    has_debit = _owned(d, debit_codes, owner)
+    has_credit = _owned(c, credit_codes, owner)
+    amount = (seg_end - seg_start) / 100
+
+    both, debit_only, credit_only = has_debit & has_credit, has_debit & ~has_credit, has_credit & ~has_debit
+    matched_debits, matched_credits = debits.iloc[d[both]], credits.iloc[c[both]]
+    matches = pd.DataFrame({
+        "customer_name": matched_debits["customer_name"].to_numpy(),
+        "sales_executive": matched_debits["sales_executive"].to_numpy(),
+        "debit_date": matched_debits["date"].to_numpy(),
+        "credit_date": matched_credits["date"].to_numpy(),
+        "amount": amount[both],
+    })
+    matches["lag_days"] = (matches["credit_date"] - matches["debit_date"]).dt.days
+
+    open_debits = debits.iloc[d[debit_only]]
+    open_items = pd.DataFrame({
+        "customer_name": open_debits["customer_name"].to_numpy(),
+        "sales_executive": open_debits["sales_executive"].to_numpy(),
+        "debit_date": open_debits["date"].to_numpy(),
+        "open_amount": amount[debit_only],
+    })
+    open_credits = credits.iloc[c[credit_only]]
+    unapplied = pd.DataFrame({
+        "customer_name": open_credits["customer_name"].to_numpy(),
+        "credit_date": open_credits["date"].to_numpy(),
+        "unapplied_amount": amount[credit_only],
+    })
+    # Segments of the same item are merged back into one row (undated items too)
+    open_items = open_items.groupby(["customer_name", "sales_executive", "debit_date"], as_index=False, dropna=False)["open_amount"].sum()
+    unapplied = unapplied.groupby(["customer_name", "credit_date"], as_index=False, dropna=False)["unapplied_amount"].sum()
+    return matches, open_items, unapplied
+
+
+def _aging_bucket(age_days):
+    labels = [label for _, _, label in AGING_BUCKETS]
+    edges = [low for low, _, _ in AGING_BUCKETS[1:]]
+    return pd.Categorical.from_codes(np.searchsorted(edges, age_days, side="right"), labels)
+
+
+# Per key column(s), e.g. "customer_name" or ["sales_executive", "customer_name"]:
+# open amount by aging bucket, overdue amount (older than the credit terms),
+# amount-weighted collection lag of paid sales (prepayments count as 0 days;
+# undated items have no lag) and DSO over the last 90 days. Ages are taken at
+# the latest ledger date; undated items are older than any, so overdue.
+def collection_metrics(df, matches, open_items, key, as_of=None, terms=CREDIT_TERMS_DAYS):
+    key = [key] if isinstance(key, str) else list(key)
+    as_of = pd.Timestamp(as_of) if as_of is not None else df["date"].max()
+    open_items = open_items.assign(age_days=(as_of - open_items["debit_date"]).dt.days.astype("float64").fillna(np.inf))
+    open_items["bucket"] = _aging_bucket(open_items["age_days"])
+
+    aging = open_items.pivot_table(index=key, columns="bucket", values="open_amount", aggfunc="sum", observed=False, fill_value=0.0)
+    aging = aging.reindex(columns=[label for _, _, label in AGING_BUCKETS], fill_value=0.0)
+    aging.columns = list(aging.columns)
+    aging.insert(0, "open_amount", aging.sum(axis=1))
+    aging["overdue_amount"] = open_items[open_items["age_days"] > terms].groupby(key)["open_amount"].sum()
+
+    lag = matches[matches["lag_days"].notna()]
+    lag = lag.assign(weighted=lag["lag_days"].clip(lower=0) * lag["amount"])
+    lag = lag.groupby(key)[["weighted", "amount"]].sum()
+    avg_lag = (lag["weighted"] / lag["amount"].where(lag["amount"] != 0)).rename("avg_collection_days")
+
+    recent = df[(df["date"] > as_of - pd.Timedelta(days=DSO_WINDOW_DAYS)) & (df["date"] <= as_of)]
+    daily_sales = recent.groupby(key)["sales_amount"].sum() / DSO_WINDOW_DAYS
+
+    metrics = pd.concat([aging, avg_lag], axis=1)
+    metrics["dso_days"] = metrics["open_amount"] / daily_sales.reindex(metrics.index).where(lambda s: s != 0)
+    metrics = metrics.fillna({c: 0.0 for c in list(aging.columns)})
+    return metrics.rename_axis(key).reset_index()
+
+
+# Everything the dues pages read, built once per data version
+def build_aging(df, as_of=None):
+    matches, open_items, unapplied = fifo_match(df)
+    return {
+        "matches": matches,
+        "open_items": open_items,
+        "unapplied": unapplied,
+        "customer": collection_metrics(df, matches, open_items, "customer_name", as_of),
+        "executive": collection_metrics(df, matches, open_items, "sales_executive", as_of),
+        "executive_customer": collection_metrics(df, matches, open_items, ["sales_executive", "customer_name"], as_of),
+    }
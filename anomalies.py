@@ -0,0 +1,107 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# ✅ Anomaly flags on daily deposits, returns and cashback
+# Every day is scored against the trailing WINDOW business days (days present
+# in the ledger, so weekly holidays are not "missing") with a robust z-score,
+# (value - median) / (1.4826 * MAD) over the days that had an amount. All
+# series of a level are laid out as one (days x series) matrix and scored
+# together with sliding windows.
+# A zero deposit on a day when deposits are made on most days is flagged as a
+# missing deposit batch.
+ANOMALY_MEASURES = ("paid_amount", "sales_return", "customer_cashback")
+ANOMALY_LEVELS = ("company", "sales_executive")
+WINDOW = 30
+MIN_HISTORY = 10
+MIN_ACTIVE_DAYS = 5
+THRESHOLD = 3.5
+COMPANY = "All executives"
+
+FLAG_COLUMNS = ["date", "level", "name", "measure", "value", "baseline", "score", "flag"]
+
+
+def _daily_matrix(cube, level, days):
+    if level == "company":
+        daily = cube.groupby("date")[list(ANOMALY_MEASURES)].sum()
+        daily.columns = pd.MultiIndex.from_product([daily.columns, [COMPANY]])
+    else:
+        daily = cube.groupby(["date", level], observed=True)[list(ANOMALY_MEASURES)].sum().unstack(level)
+    # Business days with no rows for a series are zero days for it
+    return daily.reindex(days, fill_value=0.0).fillna(0.0)
+
+
+def _score(values):
+    n_days = values.shape[0]
+    padded = np.vstack([np.full((WINDOW, values.shape[1]), np.nan), values])
+    # history[t] = the WINDOW days before day t
+    history = sliding_window_view(padded, WINDOW, axis=0)[:n_days]
+    observed = (~np.isnan(history)).sum(axis=2)
+    # Deposits, returns and cashback are intermittent: amounts are compared with
+    # the days that had an amount, zero days only count towards how often they occur
+    active = np.where(history != 0, history, np.nan)
+    active_days = (~np.isnan(active)).sum(axis=2)
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        # All-NaN windows (the first days, never-active series) are expected
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(active, axis=2)
+        deviation = np.abs(active - median[..., None])
+        scale = 1.4826 * np.nanmedian(deviation, axis=2)
+        scale = np.where(scale > 0, scale, 1.2533 * np.nanmean(deviation, axis=2))
+        score = (values - median) / np.where(scale > 0, scale, np.nan)
+    score[(observed < MIN_HISTORY) | (active_days < MIN_ACTIVE_DAYS) | (values == 0)] = np.nan
+    usual = (observed >= MIN_HISTORY) & (active_days * 2 > observed)
+    return median, score, usual
+
+
+def _flags_for_level(cube, level, days):
+    daily = _daily_matrix(cube, level, days)
+    if daily.empty:
+        return pd.DataFrame(columns=FLAG_COLUMNS)
+    values = daily.to_numpy(dtype=np.float64)
+    median, score, usual = _score(values)
+
+    shape = values.shape
+    frame = pd.DataFrame({
+        "date": np.repeat(daily.index.to_numpy(), shape[1]),
+        "level": level,
+        "name": np.tile(daily.columns.get_level_values(1).astype(str), shape[0]),
+        "measure": np.tile(daily.columns.get_level_values(0).astype(str), shape[0]),
+        "value": values.ravel(),
+        "baseline": median.ravel(),
+        "score": score.ravel(),
+    })
+    spike = frame["score"] >= THRESHOLD
+    drop = frame["score"] <= -THRESHOLD
+    missing = (frame["measure"] == "paid_amount") & (frame["value"] == 0) & usual.ravel()
+    frame["flag"] = np.select([missing, spike, drop], ["missing deposit", "spike", "drop"], default="")
+    return frame[frame["flag"] != ""][FLAG_COLUMNS]
+
+
+def detect_anomalies(cube):
+    days = pd.DatetimeIndex(np.sort(cube["date"].dropna().unique()), name="date")
+    frames = [_flags_for_level(cube, level, days) for level in ANOMALY_LEVELS]
+    flags = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=FLAG_COLUMNS)
+    return flags.sort_values(["date", "level", "name", "measure"], kind="mergesort").reset_index(drop=True)
+
+
+# Flags for the whole history; with `previous` flags, only the days from
+# `since` onwards are rescored (using the WINDOW business days before them).
+def build_anomalies(cube, previous=None, since=None):
+    if previous is None:
+        return detect_anomalies(cube)
+    if since is None:
+        return previous
+    since = pd.Timestamp(since)
+    days = np.sort(cube["date"].dropna().unique())
+    start = max(np.searchsorted(days, since.to_datetime64()) - WINDOW, 0)
+    if start == 0:
+        return detect_anomalies(cube)
+    fresh = detect_anomalies(cube[cube["date"] >= days[start]])
+    fresh = fresh[fresh["date"] >= since]
+    kept = previous[previous["date"] < since]
+    flags = pd.concat([kept, fresh], ignore_index=True)
+    return flags.sort_values(["date", "level", "name", "measure"], kind="mergesort").reset_index(drop=True)
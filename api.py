@@ -0,0 +1,222 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from cache import DiskCache, ResultCache
+from refresher import DataRefresher
+from summaries import commission_summary, customer_dues, daily_recap, executive_summary, home_kpis, select_rows
+
+
+# ✅ Local JSON API for the dashboard numbers
+# Serves the summaries the pages compute (see summaries.py) from the same
+# background-refreshed dataset. Every response is encoded once per data
+# version and query, and kept with its gzip body and ETag in a ResultCache
+# (and on disk, see cache.DiskCache), so a polling client that sends
+# If-None-Match gets a bodiless 304.
+#
+# Usage:
+#   python api.py --port 8502
+#
+# Endpoints (dates are YYYY-MM-DD, ranges default to all data):
+#   /api/version
+#   /api/kpis?month=2025-08                      Home KPIs (default: current month)
+#   /api/executives?start=...&end=...            sales, deposit and due per executive
+#   /api/customer-dues?executive=...             outstanding per customer, with aging
+#   /api/commissions?start=...&end=...           commission per executive
+#   /api/daily-recap?start=...&end=...           daily, customer-daily and executive-daily totals
+
+API_CACHE_MAX_MB = 64
+
+
+def _date_range(df, query):
+    start = pd.to_datetime(query.get("start", df["date"].min()))
+    end = pd.to_datetime(query.get("end", df["date"].max()))
+    if start > end:
+        raise ValueError("start must not be after end")
+    return start, end
+
+
+def _records(frame):
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def version_info(data, query):
+    return {"modified_at": data.modified_at.isoformat(), "built_at": data.built_at.isoformat(), "rows": len(data.df)}
+
+
+def kpis(data, query):
+    day = pd.Period(query["month"], "M").start_time if "month" in query else pd.Timestamp.today()
+    month_range = (day.replace(day=1).normalize(), day + pd.offsets.MonthEnd(0))
+    return {
+        "month": day.strftime("%Y-%m"),
+        **home_kpis(data.df, day),
+        "buying_customers": data.activity.distinct("buying", month_range),
+        "paying_customers": data.activity.distinct("paying", month_range),
+    }
+
+
+def executives(data, query):
+    rows = select_rows(data.df, date_range=_date_range(data.df, query))
+    return _records(executive_summary(rows, data.snapshots))
+
+
+def customer_dues_by_executive(data, query):
+    executive = query.get("executive")
+    dues = customer_dues(select_rows(data.df, executive=executive))
+    if executive is None:
+        aging = data.aging["customer"]
+    else:
+        aging = data.aging["executive_customer"]
+        aging = aging[aging["sales_executive"] == executive].drop(columns="sales_executive")
+    return _records(dues.merge(aging, on="customer_name", how="left"))
+
+
+def commissions(data, query):
+    return _records(commission_summary(select_rows(data.df, date_range=_date_range(data.df, query))))
+
+
+def daily(data, query):
+    daily_summary, cust_daily, exec_daily = daily_recap(select_rows(data.df, date_range=_date_range(data.df, query)))
+    return {"daily": _records(daily_summary), "customers": _records(cust_daily), "executives": _records(exec_daily)}
+
+
+ROUTES = {
+    "/api/version": version_info,
+    "/api/kpis": kpis,
+    "/api/executives": executives,
+    "/api/customer-dues": customer_dues_by_executive,
+    "/api/commissions": commissions,
+    "/api/daily-recap": daily,
+}
+
+
+# (body, gzip body, ETag) of one response. The ETag is a weak one over the
+# summary alone, not the data version in the body, so a reload that does not
+# change this summary still answers 304.
+def encode_response(data, result):
+    body = json.dumps({"version": data.version, "data": result}, ensure_ascii=False, default=str).encode("utf-8")
+    content = json.dumps(result, ensure_ascii=False, default=str, sort_keys=True).encode("utf-8")
+    return body, gzip.compress(body, compresslevel=6), f'W/"{hashlib.sha1(content).hexdigest()[:20]}"'
+
+
+# If-None-Match compares ETags weakly (W/"x" matches "x"); "*" matches any
+def etag_matches(header, etag):
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+# Whether an Accept-Encoding header accepts gzip: "gzip" or "*" with a
+# q-value above 0 ("gzip;q=0" refuses it; an explicit gzip entry wins over "*")
+def accepts_gzip(header):
+    weights = {}
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    refresher = None
+    cache = None
+    verbose = False
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        route = ROUTES.get(url.path.rstrip("/"))
+        if route is None:
+            return self._send_error(404, f"Unknown endpoint {url.path}; try one of {', '.join(ROUTES)}")
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            data = self.refresher.current(timeout=30)
+        except Exception as e:
+            return self._send_error(503, f"Data is not available: {e}")
+        try:
+            # Today is part of the key: /api/kpis defaults to the current month
+            key = (data.version, route.__name__, tuple(sorted(query.items())), pd.Timestamp.today().date())
+            body, gzipped, etag = self.cache.get_or_build(key, lambda: encode_response(data, route(data, query)))
+        except (ValueError, KeyError) as e:
+            return self._send_error(400, str(e))
+
+        if etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(304)
+            self._common_headers(data, etag)
+            self.end_headers()
+            return
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        payload = gzipped if use_gzip else body
+        self.send_response(200)
+        self._common_headers(data, etag)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _common_headers(self, data, etag):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("X-Data-Version", data.version)
+
+    def _send_error(self, status, message):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(excel_path, host="127.0.0.1", port=8502, verbose=False, cache_dir=None):
+    handler = type("Handler", (ApiHandler,), {
+        "refresher": DataRefresher(excel_path).start(),
+        "cache": ResultCache(max_bytes=API_CACHE_MAX_MB * 1024 * 1024, store=DiskCache(cache_dir) if cache_dir else None),
+        "verbose": verbose,
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve dashboard summaries as JSON")
+    parser.add_argument("--excel", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "sale_data.xlsx"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--cache-dir", default=os.environ.get("RESULT_CACHE_DIR", "result_cache"),
+                        help="on-disk response cache shared with the dashboard ('' = memory only)")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.excel, args.host, args.port, args.verbose, args.cache_dir)
+    print(f"Serving {', '.join(ROUTES)} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
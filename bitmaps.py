@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+
+# ✅ Bitmap index of active customers per day
+# For every ledger day there is one packed bitmap (8 customers per byte) of the
+# customers who bought / paid / had any transaction that day, overall and
+# per executive and per customer type. A slice only spans its own customers
+# (ids are renumbered per executive / type), so the bitmaps stay small.
+# "Distinct customers in a date range" is an OR over the days in the range
+# and a popcount, without going back to the ledger rows.
+ACTIVITIES = {
+    "buying": "sales_amount",
+    "paying": "paid_amount",
+    "any": None,
+}
+SLICES = ("sales_executive", "customer_type")
+
+# Set bits per byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+# Packed (days x ceil(members / 8)) bitmaps, bits set in place (same bit
+# order as np.packbits) so no days x members boolean array is materialized
+def _pack(day_codes, member_codes, n_days, n_members):
+    packed = np.zeros((n_days, (n_members + 7) // 8), dtype=np.uint8)
+    bits = (0x80 >> (member_codes & 7)).astype(np.uint8)
+    np.bitwise_or.at(packed, (day_codes, member_codes >> 3), bits)
+    return packed
+
+
+class ActivityIndex:
+
+    def __init__(self, df):
+        ledger = df[df["customer_name"].notna() & df["date"].notna()]
+        self.days = pd.DatetimeIndex(np.sort(ledger["date"].unique()))
+        self.customers = pd.Index(np.sort(ledger["customer_name"].unique()))
+        day_codes = self.days.get_indexer(ledger["date"])
+        customer_codes = self.customers.get_indexer(ledger["customer_name"])
+
+        # (activity, slice) -> {label: packed bitmaps (days x bytes)}; slice None = all customers
+        self.bitmaps = {}
+        for activity, column in ACTIVITIES.items():
+            active = np.ones(len(ledger), dtype=bool) if column is None else (ledger[column] > 0).to_numpy()
+            days, customers = day_codes[active], customer_codes[active]
+            self.bitmaps[(activity, None)] = {None: _pack(days, customers, len(self.days), len(self.customers))}
+
+            for dimension in SLICES:
+                # Blank cells as None: comparing against pd.NA would not give a bool
+                labels = ledger[dimension].to_numpy(dtype=object, na_value=None)[active]
+                known = pd.notna(labels)
+                slices = {}
+                for label in pd.unique(labels[known]):
+                    rows = labels == label
+                    # Local ids: only this slice's customers get a bit
+                    members, local = np.unique(customers[rows], return_inverse=True)
+                    slices[label] = _pack(days[rows], local, len(self.days), len(members))
+                self.bitmaps[(activity, dimension)] = slices
+
+    def _day_slice(self, date_range):
+        if date_range is None:
+            return slice(0, len(self.days))
+        start = self.days.searchsorted(pd.to_datetime(date_range[0]), side="left")
+        end = self.days.searchsorted(pd.to_datetime(date_range[-1]), side="right")
+        return slice(start, end)
+
+    # Distinct active customers in the date range: an int, or a Series per
+    # executive / customer type when `by` is "sales_executive" / "customer_type"
+    def distinct(self, activity="buying", date_range=None, by=None):
+        days = self._day_slice(date_range)
+        counts = {}
+        for label, bitmaps in self.bitmaps[(activity, by)].items():
+            selected = bitmaps[days]
+            counts[label] = int(_POPCOUNT[np.bitwise_or.reduce(selected, axis=0)].sum()) if len(selected) else 0
+        if by is None:
+            return counts[None]
+        return pd.Series(counts, name=f"{activity}_customers", dtype="int64").rename_axis(by).sort_index()
+
+    # Buying / paying / any distinct counts side by side, per executive or type
+    def distinct_table(self, date_range=None, by="sales_executive"):
+        return pd.concat(
+            [self.distinct(activity, date_range, by) for activity in ACTIVITIES], axis=1
+        ).fillna(0).astype("int64").reset_index()
+
+    def nbytes(self):
+        return sum(bitmaps.nbytes for slices in self.bitmaps.values() for bitmaps in slices.values())
@@ -0,0 +1,418 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from io import BytesIO
+
+import pandas as pd
+
+from singleflight import SingleFlight
+
+
+# ✅ Approximate in-memory size of a cached value, in bytes
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "build_seconds", "created", "hits", "dates")
+
+    def __init__(self, value, size, build_seconds, dates=None):
+        self.value = value
+        self.size = size
+        self.build_seconds = build_seconds
+        self.created = time.time()
+        self.hits = 0
+        self.dates = dates
+
+
+# ✅ Persistent result cache on local disk, shared by every worker process.
+# One file per entry, named by a hash of the key (data version, page name and
+# widget inputs): a JSON header line followed by the DataFrames / Series of the
+# value as Parquet blobs (raw bytes for exports). Writes are atomic (temp file
+# + rename), a read touches the file's mtime, and once the directory grows past
+# `max_bytes` the least recently used files are deleted. Entries older than
+# `max_age` seconds are ignored. Values of other types stay memory-only.
+# Bump DISK_CACHE_FORMAT when a cached aggregate changes shape or meaning.
+DISK_CACHE_FORMAT = 1
+DISK_CACHE_SUFFIX = ".rcache"
+
+
+# Split a value into a JSON layout and its binary parts (Parquet or bytes)
+def _encode(value, parts):
+    if isinstance(value, pd.DataFrame):
+        buffer = BytesIO()
+        value.to_parquet(buffer, engine="pyarrow", compression="zstd")
+        parts.append(buffer.getvalue())
+        return {"frame": len(parts) - 1}
+    if isinstance(value, pd.Series):
+        layout = _encode(value.to_frame(name="value"), parts)
+        return {"series": layout["frame"], "name": value.name}
+    if isinstance(value, (bytes, bytearray)):
+        parts.append(bytes(value))
+        return {"bytes": len(parts) - 1}
+    if isinstance(value, (tuple, list)):
+        return {"tuple" if isinstance(value, tuple) else "list": [_encode(v, parts) for v in value]}
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {"dict": [[k, _encode(v, parts)] for k, v in value.items()]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    raise TypeError(f"{type(value).__name__} is not stored on disk")
+
+
+def _decode(layout, parts):
+    if "frame" in layout:
+        return pd.read_parquet(BytesIO(parts[layout["frame"]]), engine="pyarrow")
+    if "series" in layout:
+        return pd.read_parquet(BytesIO(parts[layout["series"]]), engine="pyarrow")["value"].rename(layout["name"])
+    if "bytes" in layout:
+        return parts[layout["bytes"]]
+    if "tuple" in layout:
+        return tuple(_decode(v, parts) for v in layout["tuple"])
+    if "list" in layout:
+        return [_decode(v, parts) for v in layout["list"]]
+    if "dict" in layout:
+        return {k: _decode(v, parts) for k, v in layout["dict"]}
+    return layout["value"]
+
+
+class DiskCache:
+
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024, max_age=7 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.skipped = 0
+        self.evictions = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        name = hashlib.sha1(repr((DISK_CACHE_FORMAT, key)).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + DISK_CACHE_SUFFIX)
+
+    def _files(self):
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(DISK_CACHE_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    # Returns (found, value)
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                blob = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except (OSError, ValueError):
+            self.errors += 1
+            self._remove(path)
+            return False, None
+        if header.get("key") != repr(key) or (self.max_age is not None and time.time() - header["created"] > self.max_age):
+            self.misses += 1
+            return False, None
+        try:
+            offsets = [0]
+            for size in header["parts"]:
+                offsets.append(offsets[-1] + size)
+            value = _decode(header["layout"], [blob[start:end] for start, end in zip(offsets, offsets[1:])])
+        except Exception:
+            self.errors += 1
+            self._remove(path)
+            return False, None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return True, value
+
+    def put(self, key, value, build_seconds=0.0):
+        parts = []
+        try:
+            layout = _encode(value, parts)
+        except Exception:
+            self.skipped += 1
+            return False
+        header = {"key": repr(key), "created": time.time(), "build_seconds": build_seconds,
+                  "layout": layout, "parts": [len(part) for part in parts]}
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                for part in parts:
+                    f.write(part)
+            os.replace(tmp_path, path)
+        except OSError:
+            self.errors += 1
+            self._remove(tmp_path)
+            return False
+        self.writes += 1
+        self._trim()
+        return True
+
+    # Delete least recently used files until the directory fits in max_bytes
+    def _trim(self):
+        with self._lock:
+            files = self._files()
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                if self._remove(path):
+                    self.evictions += 1
+                total -= size
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self):
+        for _, _, path in self._files():
+            self._remove(path)
+
+    def summary(self):
+        files = self._files()
+        lookups = self.hits + self.misses
+        return {
+            "directory": self.directory,
+            "files": len(files),
+            "bytes": sum(size for _, size, _ in files),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "skipped": self.skipped,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+# Bounded result cache shared by all sessions of the process.
+# Entries expire after `ttl` seconds and the least recently used ones are
+# evicted once `max_entries` or `max_bytes` is exceeded. Hits, misses, sizes,
+# build times and evictions are kept for the admin page and metrics export.
+# With a DiskCache `store`, a memory miss is looked up on disk before building
+# and every built value is written there, so results survive restarts.
+# Entries built with `dates` (the date ranges they read) are carried over to a
+# new data version when no changed row falls in those ranges.
+class ResultCache:
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, max_entries=512, ttl=3600, max_events=200, store=None):
+        self.store = store
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.carried = 0
+        self.build_seconds_total = 0.0
+        self.events = deque(maxlen=max_events)
+        self.flights = SingleFlight()
+        self._entries = OrderedDict()
+        self._carried_versions = set()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self.ttl is not None and time.time() - entry.created > self.ttl:
+                self._evict(key, "expired")
+                return default
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.hits += 1
+            return entry.value
+
+    def put(self, key, value, build_seconds=0.0, dates=None):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key, "replaced")
+            self._entries[key] = _Entry(value, size, build_seconds, dates)
+            self._bytes += size
+            self.build_seconds_total += build_seconds
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._evict(oldest, "lru")
+        return value
+
+    # Return the cached value for `key`, building (and timing) it on a miss.
+    # Concurrent misses for the same key are coalesced into one build.
+    # `dates` lists the (start, end) ranges the value is computed from, if any.
+    def get_or_build(self, key, builder, dates=None):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        def build():
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return entry.value
+                self.misses += 1
+            if self.store is not None:
+                found, stored = self.store.get(key)
+                if found:
+                    return self.put(key, stored, dates=dates)
+            started = time.perf_counter()
+            built = builder()
+            build_seconds = time.perf_counter() - started
+            if self.store is not None:
+                self.store.put(key, built, build_seconds)
+            return self.put(key, built, build_seconds, dates)
+
+        value, _ = self.flights.do(key, build)
+        return value
+
+    # Re-key the entries of `old_version` (keys start with the data version)
+    # whose date ranges contain none of the `changed_dates` to `new_version`.
+    # Runs once per pair of versions; returns the number of entries carried.
+    def carry_forward(self, old_version, new_version, changed_dates):
+        changed = pd.DatetimeIndex(changed_dates)
+        carried = 0
+        with self._lock:
+            if (old_version, new_version) in self._carried_versions:
+                return 0
+            self._carried_versions.add((old_version, new_version))
+            for key, entry in list(self._entries.items()):
+                if key[0] != old_version or entry.dates is None:
+                    continue
+                new_key = (new_version,) + key[1:]
+                touched = any(((changed >= pd.Timestamp(r[0])) & (changed <= pd.Timestamp(r[-1]))).any() for r in entry.dates)
+                if touched or new_key in self._entries:
+                    continue
+                self._entries[new_key] = _Entry(entry.value, entry.size, entry.build_seconds, entry.dates)
+                self._bytes += entry.size
+                carried += 1
+            self.carried += carried
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._evict(next(iter(self._entries)), "lru")
+        return carried
+
+    # Drop every entry whose key matches `predicate`
+    def invalidate(self, predicate, reason="invalidated"):
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._evict(key, reason)
+
+    def clear(self):
+        self.invalidate(lambda key: True, "cleared")
+        if self.store is not None:
+            self.store.clear()
+
+    def _evict(self, key, reason):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        if reason != "replaced":
+            self.evictions += 1
+        self.events.append({
+            "time": pd.Timestamp.now(),
+            "key": repr(key),
+            "reason": reason,
+            "size_bytes": entry.size,
+            "hits": entry.hits,
+        })
+
+    def summary(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "carried": self.carried,
+                "coalesced": self.flights.coalesced,
+                "in_flight": self.flights.in_flight(),
+                "build_seconds_total": self.build_seconds_total,
+            }
+
+    def entries(self):
+        now = time.time()
+        with self._lock:
+            rows = [{
+                "key": repr(key),
+                "size_bytes": entry.size,
+                "build_seconds": entry.build_seconds,
+                "hits": entry.hits,
+                "age_seconds": now - entry.created,
+            } for key, entry in self._entries.items()]
+        return pd.DataFrame(rows, columns=["key", "size_bytes", "build_seconds", "hits", "age_seconds"])
+
+    def eviction_log(self):
+        with self._lock:
+            return pd.DataFrame(list(self.events), columns=["time", "key", "reason", "size_bytes", "hits"])
+
+    # Prometheus text exposition format, for scraping or capacity planning
+    def metrics_text(self, prefix="result_cache"):
+        s = self.summary()
+        lines = []
+        for name, kind, value in [
+            ("hits_total", "counter", s["hits"]),
+            ("misses_total", "counter", s["misses"]),
+            ("evictions_total", "counter", s["evictions"]),
+            ("carried_total", "counter", s["carried"]),
+            ("coalesced_total", "counter", s["coalesced"]),
+            ("in_flight", "gauge", s["in_flight"]),
+            ("build_seconds_total", "counter", s["build_seconds_total"]),
+            ("entries", "gauge", s["entries"]),
+            ("bytes", "gauge", s["bytes"]),
+            ("max_bytes", "gauge", s["max_bytes"]),
+        ]:
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {value}")
+        if self.store is not None:
+            d = self.store.summary()
+            for name, kind in [("hits_total", "counter"), ("misses_total", "counter"), ("writes_total", "counter"),
+                               ("evictions_total", "counter"), ("errors_total", "counter"),
+                               ("files", "gauge"), ("bytes", "gauge"), ("max_bytes", "gauge")]:
+                lines.append(f"# TYPE {prefix}_disk_{name} {kind}")
+                lines.append(f"{prefix}_disk_{name} {d[name.removesuffix('_total')]}")
+        return "\n".join(lines) + "\n"
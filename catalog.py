@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+
+# ✅ Distinct executives, customers and types with their cross mappings.
+# Lists keep first-appearance order (like Series.unique()); the *_sorted
+# variants are alphabetical. Built once per data version, so selectboxes
+# and cascading filters never scan the ledger.
+@dataclass
+class DimensionCatalog:
+    executives: list
+    executives_sorted: list
+    customers: list
+    customers_sorted: list
+    types: list
+    exec_customers: dict
+    type_customers: dict
+    customer_execs: dict
+
+    def customers_for(self, executive):
+        return self.exec_customers.get(executive, [])
+
+    def customers_of_type(self, customer_type):
+        return self.type_customers.get(customer_type, [])
+
+    def executives_for(self, customer):
+        return self.customer_execs.get(customer, [])
+
+
+def _mapping(pairs, key, value):
+    return pairs[[key, value]].dropna().drop_duplicates().groupby(key, sort=False)[value].agg(list).to_dict()
+
+
+def build_dimension_catalog(df):
+    executives = df["sales_executive"].dropna().unique().tolist()
+    customers = df["customer_name"].dropna().unique().tolist()
+    pairs = df[["sales_executive", "customer_name", "customer_type"]]
+    return DimensionCatalog(
+        executives=executives,
+        executives_sorted=sorted(executives),
+        customers=customers,
+        customers_sorted=sorted(customers),
+        types=df["customer_type"].dropna().unique().tolist(),
+        exec_customers=_mapping(pairs, "sales_executive", "customer_name"),
+        type_customers=_mapping(pairs, "customer_type", "customer_name"),
+        customer_execs=_mapping(pairs, "customer_name", "sales_executive"),
+    )
@@ -0,0 +1,162 @@
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from cube import DIMENSIONS
+from schema import LEDGER_SCHEMA, MONEY_COLUMNS
+
+
+# ✅ Row-level changes between two versions of the ledger
+# Every row gets a content hash of its sheet columns (money rounded to the
+# paisa, so float noise from re-saving the sheet is not a change). Rows whose
+# hash (counting duplicates) is in both versions are unchanged; the rest are
+# deleted (old only) or inserted (new only). A deleted and an inserted row are paired as
+# one modified row when they share an identity (the same order and customer,
+# else the same date and customer, else the same date and executive) and
+# differ in at most MAX_CHANGED_COLUMNS columns, e.g. a fixed paid_amount or a
+# reassigned sales_executive.
+# The days and the executives / customers / types a change touches (before and
+# after the edit) are what the incremental rebuild and the cache invalidate.
+LEDGER_COLUMNS = list(LEDGER_SCHEMA)
+IDENTITY_KEYS = [["order_no", "customer_name"], ["date", "customer_name"], ["date", "sales_executive"]]
+MAX_CHANGED_COLUMNS = 3
+CHANGE_COLUMNS = ["change", "old_row", "new_row", "date", "sales_executive", "customer_name", "changed_columns"]
+FIELD_COLUMNS = ["change", "old_row", "new_row", "column", "before", "after"]
+
+
+@dataclass
+class LedgerChanges:
+    previous_version: str
+    version: str
+    rows: pd.DataFrame
+    fields: pd.DataFrame
+    dates: pd.DatetimeIndex
+    # Earliest changed day per executive / customer / type value
+    since: dict
+    stats: dict = field(default_factory=dict)
+    detected_at: pd.Timestamp = field(default_factory=pd.Timestamp.now)
+
+    @property
+    def empty(self):
+        return self.rows.empty
+
+    def counts(self):
+        return self.rows["change"].value_counts().reindex(["inserted", "deleted", "modified"], fill_value=0).to_dict()
+
+
+# Sheet columns as compared between versions
+def _comparable(df):
+    rows = df[LEDGER_COLUMNS].copy()
+    rows[MONEY_COLUMNS] = rows[MONEY_COLUMNS].round(2)
+    return rows
+
+
+def row_hashes(df):
+    return pd.util.hash_pandas_object(_comparable(df), index=False).to_numpy()
+
+
+# Positions of the rows whose (hash, occurrence) is not in the other version
+def _unmatched(hashes, other_hashes):
+    numbered = pd.DataFrame({"hash": hashes})
+    numbered["n"] = numbered.groupby("hash").cumcount()
+    other = pd.DataFrame({"hash": other_hashes})
+    other["n"] = other.groupby("hash").cumcount()
+    merged = numbered.merge(other.assign(found=True), on=["hash", "n"], how="left")
+    return np.flatnonzero(merged["found"].isna().to_numpy())
+
+
+# (differs, before, after) of paired rows: which sheet columns changed
+def _changed_columns(old_rows, new_rows):
+    before, after = _comparable(old_rows).reset_index(drop=True), _comparable(new_rows).reset_index(drop=True)
+    differs = pd.DataFrame({
+        col: (before[col].ne(after[col]) & ~(before[col].isna() & after[col].isna())).fillna(True)
+        for col in LEDGER_COLUMNS
+    }, index=before.index)
+    return differs, before, after
+
+
+# Pair deleted and inserted rows sharing `keys` (i-th with i-th, in sheet order)
+def _pair(old, new, deleted, inserted, keys):
+    left = old.loc[deleted, keys].dropna().reset_index(names="old_row")
+    right = new.loc[inserted, keys].dropna().reset_index(names="new_row")
+    if left.empty or right.empty:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    left["n"] = left.groupby(keys).cumcount()
+    right["n"] = right.groupby(keys).cumcount()
+    pairs = left.merge(right, on=keys + ["n"])
+    old_rows, new_rows = pairs["old_row"].to_numpy(dtype=np.int64), pairs["new_row"].to_numpy(dtype=np.int64)
+    close = _changed_columns(old.loc[old_rows], new.loc[new_rows])[0].sum(axis=1).to_numpy() <= MAX_CHANGED_COLUMNS
+    return old_rows[close], new_rows[close]
+
+
+def diff_ledgers(old, new, previous_version="", version=""):
+    deleted = old.index[_unmatched(row_hashes(old), row_hashes(new))]
+    inserted = new.index[_unmatched(row_hashes(new), row_hashes(old))]
+
+    old_rows, new_rows = [], []
+    for keys in IDENTITY_KEYS:
+        paired_old, paired_new = _pair(old, new, deleted, inserted, keys)
+        old_rows.append(paired_old)
+        new_rows.append(paired_new)
+        deleted = deleted.difference(paired_old)
+        inserted = inserted.difference(paired_new)
+    modified_old, modified_new = np.concatenate(old_rows), np.concatenate(new_rows)
+
+    differs, before, after = _changed_columns(old.loc[modified_old], new.loc[modified_new])
+    changed_columns = differs.apply(lambda row: ", ".join(row.index[row.to_numpy()]), axis=1) if len(differs) else pd.Series(dtype="string")
+
+    def frame(change, rows, source, old_row, new_row, columns):
+        return pd.DataFrame({
+            "change": change,
+            "old_row": pd.array(old_row, dtype="Int64"),
+            "new_row": pd.array(new_row, dtype="Int64"),
+            "date": source.loc[rows, "date"].to_numpy(),
+            "sales_executive": source.loc[rows, "sales_executive"].to_numpy(),
+            "customer_name": source.loc[rows, "customer_name"].to_numpy(),
+            "changed_columns": columns,
+        })
+
+    rows = pd.concat([
+        frame("inserted", inserted, new, [pd.NA] * len(inserted), inserted, ""),
+        frame("deleted", deleted, old, deleted, [pd.NA] * len(deleted), ""),
+        frame("modified", modified_new, new, modified_old, modified_new, changed_columns.to_numpy(dtype=object)),
+    ], ignore_index=True)
+    rows = rows.sort_values(["new_row", "old_row"], na_position="last", kind="mergesort").reset_index(drop=True)[CHANGE_COLUMNS]
+
+    # Field-level before / after of the modified rows
+    field_rows = []
+    for col in LEDGER_COLUMNS:
+        mask = differs[col].to_numpy() if len(differs) else np.zeros(0, dtype=bool)
+        if mask.any():
+            field_rows.append(pd.DataFrame({
+                "change": "modified",
+                "old_row": modified_old[mask],
+                "new_row": modified_new[mask],
+                "column": col,
+                "before": before.loc[mask, col].astype("string").to_numpy(),
+                "after": after.loc[mask, col].astype("string").to_numpy(),
+            }))
+    fields = pd.concat(field_rows, ignore_index=True).sort_values(["new_row", "column"], kind="mergesort").reset_index(drop=True) if field_rows else pd.DataFrame(columns=FIELD_COLUMNS)
+
+    # Rows as they were and as they are: both sides count as touched
+    touched = pd.concat([old.loc[deleted.union(pd.Index(modified_old))], new.loc[inserted.union(pd.Index(modified_new))]], ignore_index=True)
+    touched = touched[touched["date"].notna()]
+    since = {dim: touched.groupby(dim, observed=True)["date"].min() for dim in DIMENSIONS}
+    return LedgerChanges(
+        previous_version=previous_version,
+        version=version,
+        rows=rows,
+        fields=fields,
+        dates=pd.DatetimeIndex(np.sort(touched["date"].unique())),
+        since=since,
+    )
+
+
+def changes_workbook(changes):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        changes.rows.to_excel(writer, sheet_name="Rows", index=False)
+        changes.fields.to_excel(writer, sheet_name="Fields", index=False)
+    return output.getvalue()
@@ -0,0 +1,98 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+
+# ✅ Customer cohorts: first-purchase month x months since first purchase
+# Months are integer indexes and every (customer, month) with a purchase is one
+# entry of a sparse activity set, deduplicated with np.unique on an encoded
+# customer*months + month key. Active-customer and revenue matrices are then
+# single bincounts over cohort*months + age, so the cost grows with the number
+# of purchase rows, not with customers x months.
+RETENTION_MONTHS = (1, 3, 6, 12)
+
+
+def _month_index(dates):
+    return (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(dtype=np.int64)
+
+
+# Returns a dict of cohort x age frames (index: cohort month, columns: months
+# since first purchase): "customers" (active), "retention" (% of cohort size),
+# "revenue" (net sales) and "revenue_per_customer" (per cohort customer), plus
+# "sizes" (customers per cohort) and a "summary" with retention at fixed ages.
+def build_cohorts(df):
+    sales = df[df["customer_name"].notna() & df["date"].notna() & (df["sales_amount"] > 0)]
+    if sales.empty:
+        empty = pd.DataFrame()
+        return {"sizes": pd.Series(dtype="int64"), "customers": empty, "retention": empty,
+                "revenue": empty, "revenue_per_customer": empty, "summary": empty}
+
+    customer, customers = pd.factorize(sales["customer_name"])
+    month = _month_index(sales["date"])
+    # Returns can come in after the last purchase: the month axis covers every ledger row
+    ledger = df[df["customer_name"].isin(customers) & df["date"].notna()]
+    ledger_month = _month_index(ledger["date"])
+    first_month = month.min()
+    n_months = int(max(month.max(), ledger_month.max()) - first_month + 1)
+    month, ledger_month = month - first_month, ledger_month - first_month
+
+    # First purchase month per customer = its cohort
+    cohort_of = np.full(len(customers), n_months, dtype=np.int64)
+    np.minimum.at(cohort_of, customer, month)
+
+    # Sparse activity: unique (customer, month) pairs
+    active = np.unique(customer * n_months + month)
+    active_cohort = cohort_of[active // n_months]
+    active_age = active % n_months - active_cohort
+    cells = n_months * n_months
+    counts = np.bincount(active_cohort * n_months + active_age, minlength=cells).reshape(n_months, n_months)
+
+    # Revenue: net sales (sales - returns) of every cohort customer row from its first purchase on
+    ledger_cohort = cohort_of[customers.get_indexer(ledger["customer_name"])]
+    ledger_age = ledger_month - ledger_cohort
+    net_sales = (ledger["sales_amount"] - ledger["sales_return"]).to_numpy(dtype=np.float64)
+    after_first = ledger_age >= 0
+    revenue = np.bincount(
+        ledger_cohort[after_first] * n_months + ledger_age[after_first], weights=net_sales[after_first], minlength=cells
+    ).reshape(n_months, n_months)
+
+    labels = pd.period_range(pd.Period(year=first_month // 12, month=first_month % 12 + 1, freq="M"), periods=n_months, freq="M").astype(str)
+    sizes = pd.Series(np.bincount(cohort_of, minlength=n_months)[:n_months], index=labels, name="customers")
+    # Ages a cohort has not reached yet are left empty (not 0)
+    reached = np.arange(n_months)[None, :] < (n_months - np.arange(n_months))[:, None]
+
+    def frame(values):
+        values = np.where(reached, values, np.nan)
+        result = pd.DataFrame(values, index=labels, columns=range(n_months))
+        result.index.name, result.columns.name = "cohort", "months_since_first"
+        return result[sizes.to_numpy() > 0]
+
+    customers_matrix = frame(counts.astype(np.float64))
+    kept_sizes = sizes[sizes > 0]
+    retention = customers_matrix.div(kept_sizes, axis=0) * 100
+    revenue_matrix = frame(revenue)
+
+    summary = pd.DataFrame({"cohort_customers": kept_sizes})
+    for months in RETENTION_MONTHS:
+        summary[f"retention_{months}m_%"] = retention[months] if months < n_months else np.nan
+    summary["revenue_total"] = revenue_matrix.sum(axis=1)
+    summary = summary.rename_axis("cohort").reset_index()
+
+    return {
+        "sizes": kept_sizes,
+        "customers": customers_matrix,
+        "retention": retention,
+        "revenue": revenue_matrix,
+        "revenue_per_customer": revenue_matrix.div(kept_sizes, axis=0),
+        "summary": summary,
+    }
+
+
+def cohorts_workbook(cohorts):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        cohorts["summary"].to_excel(writer, sheet_name="Summary", index=False)
+        for name in ("customers", "retention", "revenue", "revenue_per_customer"):
+            cohorts[name].to_excel(writer, sheet_name=name[:31])
+    return output.getvalue()
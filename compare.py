@@ -0,0 +1,61 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from cube import MEASURES
+
+
+# ✅ Period-over-period comparison (MoM / YoY / custom)
+# Both periods are summed in one grouped pass over the daily cube; the result
+# is aligned per key with A, B, delta and % change for every measure.
+COMPARE_DIMENSIONS = ["sales_executive", "customer_name", "customer_type"]
+COMPARE_MEASURES = [m for m in MEASURES if m != "openning_balance"]
+
+
+def _slice(cube, period, label):
+    start, end = pd.to_datetime(period[0]), pd.to_datetime(period[1])
+    part = cube[(cube["date"] >= start) & (cube["date"] <= end)]
+    return part.assign(period=label)
+
+
+# Previous month (MoM) or same range one year earlier (YoY) for a period
+def previous_period(period, mode="MoM"):
+    start, end = pd.to_datetime(period[0]), pd.to_datetime(period[1])
+    offset = pd.DateOffset(months=1) if mode == "MoM" else pd.DateOffset(years=1)
+    return (start - offset).date(), (end - offset).date()
+
+
+def compare_periods(cube, period_a, period_b, by="sales_executive", measures=COMPARE_MEASURES):
+    both = pd.concat([_slice(cube, period_a, "a"), _slice(cube, period_b, "b")], ignore_index=True)
+    sums = both.groupby([by, "period"], observed=True)[measures].sum().unstack("period", fill_value=0.0)
+    sums = sums.reindex(columns=pd.MultiIndex.from_product([measures, ["a", "b"]]), fill_value=0.0)
+
+    a = sums.xs("a", axis=1, level=1)
+    b = sums.xs("b", axis=1, level=1)
+    delta = b - a
+    pct = (delta / a.abs().where(a != 0)) * 100
+
+    parts = {"a": a, "b": b, "delta": delta, "pct": pct.replace([np.inf, -np.inf], np.nan)}
+    result = pd.concat(parts, axis=1).swaplevel(axis=1)
+    result = result.reindex(columns=pd.MultiIndex.from_product([measures, list(parts)]))
+    result.columns = [f"{measure}_{part}" for measure, part in result.columns]
+    return result.reset_index()
+
+
+# Comparisons for every dimension at once (used by the page and the workbook)
+def compare_all(cube, period_a, period_b, dimensions=COMPARE_DIMENSIONS):
+    return {by: compare_periods(cube, period_a, period_b, by) for by in dimensions}
+
+
+def comparison_workbook(results, period_a, period_b):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        pd.DataFrame({
+            "period": ["A", "B"],
+            "start": [period_a[0], period_b[0]],
+            "end": [period_a[1], period_b[1]],
+        }).to_excel(writer, sheet_name="Periods", index=False)
+        for by, frame in results.items():
+            frame.to_excel(writer, sheet_name=by[:31], index=False)
+    return output.getvalue()
@@ -0,0 +1,39 @@
+import pandas as pd
+
+
+# ✅ Measures summed in every aggregate, and the keys they are summed by
+MEASURES = [
+    "openning_balance",
+    "sales_amount",
+    "sales_return",
+    "paid_amount",
+    "customer_cashback",
+    "executive_commission",
+    "teamleader_commission",
+    "gm_commission",
+    "customer_outstanding",
+]
+DIMENSIONS = ["sales_executive", "customer_name", "customer_type"]
+
+
+# Daily cube: one row per (date, executive, customer, type) with summed measures.
+# Rows without a date are left out, they cannot be placed in any period.
+def build_daily_cube(df):
+    dated = df[df["date"].notna()]
+    cube = dated.groupby(["date"] + DIMENSIONS, dropna=False, observed=True)[MEASURES].sum().reset_index()
+    cube["month"] = cube["date"].dt.to_period("M").astype("string")
+    return cube
+
+
+# Monthly aggregate of any cube / ledger slice, by month and the given keys
+def monthly_cube(frame, keys=DIMENSIONS):
+    return frame.groupby(["month"] + list(keys), dropna=False, observed=True)[MEASURES].sum().reset_index()
+
+
+# Daily cube with only the cells of the changed `dates` regrouped from the
+# ledger; every other day is kept from the previous cube (see changes.py)
+def update_daily_cube(previous, df, dates):
+    fresh = build_daily_cube(df[df["date"].isin(dates)])
+    kept = previous[~previous["date"].isin(dates)]
+    cube = pd.concat([kept, fresh], ignore_index=True)
+    return cube.sort_values(["date"] + DIMENSIONS, kind="mergesort", na_position="last").reset_index(drop=True)
@@ -0,0 +1,54 @@
+import os
+
+import pandas as pd
+
+
+# ✅ Sales hierarchy: Executive -> Team Leader -> GM
+# Read from sales_hierarchy.csv next to the workbook (columns: sales_executive,
+# team_leader, gm); editing it reloads the dataset like the workbook itself.
+# Executives missing from the file are rolled up under "Unassigned".
+HIERARCHY_FILE = "sales_hierarchy.csv"
+UNASSIGNED = "Unassigned"
+LEVELS = ["gm", "team_leader", "sales_executive"]
+
+ROLLUP_MEASURES = [
+    "sales_amount",
+    "sales_return",
+    "paid_amount",
+    "customer_cashback",
+    "customer_outstanding",
+    "executive_commission",
+    "teamleader_commission",
+    "gm_commission",
+]
+
+
+def load_hierarchy(executives, path=HIERARCHY_FILE):
+    if os.path.exists(path):
+        mapping = pd.read_csv(path, dtype="string")
+        mapping.columns = [c.strip().lower().replace(" ", "_") for c in mapping.columns]
+        mapping = mapping[["sales_executive", "team_leader", "gm"]].dropna(subset=["sales_executive"])
+        mapping = mapping.drop_duplicates("sales_executive", keep="last")
+    else:
+        mapping = pd.DataFrame(columns=["sales_executive", "team_leader", "gm"], dtype="string")
+
+    known = pd.DataFrame({"sales_executive": pd.Series(executives, dtype="string")})
+    mapping = known.merge(mapping, on="sales_executive", how="left")
+    return mapping.fillna({"team_leader": UNASSIGNED, "gm": UNASSIGNED})
+
+
+# Sales, deposits, dues and every commission tier at each hierarchy level.
+# The daily cube is scanned once (executive totals for the range); the team
+# leader and GM levels are summed from those few rows, so drilling down never
+# goes back to the raw ledger. Returns {"sales_executive": ..., "team_leader": ..., "gm": ...}.
+def rollup(cube, hierarchy, date_range=None):
+    if date_range is not None:
+        start, end = pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1])
+        cube = cube[(cube["date"] >= start) & (cube["date"] <= end)]
+
+    by_exec = cube.groupby("sales_executive", observed=True)[ROLLUP_MEASURES].sum().reset_index()
+    by_exec = hierarchy.merge(by_exec, on="sales_executive", how="inner")[LEVELS + ROLLUP_MEASURES]
+
+    by_leader = by_exec.groupby(["gm", "team_leader"], as_index=False)[ROLLUP_MEASURES].sum()
+    by_gm = by_leader.groupby("gm", as_index=False)[ROLLUP_MEASURES].sum()
+    return {"sales_executive": by_exec, "team_leader": by_leader, "gm": by_gm}
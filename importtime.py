@@ -0,0 +1,59 @@
+import argparse
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from views import PAGES
+
+
+# ✅ Cold import times: the app shell and every page module
+# Each measurement runs in a fresh interpreter. "shell" is what every process
+# start pays (main.py's imports); a page's time is what its first visit adds
+# on top of the shell (its own module plus libraries like plotly or PIL).
+#
+# Usage:
+#   python importtime.py --repeat 3 --csv import_times.csv
+
+SHELL_IMPORTS = "import streamlit, pandas, cache, refresher, views"
+
+
+def _measure(preload, target, repeat):
+    code = (
+        f"import time\n{preload}\n"
+        f"started = time.perf_counter()\n{target}\n"
+        f"print(time.perf_counter() - started)"
+    )
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        runs.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(runs)
+
+
+def import_times(repeat=3):
+    rows = [{"target": "shell", "import_ms": _measure("", SHELL_IMPORTS, repeat) * 1000}]
+    for library in ("plotly.express", "PIL.Image"):
+        rows.append({"target": library, "import_ms": _measure(SHELL_IMPORTS, f"import {library}", repeat) * 1000})
+    for label, module in PAGES.items():
+        ms = _measure(SHELL_IMPORTS, f"import views.{module}", repeat) * 1000
+        rows.append({"target": f"{label} (views.{module})", "import_ms": ms})
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import times of the app shell and each page")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement (best is kept)")
+    parser.add_argument("--csv", default=None, help="also write the results to this CSV file")
+    args = parser.parse_args(argv)
+
+    results = import_times(args.repeat)
+    print(results.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+
+
+if __name__ == "__main__":
+    main()
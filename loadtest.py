@@ -0,0 +1,165 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pandas as pd
+
+
+# ✅ Concurrent-session load test for main.py
+# Drives N simulated sessions (Streamlit AppTest, in-process) through a
+# realistic page/widget sequence and reports throughput, rerun latency and
+# peak RSS for each session count.
+#
+# Usage:
+#   python loadtest.py --sessions 1 2 4 8 --rounds 3
+#   python loadtest.py --sessions 4 --csv loadtest_results.csv
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def _current_rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _RssSampler:
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = _current_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _current_rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss_bytes())
+
+
+def _select_page(at, page):
+    at.sidebar.radio[0].set_value(page)
+
+
+def _narrow_dates(key, days):
+    def step(at):
+        widget = at.date_input(key=key)
+        start, end = widget.value
+        widget.set_value((max(start, end - timedelta(days=days)), end))
+    return step
+
+
+# Home -> Exec Txns with date changes -> Daily Recap (+ its downloads) -> Commissions
+SCENARIO = [
+    ("home", None),
+    ("exec_txns", lambda at: _select_page(at, "🧑‍💼 Exec Txns")),
+    ("exec_txns_last_30d", _narrow_dates("exec_date", 30)),
+    ("exec_txns_last_7d", _narrow_dates("exec_date", 7)),
+    ("daily_recap", lambda at: _select_page(at, "📆 Daily Recap")),
+    ("daily_recap_last_30d", _narrow_dates("daily_sales", 30)),
+    ("commissions", lambda at: _select_page(at, "💸 Commissions")),
+]
+
+
+# A real server compiles the script once and shares the bytecode between
+# sessions; AppTest compiles per session, which is also not thread-safe on
+# some CPython versions. Share one ScriptCache, as the server does.
+def _share_script_cache():
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import local_script_runner
+
+    shared = ScriptCache()
+    local_script_runner.ScriptCache = lambda: shared
+
+
+def run_session(rounds, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    timings = []
+    errors = 0
+    for _ in range(rounds):
+        at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+        for name, action in SCENARIO:
+            if action is not None:
+                action(at)
+            started = time.perf_counter()
+            at.run()
+            timings.append((name, time.perf_counter() - started))
+            if at.exception:
+                errors += 1
+    return timings, errors
+
+
+def run_level(sessions, rounds, timeout):
+    baseline_rss = _current_rss_bytes()
+    with _RssSampler() as rss, ThreadPoolExecutor(max_workers=sessions) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(lambda _: run_session(rounds, timeout), range(sessions)))
+        elapsed = time.perf_counter() - started
+
+    latencies = pd.Series([seconds for timings, _ in results for _, seconds in timings])
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(errors for _, errors in results),
+        "elapsed_s": elapsed,
+        "throughput_reruns_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": latencies.quantile(0.50) * 1000,
+        "p95_ms": latencies.quantile(0.95) * 1000,
+        "max_ms": latencies.max() * 1000,
+        "peak_rss_mb": rss.peak / 1024 / 1024,
+        "rss_growth_per_session_mb": max(rss.peak - baseline_rss, 0) / sessions / 1024 / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the dashboard")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="session counts to test")
+    parser.add_argument("--rounds", type=int, default=2, help="scenario repetitions per session")
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    args = parser.parse_args(argv)
+
+    # main.py opens sale_data.xlsx relative to its own folder
+    os.chdir(os.path.dirname(APP_FILE))
+    _share_script_cache()
+
+    # Warm-up run so the first level does not pay for the initial data load
+    run_session(1, args.timeout)
+
+    rows = []
+    for sessions in args.sessions:
+        row = run_level(sessions, args.rounds, args.timeout)
+        rows.append(row)
+        print(
+            f"{sessions:>3} sessions | {row['throughput_reruns_per_s']:7.2f} reruns/s | "
+            f"p95 {row['p95_ms']:8.1f} ms | peak RSS {row['peak_rss_mb']:8.1f} MB | errors {row['errors']}",
+            flush=True,
+        )
+
+    results = pd.DataFrame(rows)
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import os
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from schema import SchemaError
+
+
+# ✅ Product catalog and product-level sales
+# products.csv is the price list: one row per SKU with its group, lid variant,
+# size and numeric regular / premium prices (empty = tier not offered).
+# Line items are optional: sale_items.xlsx next to sale_data.xlsx, one row per
+# product sold (date, order_no, sku, quantity, optional tier / unit_price /
+# sales_executive / customer_name). Executive and customer are taken from the
+# ledger by order_no when the sheet does not have them.
+# Product data is optional for the ledger pages: a missing, unreadable or
+# invalid file is reported (see load_products), never a failed reload.
+PRODUCT_CATALOG_FILE = "products.csv"
+LINE_ITEMS_FILE = "sale_items.xlsx"
+# Price list shipped with the app, used when the workbook's folder has none
+BUNDLED_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), PRODUCT_CATALOG_FILE)
+CATALOG_COLUMNS = ["sku", "group", "item_name", "size", "size_cm", "lid", "regular_price", "premium_price", "remarks"]
+
+PRODUCT_GROUPS = ["WITHOUT LID", "WITH LID", "OTHERS", "LID"]
+PRICE_TIERS = ["regular", "premium"]
+LINE_ITEM_REQUIRED = ["date", "sku", "quantity"]
+PRODUCT_MEASURES = ["quantity", "amount"]
+
+
+def load_product_catalog(path=PRODUCT_CATALOG_FILE):
+    catalog = pd.read_csv(path, dtype={"sku": "string", "item_name": "string", "size": "string", "remarks": "string"})
+    missing = [col for col in CATALOG_COLUMNS if col not in catalog.columns]
+    if missing:
+        raise SchemaError(f"Missing column(s) in {PRODUCT_CATALOG_FILE}: {', '.join(missing)}")
+    catalog["group"] = pd.Categorical(catalog["group"], categories=PRODUCT_GROUPS)
+    catalog["lid"] = catalog["lid"].astype(bool)
+    catalog["size_cm"] = pd.to_numeric(catalog["size_cm"], errors="coerce")
+    for tier in PRICE_TIERS:
+        catalog[f"{tier}_price"] = pd.to_numeric(catalog[f"{tier}_price"], errors="coerce").astype("float64")
+    if catalog["sku"].duplicated().any():
+        raise SchemaError(f"Duplicate SKU(s) in {path}: {', '.join(catalog.loc[catalog['sku'].duplicated(), 'sku'])}")
+    return catalog.set_index("sku", drop=False).rename_axis(None)
+
+
+# Catalog rows as the Products page shows them (one table per group)
+def price_table(catalog, group):
+    rows = catalog[catalog["group"] == group]
+    return pd.DataFrame({
+        "Item Name": rows["item_name"],
+        "Size": rows["size"],
+        "Regular Price": rows["regular_price"],
+        "Premium Price": rows["premium_price"],
+        "Remarks": rows["remarks"].fillna(""),
+    }).reset_index(drop=True)
+
+
+# Validate and price the line-item sheet. Returns (items, issues) like
+# schema.prepare_ledger: issues are rows with an unknown SKU, a bad date /
+# quantity, or a tier with no price for the product.
+def prepare_line_items(raw, catalog, ledger):
+    items = raw.rename(columns=lambda c: str(c).strip().lower().replace(" ", "_"))
+    missing = [col for col in LINE_ITEM_REQUIRED if col not in items.columns]
+    if missing:
+        raise SchemaError(f"Missing required column(s) in {LINE_ITEMS_FILE}: {', '.join(missing)}")
+    for col in ("order_no", "tier", "unit_price", "sales_executive", "customer_name"):
+        if col not in items.columns:
+            items[col] = pd.NA
+
+    items["date"] = pd.to_datetime(items["date"], errors="coerce")
+    items["quantity"] = pd.to_numeric(items["quantity"], errors="coerce")
+    items["sku"] = items["sku"].astype("string").str.strip().str.upper()
+    items["tier"] = items["tier"].astype("string").str.strip().str.lower().fillna("regular")
+    for col in ("order_no", "sales_executive", "customer_name"):
+        items[col] = items[col].astype("string").str.strip()
+
+    # Executive / customer from the ledger order when the sheet leaves them out
+    orders = ledger[ledger["order_no"].notna()].drop_duplicates("order_no").set_index("order_no")
+    for col in ("sales_executive", "customer_name"):
+        items[col] = items[col].fillna(items["order_no"].map(orders[col]))
+
+    # Unit price: the sheet's own, else the catalog price of the tier
+    known = items["sku"].isin(catalog.index)
+    list_price = np.where(
+        items["tier"].eq("premium").fillna(False).to_numpy(),
+        items["sku"].map(catalog["premium_price"]).to_numpy(dtype="float64", na_value=np.nan),
+        items["sku"].map(catalog["regular_price"]).to_numpy(dtype="float64", na_value=np.nan),
+    )
+    items["unit_price"] = pd.to_numeric(items["unit_price"], errors="coerce").fillna(pd.Series(list_price, index=items.index))
+    items["amount"] = items["quantity"] * items["unit_price"]
+
+    checks = [
+        (items["date"].isna(), "date", "not a valid date"),
+        (items["quantity"].isna(), "quantity", "not a valid quantity"),
+        (~known, "sku", "not in products.csv"),
+        (known & ~items["tier"].isin(PRICE_TIERS), "tier", "tier must be regular or premium"),
+        (known & items["unit_price"].isna(), "unit_price", "no price for this tier"),
+    ]
+    problems = [
+        pd.DataFrame({"excel_row": items.index[mask] + 2, "column": column, "problem": problem,
+                      "value": raw.loc[mask, column].astype(str).values if column in raw.columns else ""})
+        for mask, column, problem in checks if mask.any()
+    ]
+    bad = np.logical_or.reduce([mask.to_numpy() for mask, _, _ in checks])
+    issues = pd.concat(problems, ignore_index=True) if problems else pd.DataFrame(columns=["excel_row", "column", "problem", "value"])
+
+    items = items[~bad].reset_index(drop=True)
+    items = items.join(catalog[["item_name", "group", "lid", "size"]], on="sku")
+    items["month"] = items["date"].dt.to_period("M").astype("string")
+    for col in ("sku", "tier", "sales_executive", "customer_name"):
+        items[col] = items[col].astype("category")
+    return items, issues
+
+
+# Line items next to the workbook (None when there is no line-item sheet)
+def load_line_items(workbook_path, catalog, ledger):
+    path = os.path.join(os.path.dirname(os.path.abspath(workbook_path)), LINE_ITEMS_FILE)
+    if not os.path.exists(path):
+        return None, None
+    return prepare_line_items(pd.read_excel(path), catalog, ledger)
+
+
+# Catalog, line items, line-item issues and file problems for a workbook.
+# The catalog is products.csv next to the workbook, else the bundled one, else
+# empty; a line-item sheet that cannot be used is left out. Problems come back
+# as a table (file, problem) instead of being raised.
+def load_products(workbook_path, ledger):
+    local = os.path.join(os.path.dirname(os.path.abspath(workbook_path)), PRODUCT_CATALOG_FILE)
+    problems, catalog = [], None
+    for path in dict.fromkeys([local, BUNDLED_CATALOG]):
+        if not os.path.exists(path):
+            continue
+        try:
+            catalog = load_product_catalog(path)
+            break
+        except Exception as e:
+            problems.append((path, f"not used ({e})"))
+    if catalog is None:
+        catalog = load_product_catalog(StringIO(",".join(CATALOG_COLUMNS)))
+        problems.append((local, "no usable product catalog, prices are not available"))
+    elif not os.path.exists(local):
+        problems.append((local, f"not found, using {path}"))
+
+    try:
+        line_items, line_item_issues = load_line_items(workbook_path, catalog, ledger)
+    except Exception as e:
+        line_items, line_item_issues = None, None
+        problems.append((os.path.join(os.path.dirname(local), LINE_ITEMS_FILE), f"not used ({e})"))
+    return catalog, line_items, line_item_issues, pd.DataFrame(problems, columns=["file", "problem"])
+
+
+# Product x executive x month cube (plus tier), summed quantity and amount.
+# item_name and group follow from the SKU and are kept for product-level mixes.
+def build_product_cube(items):
+    keys = ["month", "sku", "item_name", "group", "sales_executive", "tier"]
+    cube = items.groupby(keys, observed=True, dropna=False)[PRODUCT_MEASURES].sum().reset_index()
+    return cube[cube["quantity"] != 0].reset_index(drop=True)
+
+
+# Share of each product in the amount sold, per month (or any key)
+def product_mix(cube, by="month", level="sku"):
+    totals = cube.groupby([by, level], observed=True)[PRODUCT_MEASURES].sum().reset_index()
+    totals["share_%"] = totals["amount"] / totals.groupby(by, observed=True)["amount"].transform("sum") * 100
+    return totals
+
+
+# Regular vs premium share of the amount sold, per executive (or any key)
+def tier_mix(cube, by="sales_executive"):
+    tiers = cube.pivot_table(index=by, columns="tier", values="amount", aggfunc="sum", observed=True, fill_value=0.0)
+    tiers = tiers.reindex(columns=PRICE_TIERS, fill_value=0.0)
+    tiers.columns = [f"{tier}_amount" for tier in PRICE_TIERS]
+    total = tiers.sum(axis=1)
+    tiers["premium_share_%"] = tiers["premium_amount"] / total.where(total != 0) * 100
+    return tiers.reset_index()
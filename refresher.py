@@ -0,0 +1,222 @@
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from aging import build_aging
+from anomalies import build_anomalies
+from bitmaps import ActivityIndex
+from catalog import DimensionCatalog, build_dimension_catalog
+from changes import LedgerChanges, diff_ledgers
+from cube import build_daily_cube, update_daily_cube
+from forecast import build_forecast
+from hierarchy import HIERARCHY_FILE, load_hierarchy
+from products import LINE_ITEMS_FILE, PRODUCT_CATALOG_FILE, build_product_cube, load_products
+from rolling import ROLLING_KEYS, build_rolling
+from schema import prepare_ledger
+from search import NAME_ALIASES_FILE, build_name_indexes
+from snapshots import month_snapshots
+
+
+# ✅ Everything the pages read, built together from one version of the workbook
+@dataclass
+class Dataset:
+    df: pd.DataFrame
+    issues: pd.DataFrame
+    snapshots: pd.DataFrame
+    cube: pd.DataFrame
+    catalog: DimensionCatalog
+    # Search over customer / executive names: {"customer_name": NameIndex, "sales_executive": NameIndex}
+    names: dict
+    hierarchy: pd.DataFrame
+    rolling: dict
+    forecast_model: pd.DataFrame
+    forecast: pd.DataFrame
+    anomalies: pd.DataFrame
+    aging: dict
+    activity: ActivityIndex
+    products: pd.DataFrame
+    line_items: pd.DataFrame
+    line_item_issues: pd.DataFrame
+    # Product files that could not be used (file, problem); the ledger still loads
+    product_issues: pd.DataFrame
+    product_cube: pd.DataFrame
+    # Row-level changes from the previous version (None on the first build)
+    changes: LedgerChanges
+    version: str
+    modified_at: pd.Timestamp
+    built_at: pd.Timestamp = field(default_factory=pd.Timestamp.now)
+
+
+# Files next to the workbook that are part of the dataset, by file name
+# (optional ones may be absent)
+def _companion_files(path):
+    folder = os.path.dirname(os.path.abspath(path))
+    return {name: os.path.join(folder, name) for name in (PRODUCT_CATALOG_FILE, LINE_ITEMS_FILE, NAME_ALIASES_FILE, HIERARCHY_FILE)}
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    companions = [(name, os.stat(p).st_mtime_ns, os.stat(p).st_size) for name, p in _companion_files(path).items() if os.path.exists(p)]
+    return stat.st_mtime_ns, stat.st_size, tuple(companions)
+
+
+def data_version(df):
+    return format(int(pd.util.hash_pandas_object(df, index=False).sum()) & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+# Version of the whole dataset: the ledger plus the contents of the files next
+# to it (products, line items, name aliases, hierarchy), so results cached
+# under it, in memory and on disk, change when any of them does
+def dataset_version(df, companions):
+    digest = hashlib.sha1(data_version(df).encode())
+    for name, p in sorted(companions.items()):
+        if os.path.exists(p):
+            with open(p, "rb") as f:
+                digest.update(name.encode() + b"\0" + hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+# Build every derived structure for one version of the workbook.
+# With a SQLite `store`, the ledger is also imported there (one transaction)
+# once everything else is built.
+# With the `previous` dataset, the ledgers are diffed row by row and only the
+# cube days, rolling keys and anomaly days the changed rows touch are redone.
+def build_dataset(path, store=None, previous=None):
+    modified_at = pd.Timestamp.fromtimestamp(os.path.getmtime(path))
+    df, issues = prepare_ledger(pd.read_excel(path))
+    companions = _companion_files(path)
+    version = dataset_version(df, companions)
+    catalog = build_dimension_catalog(df)
+
+    if previous is None:
+        changes = None
+        cube = build_daily_cube(df)
+        rolling = build_rolling(cube)
+        anomalies = build_anomalies(cube)
+    else:
+        changes = diff_ledgers(previous.df, df, previous.version, version)
+        since = changes.dates.min() if len(changes.dates) else None
+        cube = update_daily_cube(previous.cube, df, changes.dates)
+        rolling = previous.rolling if since is None else build_rolling(cube, previous.rolling, changes.since)
+        anomalies = build_anomalies(cube, previous.anomalies, since)
+        changes.stats = {
+            "cube_days_rebuilt": len(changes.dates),
+            "cube_days": cube["date"].nunique(),
+            **{f"rolling_{key}_redone": len(changes.since[key]) for key in ROLLING_KEYS},
+        }
+    # The forecast model is refitted only when closed months change
+    forecast_model, forecast = build_forecast(cube, previous.forecast_model if previous is not None else None)
+    products, line_items, line_item_issues, product_issues = load_products(path, df)
+    dataset = Dataset(
+        df=df,
+        issues=issues,
+        snapshots=month_snapshots(df),
+        cube=cube,
+        catalog=catalog,
+        names=build_name_indexes(df, companions[NAME_ALIASES_FILE]),
+        hierarchy=load_hierarchy(catalog.executives, companions[HIERARCHY_FILE]),
+        rolling=rolling,
+        forecast_model=forecast_model,
+        forecast=forecast,
+        anomalies=anomalies,
+        aging=build_aging(df),
+        activity=ActivityIndex(df),
+        products=products,
+        line_items=line_items,
+        line_item_issues=line_item_issues,
+        product_issues=product_issues,
+        product_cube=build_product_cube(line_items) if line_items is not None else None,
+        changes=changes,
+        version=version,
+        modified_at=modified_at,
+    )
+    # The store switches to this version only once the dataset is complete, so
+    # a failed build leaves it on the rows the served dataset was built from
+    if store is not None:
+        store.replace(df, version)
+    return dataset
+
+
+# Watches the workbook from a daemon thread and rebuilds the dataset off the
+# request path. Readers always get the last complete Dataset; a new one is
+# swapped in with a single reference assignment once it is fully built.
+# The row-level changes of the latest reloads are kept for the audit page.
+# `warmup(dataset)` runs on every new dataset before it is served (and before
+# the first one is), e.g. to precompute the most used page results.
+class DataRefresher:
+
+    def __init__(self, path, interval=5.0, builder=build_dataset, max_changes=20, warmup=None):
+        self.path = path
+        self.interval = interval
+        self.builder = builder
+        self.warmup = warmup
+        self.last_warmup = None
+        self.last_error = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_build_seconds = None
+        self.change_log = deque(maxlen=max_changes)
+        self._dataset = None
+        self._signature = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="data-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    # Rebuild now if the file changed since the last successful build
+    def refresh(self):
+        with self._lock:
+            try:
+                signature = _file_signature(self.path)
+                if signature == self._signature:
+                    return False
+                started = time.perf_counter()
+                dataset = self.builder(self.path, previous=self._dataset)
+            except Exception as e:
+                # Keep serving the previous data (the file may be mid-save)
+                self.last_error = e
+                self.failures += 1
+                return False
+            self.last_build_seconds = time.perf_counter() - started
+            if self.warmup is not None:
+                # A failed warm-up only means a slower first visit
+                try:
+                    self.last_warmup = self.warmup(dataset)
+                except Exception as e:
+                    self.last_warmup = {"version": dataset.version, "results": [], "errors": [str(e)],
+                                        "seconds": 0.0, "finished_at": pd.Timestamp.now()}
+            self.reloads += 1
+            if dataset.changes is not None and not dataset.changes.empty:
+                self.change_log.append(dataset.changes)
+            self._dataset = dataset
+            self._signature = signature
+            self.last_error = None
+            return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._ready.set()
+            self._stop.wait(self.interval)
+
+    # Latest dataset; waits for the first build only
+    def current(self, timeout=None):
+        if self._dataset is None:
+            self._ready.wait(timeout)
+        if self._dataset is None:
+            raise self.last_error or TimeoutError("Data is still loading")
+        return self._dataset
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+
+# ✅ Rolling 7/30/90-day sales, deposits and collection ratio per executive / customer
+# Each window sum is a difference of prefix sums: rows are sorted by (key, date)
+# and the window start is found with one searchsorted over an encoded
+# key*span + day position, so all keys and windows are computed in a few
+# NumPy passes with no per-group Python loop.
+WINDOWS = (7, 30, 90)
+ROLLING_KEYS = ("sales_executive", "customer_name")
+
+
+def rolling_metrics(cube, key, windows=WINDOWS):
+    daily = cube.groupby([key, "date"], observed=True)[["sales_amount", "paid_amount"]].sum().reset_index()
+    if daily.empty:
+        return daily
+
+    codes = pd.factorize(daily[key])[0].astype(np.int64)
+    days = (daily["date"] - daily["date"].min()).dt.days.to_numpy(dtype=np.int64)
+    span = int(days.max()) + max(windows) + 1
+    position = codes * span + days
+
+    for measure, label in (("sales_amount", "sales"), ("paid_amount", "deposits")):
+        prefix = np.concatenate([[0.0], np.cumsum(daily[measure].to_numpy(dtype=np.float64))])
+        end = np.arange(1, len(daily) + 1)
+        for window in windows:
+            start = np.searchsorted(position, position - window + 1, side="left")
+            daily[f"{label}_{window}d"] = prefix[end] - prefix[start]
+
+    for window in windows:
+        sales = daily[f"sales_{window}d"]
+        daily[f"collection_ratio_{window}d"] = daily[f"deposits_{window}d"] / sales.where(sales != 0)
+    return daily
+
+
+# First day to redo for each row of `frame`: one day for every key value, or
+# per value from a Series (value -> day; values not in it are not redone)
+def _since(frame, key, since):
+    if isinstance(since, pd.Series):
+        return pd.to_datetime(frame[key].map(since))
+    return pd.Timestamp(since)
+
+
+# Recompute only the days from `since` onwards (plus the look-back they need)
+# and keep the earlier rows of the previous result.
+def update_rolling(previous, cube, key, since, windows=WINDOWS):
+    lookback = _since(cube, key, since) - pd.Timedelta(days=max(windows) - 1)
+    fresh = rolling_metrics(cube[cube["date"] >= lookback], key, windows)
+    fresh = fresh[fresh["date"] >= _since(fresh, key, since)]
+    kept = previous[~(previous["date"] >= _since(previous, key, since))]
+    return pd.concat([kept, fresh], ignore_index=True).sort_values([key, "date"], kind="mergesort").reset_index(drop=True)
+
+
+# Rolling metrics for every key; reuses `previous` (same structure) when only
+# days from `since` onwards changed, e.g. new days appended to the sheet.
+# `since` may also be a dict of per-value days for each key (only the
+# executives / customers an edit touched are redone, see changes.py).
+def build_rolling(cube, previous=None, since=None):
+    if previous is None:
+        return {key: rolling_metrics(cube, key) for key in ROLLING_KEYS}
+    return {key: update_rolling(previous[key], cube, key, since[key] if isinstance(since, dict) else since)
+            for key in ROLLING_KEYS}
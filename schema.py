@@ -0,0 +1,123 @@
+import pandas as pd
+
+
+# ✅ Ledger schema: column -> (kind, nullable)
+# "money" columns are filled with 0 when empty, so pages can sum them directly.
+# Non-nullable columns are reported as bad rows when empty or unparseable.
+LEDGER_SCHEMA = {
+    "date": ("date", False),
+    "order_no": ("text", True),
+    "customer_type": ("text", True),
+    "customer_name": ("text", False),
+    "sales_executive": ("text", False),
+    "openning_balance": ("money", True),
+    "sales_amount": ("money", True),
+    "sales_return": ("money", True),
+    "paid_amount": ("money", True),
+    "customer_cashback": ("money", True),
+    "executive_commission": ("money", True),
+    "teamleader_commission": ("money", True),
+    "gm_commission": ("money", True),
+    "company_profit": ("money", True),
+    "offer_name": ("text", True),
+}
+
+# Columns the pages cannot work without
+REQUIRED_COLUMNS = ["date", "customer_name", "sales_executive", "sales_amount", "paid_amount"]
+
+# Alternative spellings found in exported sheets -> canonical column name
+COLUMN_ALIASES = {
+    "opening_balance": "openning_balance",
+    "cashback": "customer_cashback",
+    "deposit_amount": "paid_amount",
+}
+
+MONEY_COLUMNS = [col for col, (kind, _) in LEDGER_SCHEMA.items() if kind == "money"]
+TEXT_COLUMNS = [col for col, (kind, _) in LEDGER_SCHEMA.items() if kind == "text"]
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def _normalize_columns(raw):
+    renamed = {}
+    for col in raw.columns:
+        name = str(col).strip().lower().replace(" ", "_")
+        renamed[col] = COLUMN_ALIASES.get(name, name)
+    return raw.rename(columns=renamed)
+
+
+def _issues(mask, df, column, problem, original):
+    rows = df.index[mask]
+    return pd.DataFrame({
+        "excel_row": rows + 2,
+        "column": column,
+        "problem": problem,
+        "value": original[mask].astype(str).values,
+    })
+
+
+# Validate and coerce the raw sheet once, in vectorized passes.
+# Returns the typed ledger and a table of bad rows (excel_row, column, problem, value).
+def prepare_ledger(raw):
+    df = _normalize_columns(raw)
+
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise SchemaError(f"Missing required column(s) in data: {', '.join(missing)}")
+
+    # Optional columns that are absent are added empty so pages never need to check
+    for col in LEDGER_SCHEMA:
+        if col not in df.columns:
+            df[col] = pd.NA
+
+    # Text cells holding only spaces are empty, for the blank-row and missing-value checks too
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].astype("string").str.strip().replace("", pd.NA)
+
+    # Completely blank sheet rows carry nothing and are dropped
+    # (the index keeps the sheet position until the end, for reporting)
+    # (Excel often stores 0 in formula columns of empty rows, so zeros count as blank)
+    blank = df[[col for col in LEDGER_SCHEMA if col not in MONEY_COLUMNS]].isna().all(axis=1)
+    blank &= df[MONEY_COLUMNS].apply(pd.to_numeric, errors="coerce").fillna(0).eq(0).all(axis=1)
+    df = df[~blank]
+
+    problems = []
+    for col, (kind, nullable) in LEDGER_SCHEMA.items():
+        original = df[col]
+        if kind == "date":
+            coerced = pd.to_datetime(original, errors="coerce")
+        elif kind == "money":
+            coerced = pd.to_numeric(original, errors="coerce").astype("float64")
+        else:
+            coerced = original
+
+        unparseable = original.notna() & coerced.isna()
+        if kind != "text" and unparseable.any():
+            problems.append(_issues(unparseable, df, col, f"not a valid {kind}", original))
+        if not nullable:
+            empty = original.isna()
+            if empty.any():
+                problems.append(_issues(empty, df, col, "missing value", original))
+
+        df[col] = coerced.fillna(0.0) if kind == "money" else coerced
+
+    # Derived columns used across pages, computed once here
+    df["customer_outstanding"] = (
+        df["openning_balance"] +
+        df["sales_amount"] -
+        df["sales_return"] -
+        df["paid_amount"] -
+        df["customer_cashback"]
+    )
+    df["month"] = df["date"].dt.to_period("M").astype("string")
+
+    columns = list(LEDGER_SCHEMA) + [c for c in df.columns if c not in LEDGER_SCHEMA]
+    df = df[columns].reset_index(drop=True)
+
+    if problems:
+        issues = pd.concat(problems, ignore_index=True).sort_values(["excel_row", "column"]).reset_index(drop=True)
+    else:
+        issues = pd.DataFrame(columns=["excel_row", "column", "problem", "value"])
+    return df, issues
@@ -0,0 +1,203 @@
+import os
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+# ✅ Search index over customer and executive names
+# Names are normalized (case, punctuation, spacing, "&" and a leading "M/S"),
+# so "Al - Madina Crockeries" and "Al- Madina Crockeries", or "S.M Crockeries"
+# and "SM Crockeries", are one entry under one canonical ID (the normalized
+# name without spaces). Misspellings the normalization cannot tell apart are
+# merged with name_aliases.csv next to the workbook (columns: alias, name);
+# possible_duplicates() lists candidates for it.
+# Typing searches two structures built once per data version:
+#   prefixes: the name from every word on, without spaces, in one sorted array,
+#             so a prefix lookup is one searchsorted range (a flattened trie)
+#   trigrams: entries per word trigram; the query's trigrams are counted per
+#             entry with one bincount, for names typed with a spelling mistake
+NAME_ALIASES_FILE = "name_aliases.csv"
+SEARCH_LIMIT = 20
+# Share of the query's trigrams a fuzzy match must contain
+MIN_SIMILARITY = 0.5
+# Similarity (Dice) of two entries listed as possible duplicates
+DUPLICATE_SIMILARITY = 0.75
+# Words in at least this share of the names are compared as a whole, not by trigrams
+COMMON_WORD_SHARE = 0.05
+
+
+def name_words(name):
+    text = str(name).casefold().replace("&", " and ")
+    text = re.sub(r"^\s*m\s*/\s*s\b\.?", " ", text)
+    return re.sub(r"[^\w\s]|_", " ", text).split()
+
+
+def name_key(name):
+    return "".join(name_words(name))
+
+
+# Padded word trigrams, as in PostgreSQL's pg_trgm ("  a", " ab", "abc", "bc ")
+def _trigrams(words):
+    grams = set()
+    for word in words:
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+# Trigram posting lists of a list of trigram sets: {trigram: code}, the set
+# positions sorted by trigram code and where each code starts in them
+def _postings(gram_sets):
+    pairs = [(gram, position) for position, grams in enumerate(gram_sets) for gram in grams]
+    codes, grams = pd.factorize(pd.Series([gram for gram, _ in pairs], dtype=object), sort=True)
+    order = np.argsort(codes, kind="mergesort")
+    positions = np.array([position for _, position in pairs], dtype=np.int64)[order]
+    return {gram: code for code, gram in enumerate(grams)}, positions, np.searchsorted(codes[order], np.arange(len(grams) + 1))
+
+
+# Trigrams of `grams` each set of the postings shares
+def _shared_trigrams(postings, grams, size):
+    gram_codes, positions, starts = postings
+    codes = [gram_codes[gram] for gram in grams if gram in gram_codes]
+    if not codes:
+        return np.zeros(size, dtype=np.int64)
+    return np.bincount(np.concatenate([positions[starts[c]:starts[c + 1]] for c in codes]), minlength=size)
+
+
+# One searchable name: every spelling found in the ledger (most used first)
+@dataclass
+class NameEntry:
+    id: str
+    name: str
+    names: tuple
+    rows: int
+
+    @property
+    def label(self):
+        if len(self.names) == 1:
+            return self.name
+        return f"{self.name}  (+{len(self.names) - 1} spelling{'s' if len(self.names) > 2 else ''})"
+
+
+class NameIndex:
+
+    # counts: rows per name (e.g. df["customer_name"].value_counts());
+    # aliases: {alias: name} merged in addition to the normalized names
+    def __init__(self, counts, aliases=None):
+        counts = counts[counts.index.notna()]
+        alias_keys = {name_key(alias): name_key(name) for alias, name in (aliases or {}).items()}
+        keys = []
+        for name in counts.index:
+            key, seen = name_key(name), set()
+            while key in alias_keys and key not in seen:
+                seen.add(key)
+                key = alias_keys[key]
+            keys.append(key)
+
+        # Spellings of one ID together, the most used first
+        spellings = {}
+        for key, name, rows in sorted(zip(keys, map(str, counts.index), counts.tolist()), key=lambda s: (s[0], -s[2], s[1])):
+            spellings.setdefault(key, []).append((name, rows))
+        self.entries = [
+            NameEntry(id=key, name=names[0][0], names=tuple(name for name, _ in names), rows=sum(rows for _, rows in names))
+            for key, names in spellings.items()
+        ]
+        self.positions = {entry.id: i for i, entry in enumerate(self.entries)}
+        self.by_name = {name: entry.id for entry in self.entries for name in entry.names}
+        self.rows = np.array([entry.rows for entry in self.entries], dtype=np.int64)
+
+        # Prefixes: (name from word i on, entry, i) sorted by text
+        tails, owners, starts = [], [], []
+        for position, entry in enumerate(self.entries):
+            words = name_words(entry.name)
+            for i in range(len(words)):
+                tails.append("".join(words[i:]))
+                owners.append(position)
+                starts.append(i)
+        order = np.argsort(np.array(tails, dtype=str), kind="mergesort")
+        self.tails = np.array(tails, dtype=str)[order]
+        self.tail_owners = np.array(owners, dtype=np.int64)[order]
+        self.tail_starts = np.array(starts, dtype=np.int64)[order]
+
+        # Trigrams of every spelling
+        self.postings = _postings([_trigrams(name_words(" ".join(entry.names))) for entry in self.entries])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def entry(self, entry_id):
+        return self.entries[self.positions[entry_id]]
+
+    # Canonical ID of any spelling in the ledger
+    def canonical(self, name):
+        return self.by_name.get(name)
+
+    # Best matches for what the user typed, as entries: exact name, then names
+    # starting with it, then names with a word starting with it, then fuzzy
+    # matches by similarity; busiest names first within each group. An empty
+    # query lists the busiest names.
+    def search(self, query, limit=SEARCH_LIMIT):
+        words = name_words(query or "")
+        key = "".join(words)
+        if not key:
+            order = np.lexsort((np.arange(len(self.entries)), -self.rows))
+            return [self.entries[i] for i in order[:limit]]
+
+        tier = np.full(len(self.entries), 4, dtype=np.int64)
+        lo = np.searchsorted(self.tails, key, side="left")
+        hi = np.searchsorted(self.tails, key + "\U0010ffff", side="left")
+        owners, starts = self.tail_owners[lo:hi], self.tail_starts[lo:hi]
+        np.minimum.at(tier, owners, np.where(starts == 0, 1, 2))
+        if key in self.positions:
+            tier[self.positions[key]] = 0
+
+        grams = _trigrams(words)
+        similarity = _shared_trigrams(self.postings, grams, len(self.entries)) / max(len(grams), 1)
+        tier[(tier == 4) & (similarity >= MIN_SIMILARITY)] = 3
+
+        found = np.flatnonzero(tier < 4)
+        order = np.lexsort((found, -self.rows[found], -similarity[found], tier[found]))
+        return [self.entries[i] for i in found[order][:limit]]
+
+    # Pairs of entries that may be one customer spelled two ways, most similar
+    # first: the same common words ("Enterprise", "Store", ...) and numbers,
+    # and similar other words (e.g. "Bismillah Store" and "Bismilliah Store")
+    def possible_duplicates(self, min_similarity=DUPLICATE_SIMILARITY):
+        words = [name_words(entry.name) for entry in self.entries]
+        frequency = pd.Series([word for entry_words in words for word in set(entry_words)], dtype=object).value_counts()
+        common = set(frequency.index[frequency >= max(3, COMMON_WORD_SHARE * len(self.entries))])
+        groups = [(frozenset(w for w in entry_words if w in common), re.sub(r"\D", "", "".join(entry_words))) for entry_words in words]
+        gram_sets = [_trigrams([w for w in entry_words if w not in common]) for entry_words in words]
+        counts = np.array([len(grams) for grams in gram_sets], dtype=np.int64)
+        postings = _postings(gram_sets)
+
+        pairs = []
+        for position, grams in enumerate(gram_sets):
+            if not grams:
+                continue
+            dice = 2 * _shared_trigrams(postings, grams, len(self.entries)) / (counts + len(grams))
+            for other in np.flatnonzero(dice >= min_similarity):
+                if other > position and groups[other] == groups[position]:
+                    pairs.append((self.entries[position].name, self.entries[other].name, float(dice[other])))
+        return pd.DataFrame(pairs, columns=["name", "similar_name", "similarity"]).sort_values(
+            "similarity", ascending=False, kind="mergesort").reset_index(drop=True)
+
+
+def load_name_aliases(path=NAME_ALIASES_FILE):
+    if not os.path.exists(path):
+        return {}
+    aliases = pd.read_csv(path, dtype="string")
+    aliases.columns = [c.strip().lower() for c in aliases.columns]
+    aliases = aliases[["alias", "name"]].dropna()
+    return dict(zip(aliases["alias"].str.strip(), aliases["name"].str.strip()))
+
+
+# Customer and executive indexes of a ledger, built once per data version
+def build_name_indexes(df, aliases_path=NAME_ALIASES_FILE):
+    aliases = load_name_aliases(aliases_path)
+    return {
+        column: NameIndex(df[column].value_counts(), aliases)
+        for column in ("customer_name", "sales_executive")
+    }
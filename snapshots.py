@@ -0,0 +1,85 @@
+import os
+
+import pandas as pd
+
+from cube import DIMENSIONS, MEASURES, monthly_cube
+
+
+# ✅ Closed months are frozen as one snapshot file per month.
+# A snapshot is rebuilt only when the rows of its month change (e.g. a corrected
+# old entry), so month-end reporting reads O(months) aggregates instead of
+# regrouping the whole ledger on every rerun.
+SNAPSHOT_DIR = "snapshots"
+
+
+def _fingerprint(rows):
+    return format(int(pd.util.hash_pandas_object(rows, index=False).sum()) & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+def _snapshot_path(directory, month):
+    return os.path.join(directory, f"{month}.pkl")
+
+
+def _read_snapshot(path, fingerprint):
+    try:
+        stored = pd.read_pickle(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    if stored.attrs.get("fingerprint") != fingerprint:
+        return None
+    return stored
+
+
+def _write_snapshot(path, snapshot):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    snapshot.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+# Monthly aggregates per executive, customer and type.
+# Closed months (before the current month) come from snapshots, only the open
+# month is computed live. closing_due is the running customer due at month end.
+# Undated rows (kept by prepare_ledger, e.g. an opening balance without a
+# date) come first with an empty month: they belong to no month but count
+# towards every due.
+def month_snapshots(df, today=None, directory=SNAPSHOT_DIR):
+    today = pd.Timestamp.today() if today is None else pd.Timestamp(today)
+    open_month = today.to_period("M").strftime("%Y-%m")
+    os.makedirs(directory, exist_ok=True)
+
+    dated = df[df["month"].notna()]
+    undated = df[df["month"].isna()]
+    parts = [monthly_cube(undated)] if len(undated) else []
+    for month, rows in dated.groupby("month", sort=True):
+        if month >= open_month:
+            parts.append(monthly_cube(rows))
+            continue
+        fingerprint = _fingerprint(rows[["date"] + DIMENSIONS + MEASURES])
+        path = _snapshot_path(directory, month)
+        snapshot = _read_snapshot(path, fingerprint)
+        if snapshot is None:
+            snapshot = monthly_cube(rows)
+            snapshot.attrs["fingerprint"] = fingerprint
+            _write_snapshot(path, snapshot)
+        parts.append(snapshot)
+
+    if not parts:
+        return pd.DataFrame(columns=["month"] + DIMENSIONS + MEASURES + ["closing_due"])
+    snaps = pd.concat(parts, ignore_index=True)
+    snaps.attrs = {}
+    snaps["closing_due"] = snaps.groupby(DIMENSIONS, dropna=False)["customer_outstanding"].cumsum()
+    return snaps
+
+
+# Month-level totals (optionally by some keys) for trend charts.
+# closing_due is the cumulative due at each month end for that level (undated
+# rows included); the undated rows themselves are not a month on the chart.
+def monthly_totals(snaps, keys=()):
+    keys = list(keys)
+    # Snapshot order: undated first, then month by month
+    totals = snaps.groupby(["month"] + keys, dropna=False, sort=False)[MEASURES].sum().reset_index()
+    if keys:
+        totals["closing_due"] = totals.groupby(keys, dropna=False)["customer_outstanding"].cumsum()
+    else:
+        totals["closing_due"] = totals["customer_outstanding"].cumsum()
+    return totals[totals["month"].notna()].sort_values(["month"] + keys, kind="mergesort").reset_index(drop=True)
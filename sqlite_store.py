@@ -0,0 +1,195 @@
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+from schema import LEDGER_SCHEMA, MONEY_COLUMNS, prepare_ledger
+
+
+# ✅ Optional SQLite backend for the ledger (WAL mode)
+# The workbook is imported into a local database that can be appended to
+# while the app reads it, and filtered through indexes instead of scanning
+# the whole frame in pandas.
+#
+# Usage:
+#   python sqlite_store.py sale_data.xlsx ledger.db
+#   LEDGER_BACKEND=sqlite LEDGER_DB=ledger.db streamlit run main.py
+
+DERIVED_COLUMNS = ["customer_outstanding", "month"]
+COLUMNS = list(LEDGER_SCHEMA) + DERIVED_COLUMNS
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+INDEXES = {
+    "idx_ledger_date": "date",
+    "idx_ledger_exec_date": "sales_executive, date",
+    "idx_ledger_customer_date": "customer_name, date",
+    "idx_ledger_type_date": "customer_type, date",
+}
+
+
+def _column_sql(col):
+    if col in MONEY_COLUMNS or col == "customer_outstanding":
+        return f"{col} REAL NOT NULL DEFAULT 0"
+    return f"{col} TEXT"
+
+
+def _to_rows(df):
+    out = df[COLUMNS].copy()
+    out["date"] = out["date"].dt.strftime(DATE_FORMAT)
+    out = out.astype(object).where(out.notna(), None)
+    return list(out.itertuples(index=False, name=None))
+
+
+def _from_rows(frame):
+    frame["date"] = pd.to_datetime(frame["date"], format=DATE_FORMAT)
+    for col in COLUMNS:
+        if col in MONEY_COLUMNS or col == "customer_outstanding":
+            frame[col] = frame[col].astype("float64")
+        elif col != "date":
+            frame[col] = frame[col].astype("string")
+    return frame
+
+
+class LedgerStore:
+
+    def __init__(self, db_path="ledger.db", pool_size=4):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        with self._writer() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._create_schema(conn)
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect(read_only=True))
+
+    def _connect(self, read_only=False):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    # Short-lived write connection, one transaction, closed afterwards
+    @contextmanager
+    def _writer(self):
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_schema(self, conn):
+        columns = ",\n    ".join(_column_sql(col) for col in COLUMNS)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS ledger (\n    row_id INTEGER PRIMARY KEY,\n    {columns}\n)")
+        for name, cols in INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ledger ({cols})")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    # Pooled read connection
+    @contextmanager
+    def reader(self):
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    # Replace the ledger with a prepared frame in one transaction.
+    # Readers keep seeing the previous rows until the commit (WAL).
+    # `version` is the dataset version of the rows; without one the stored
+    # version is cleared, so version-tagged reads stop matching.
+    def replace(self, df, version=None):
+        rows = _to_rows(df)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._write_lock, self._writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM ledger")
+            conn.executemany(f"INSERT INTO ledger ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows)
+            if version is not None:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+            else:
+                conn.execute("DELETE FROM meta WHERE key = 'version'")
+        return len(rows)
+
+    # Append prepared rows (e.g. today's entries) without rewriting the table.
+    # The table then matches no built dataset, so the stored version is cleared.
+    def append(self, df):
+        rows = _to_rows(df)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._write_lock, self._writer() as conn:
+            conn.executemany(f"INSERT INTO ledger ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows)
+            conn.execute("DELETE FROM meta WHERE key = 'version'")
+        return len(rows)
+
+    # Import a workbook under the version build_dataset gives it (see refresher.py)
+    def import_excel(self, path):
+        from refresher import _companion_files, dataset_version
+
+        df, issues = prepare_ledger(pd.read_excel(path))
+        self.replace(df, dataset_version(df, _companion_files(path)))
+        return df, issues
+
+    def version(self):
+        with self.reader() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    # Ledger rows matching the filters, in sheet order, with the same columns
+    # and dtypes as the prepared DataFrame. Every filter combination used by
+    # the pages is served by one of the (key, date) indexes. An executive or
+    # customer may also be a list of names (every spelling of one, see search.py).
+    # With a `version`, the rows are read in the same snapshot as the stored
+    # version, and None is returned when the store holds another version.
+    def transactions(self, executive=None, customer=None, customer_types=None, date_range=None, version=None):
+        where, params = [], []
+        for column, names in (("sales_executive", executive), ("customer_name", customer)):
+            if names is None:
+                continue
+            names = list(names) if isinstance(names, (list, tuple)) else [names]
+            where.append(f"{column} IN ({', '.join('?' for _ in names)})")
+            params.extend(names)
+        if customer_types is not None:
+            customer_types = list(customer_types)
+            where.append(f"customer_type IN ({', '.join('?' for _ in customer_types)})")
+            params.extend(customer_types)
+        if date_range is not None:
+            where.append("date >= ? AND date <= ?")
+            params.extend(pd.Timestamp(d).strftime(DATE_FORMAT) for d in date_range[:2])
+        sql = f"SELECT {', '.join(COLUMNS)} FROM ledger"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY row_id"
+        with self.reader() as conn:
+            conn.execute("BEGIN")
+            try:
+                stored = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                if version is not None and (stored is None or stored[0] != version):
+                    return None
+                frame = pd.read_sql_query(sql, conn, params=params)
+            finally:
+                conn.execute("COMMIT")
+        return _from_rows(frame)
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import sale_data.xlsx into the SQLite ledger store")
+    parser.add_argument("excel", nargs="?", default="sale_data.xlsx")
+    parser.add_argument("db", nargs="?", default=os.environ.get("LEDGER_DB", "ledger.db"))
+    args = parser.parse_args(argv)
+
+    store = LedgerStore(args.db)
+    df, issues = store.import_excel(args.excel)
+    print(f"Imported {len(df):,} rows into {args.db} ({len(issues)} data issue(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+
+
+# ✅ Batch customer statements
+# For every customer in a period: opening balance (undated rows, e.g. opening
+# balances without a date, come before every dated row), dated transactions
+# with a running balance, and the closing due. All customers are computed together
+# with grouped, vectorized operations; the Excel files are written in parallel.
+#
+# Usage:
+#   python statements.py --start 2025-07-01 --end 2025-07-31 --out statements
+
+LINE_COLUMNS = [
+    "date", "order_no", "sales_executive", "openning_balance", "sales_amount",
+    "sales_return", "paid_amount", "customer_cashback",
+]
+
+
+# Returns (summary, lines):
+#   summary: one row per customer with opening, period totals and closing due
+#   lines:   period transactions per customer with a running balance
+def build_statements(df, start, end):
+    start, end = pd.to_datetime(start), pd.to_datetime(end)
+    ledger = df[df["customer_name"].notna()]
+
+    before = ledger[ledger["date"].isna() | (ledger["date"] < start)]
+    period = ledger[(ledger["date"] >= start) & (ledger["date"] <= end)]
+
+    opening = before.groupby("customer_name")["customer_outstanding"].sum().rename("opening_balance")
+    totals = period.groupby("customer_name")[
+        ["openning_balance", "sales_amount", "sales_return", "paid_amount", "customer_cashback", "customer_outstanding"]
+    ].sum()
+
+    summary = pd.concat([opening, totals], axis=1).fillna(0.0)
+    summary["closing_due"] = summary["opening_balance"] + summary["customer_outstanding"]
+    summary = summary.drop(columns="customer_outstanding")
+    # Customers with activity in the period or a balance carried into it
+    active = summary.index.isin(totals.index) | (summary["opening_balance"].round(2) != 0)
+    summary = summary[active].sort_index().rename_axis("customer_name").reset_index()
+
+    lines = period.sort_values(["customer_name", "date"], kind="mergesort")[["customer_name"] + LINE_COLUMNS + ["customer_outstanding"]]
+    lines = lines.rename(columns={"customer_outstanding": "movement"})
+    carried = lines["customer_name"].map(opening).fillna(0.0)
+    lines["running_balance"] = carried + lines.groupby("customer_name")["movement"].cumsum()
+    return summary, lines.reset_index(drop=True)
+
+
+def safe_file_name(name):
+    return re.sub(r"[^\w\-. ]+", "_", str(name)).strip() or "customer"
+
+
+# One file name per customer, numbered when two would otherwise be the same
+# (compared case-insensitively, as on Windows and macOS file systems)
+def unique_file_names(names):
+    seen, unique = set(), []
+    for name in names:
+        base = safe_file_name(name)
+        candidate, n = base, 1
+        while candidate.casefold() in seen:
+            n += 1
+            candidate = f"{base}_{n}"
+        seen.add(candidate.casefold())
+        unique.append(candidate)
+    return unique
+
+
+def _statement_bytes(customer_summary, customer_lines):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        customer_summary.to_excel(writer, sheet_name="Summary", index=False)
+        customer_lines.to_excel(writer, sheet_name="Transactions", index=False)
+    return output.getvalue()
+
+
+def _write_batch(batch, out_dir, start, end):
+    paths = []
+    for file_name, customer_summary, customer_lines in batch:
+        path = os.path.join(out_dir, f"{file_name}_statement_{start:%Y-%m-%d}_{end:%Y-%m-%d}.xlsx")
+        with open(path, "wb") as f:
+            f.write(_statement_bytes(customer_summary, customer_lines))
+        paths.append(path)
+    return paths
+
+
+def _batches(summary, lines, size):
+    grouped = dict(tuple(lines.groupby("customer_name", sort=False)))
+    empty = lines.iloc[0:0]
+    file_names = unique_file_names(summary["customer_name"])
+    batch = []
+    for i in range(len(summary)):
+        customer_summary = summary.iloc[[i]]
+        customer = customer_summary["customer_name"].iloc[0]
+        batch.append((file_names[i], customer_summary, grouped.get(customer, empty)))
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# Write one Excel statement per customer into out_dir, in parallel processes
+def write_statements(summary, lines, out_dir, start, end, workers=None, batch_size=50):
+    start, end = pd.to_datetime(start), pd.to_datetime(end)
+    os.makedirs(out_dir, exist_ok=True)
+    batches = list(_batches(summary, lines, batch_size))
+    if workers == 1 or len(batches) <= 1:
+        return [path for batch in batches for path in _write_batch(batch, out_dir, start, end)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_write_batch, batches, [out_dir] * len(batches), [start] * len(batches), [end] * len(batches))
+        return [path for paths in results for path in paths]
+
+
+# All statements in one zip (for the download button)
+def statements_zip(summary, lines, start, end):
+    start, end = pd.to_datetime(start), pd.to_datetime(end)
+    output = BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("summary.csv", summary.to_csv(index=False))
+        for batch in _batches(summary, lines, len(summary) or 1):
+            for file_name, customer_summary, customer_lines in batch:
+                name = f"{file_name}_statement_{start:%Y-%m-%d}_{end:%Y-%m-%d}.xlsx"
+                archive.writestr(name, _statement_bytes(customer_summary, customer_lines))
+    return output.getvalue()
+
+
+def main(argv=None):
+    from schema import prepare_ledger
+
+    parser = argparse.ArgumentParser(description="Write statements for every customer in a period")
+    parser.add_argument("--excel", default="sale_data.xlsx")
+    parser.add_argument("--start", required=True)
+    parser.add_argument("--end", required=True)
+    parser.add_argument("--out", default="statements")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    df, _ = prepare_ledger(pd.read_excel(args.excel))
+    summary, lines = build_statements(df, args.start, args.end)
+    paths = write_statements(summary, lines, args.out, args.start, args.end, workers=args.workers)
+    summary.to_csv(os.path.join(args.out, "summary.csv"), index=False)
+    print(f"Wrote {len(paths):,} statements to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
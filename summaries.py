@@ -0,0 +1,159 @@
+import pandas as pd
+
+
+# ✅ Summaries shared by the pages and the JSON API (api.py)
+# Each takes the ledger rows to summarize, so pages and API return the same numbers.
+
+
+# Rows whose column is the name, or one of the names (every spelling of a
+# customer merged under one ID, see search.py)
+def _named(column, names):
+    if isinstance(names, (list, tuple)):
+        return column.isin(list(names))
+    return column == names
+
+
+# Ledger rows for an executive / customer / customer types / date range (pandas masks)
+def select_rows(df, executive=None, customer=None, customer_types=None, date_range=None):
+    mask = pd.Series(True, index=df.index)
+    if executive is not None:
+        mask &= _named(df["sales_executive"], executive)
+    if customer is not None:
+        mask &= _named(df["customer_name"], customer)
+    if customer_types is not None:
+        mask &= df["customer_type"].isin(list(customer_types))
+    if date_range is not None:
+        mask &= (df["date"] >= pd.to_datetime(date_range[0])) & (df["date"] <= pd.to_datetime(date_range[1]))
+    return df[mask]
+
+
+# ledger_rows for the pages: indexed SQLite queries with a store, else pandas masks.
+# With a `version`, the store answers only while it holds that version of the
+# ledger (it is replaced when a reload is built, before the pages switch to it);
+# otherwise the rows come from `df`.
+def ledger_reader(df, store=None, version=None):
+    def ledger_rows(executive=None, customer=None, customer_types=None, date_range=None):
+        if store is not None:
+            rows = store.transactions(executive, customer, customer_types, date_range, version)
+            if rows is not None:
+                return rows
+        return select_rows(df, executive, customer, customer_types, date_range)
+    return ledger_rows
+
+
+# Ledger rows of the calendar month containing `day`
+def month_rows(df, day):
+    day = pd.Timestamp(day)
+    return df[(df["date"].dt.month == day.month) & (df["date"].dt.year == day.year)]
+
+
+# Home KPIs: month totals plus the all-time market due
+def home_kpis(df, day):
+    month = month_rows(df, day)
+    sales_amount = month["sales_amount"].sum()
+    sales_return = month["sales_return"].sum()
+    return {
+        "sales_amount": float(sales_amount),
+        "deposit_amount": float(month["paid_amount"].sum()),
+        "sales_return": float(sales_return),
+        "customer_cashback": float(month["customer_cashback"].sum()),
+        "actual_sales": float(sales_amount - sales_return),
+        "total_market_due": float(df["customer_outstanding"].sum()),
+    }
+
+
+# Executive-wise sales and deposit of the rows, with each executive's total due
+def executive_summary(rows, snapshots):
+    summary = rows.groupby("sales_executive").agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum"
+    }).reset_index()
+    due = snapshots.groupby("sales_executive")["customer_outstanding"].sum().reset_index().rename(columns={"customer_outstanding": "due_amount"})
+    return summary.merge(due, on="sales_executive", how="left").fillna(0)
+
+
+# Top customers by sales amount of the rows
+def top_customers(rows, n=10):
+    return rows.groupby("customer_name")["sales_amount"].sum().reset_index().sort_values(by="sales_amount", ascending=False).head(n)
+
+
+# What Home and Dashboard show for a month ("YYYY-MM"): KPIs, executive
+# sales & due and top customers
+def month_overview(df, snapshots, month):
+    day = pd.Period(month, "M").start_time
+    rows = month_rows(df, day)
+    return {
+        "kpis": home_kpis(df, day),
+        "executives": executive_summary(rows, snapshots),
+        "top_customers": top_customers(rows),
+    }
+
+
+# Customer-wise totals of the rows (one executive's customers on Exec Sales)
+def customer_sales(rows):
+    return rows.groupby("customer_name").agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum",
+        "executive_commission": "sum",
+        "teamleader_commission": "sum",
+        "gm_commission": "sum"
+    }).reset_index()
+
+
+# Date & executive-wise totals of the rows
+def date_summary(rows):
+    return rows.groupby(
+        [rows["date"].dt.date, "sales_executive"]
+    ).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum"
+    }).reset_index().rename(columns={"date": "Date", "sales_executive": "Sales Executive"})
+
+
+# Customer-wise outstanding of the rows
+def customer_dues(rows):
+    return rows.groupby("customer_name")["customer_outstanding"].sum().reset_index()
+
+
+# Executive-wise commission of the rows
+def commission_summary(rows):
+    return rows.groupby("sales_executive").agg({
+        "executive_commission": "sum",
+        "teamleader_commission": "sum",
+        "gm_commission": "sum"
+    }).reset_index().rename(columns={
+        "sales_executive": "Executive",
+        "executive_commission": "Executive Commission",
+        "teamleader_commission": "Team Leader Commission",
+        "gm_commission": "GM Commission"
+    })
+
+
+# Daily recap of the rows: (by date, by date & customer, by date & executive)
+def daily_recap(rows):
+    day = rows["date"].dt.date
+
+    daily_summary = rows.groupby(day).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum",
+        "customer_outstanding": "sum"
+    }).reset_index().rename(columns={"date": "Date"})
+
+    cust_daily = rows.groupby([day, "customer_name"]).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum"
+    }).reset_index().rename(columns={"date": "Date", "customer_name": "Customer"})
+
+    exec_daily = rows.groupby([day, "sales_executive"]).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum"
+    }).reset_index().rename(columns={"date": "Date", "sales_executive": "Executive"})
+    return daily_summary, cust_daily, exec_daily
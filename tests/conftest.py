@@ -0,0 +1,41 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bitmaps import ActivityIndex  # noqa: E402
+from catalog import build_dimension_catalog  # noqa: E402
+from cube import build_daily_cube  # noqa: E402
+from hierarchy import load_hierarchy  # noqa: E402
+from ledgers import LEDGERS, load_ledger, page_inputs  # noqa: E402
+from snapshots import month_snapshots  # noqa: E402
+from sqlite_store import LedgerStore  # noqa: E402
+
+
+# One prepared ledger with the structures the fast paths read, built once per session
+@pytest.fixture(scope="session", params=LEDGERS)
+def case(request, tmp_path_factory):
+    name = request.param
+    df = load_ledger(name)
+    inputs = page_inputs(df)
+    folder = tmp_path_factory.mktemp(name)
+    store = LedgerStore(str(folder / "ledger.db"))
+    store.replace(df)
+    catalog = build_dimension_catalog(df)
+    yield SimpleNamespace(
+        name=name,
+        df=df,
+        today=inputs["today"],
+        date_range=inputs["date_range"],
+        catalog=catalog,
+        cube=build_daily_cube(df),
+        snapshots=month_snapshots(df, today=inputs["today"], directory=str(folder / "snapshots")),
+        hierarchy=load_hierarchy(catalog.executives, path=str(folder / "no_hierarchy.csv")),
+        activity=ActivityIndex(df),
+        store=store,
+        folder=folder,
+    )
+    store.close()
@@ -0,0 +1,62 @@
+import os
+
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+
+# ✅ Golden files: tests/golden/<ledger>/<output>.csv
+# Written from the reference page code (tests/reference.py) with
+#   UPDATE_GOLDEN=1 python -m pytest tests
+# and compared column by column: text and dates exactly, amounts to within
+# half a paisa, so an optimization may reorder float additions but never
+# change a commission or a due by a single paisa.
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+CURRENCY_TOLERANCE = 0.005
+
+
+def updating():
+    return os.environ.get("UPDATE_GOLDEN") == "1"
+
+
+def golden_path(ledger, name):
+    return os.path.join(GOLDEN_DIR, ledger, f"{name}.csv")
+
+
+def write_golden(frame, ledger, name):
+    os.makedirs(os.path.join(GOLDEN_DIR, ledger), exist_ok=True)
+    frame.to_csv(golden_path(ledger, name), index=False)
+
+
+def read_golden(ledger, name):
+    return pd.read_csv(golden_path(ledger, name))
+
+
+def _amounts(values):
+    return not is_bool_dtype(values) and is_numeric_dtype(values)
+
+
+def _text(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.strftime("%Y-%m-%d")
+    return values.astype(object).map(lambda v: "" if pd.isna(v) else str(v))
+
+
+def assert_same_amounts(actual, expected, label=""):
+    actual, expected = actual.reset_index(drop=True), expected.reset_index(drop=True)
+    assert list(actual.columns) == list(expected.columns), f"{label}: columns {list(actual.columns)} != {list(expected.columns)}"
+    assert len(actual) == len(expected), f"{label}: {len(actual)} rows != {len(expected)} rows"
+    for col in expected.columns:
+        a, e = actual[col], expected[col]
+        if _amounts(a) and _amounts(e):
+            a, e = a.astype("float64"), e.astype("float64")
+            bad = ((a - e).abs() > CURRENCY_TOLERANCE) | (a.isna() != e.isna())
+        else:
+            bad = _text(a) != _text(e)
+        assert not bad.any(), (
+            f"{label}: column {col!r} differs in {int(bad.sum())} row(s), first at row {bad.idxmax()}: "
+            f"{actual.loc[bad.idxmax()].to_dict()} != {expected.loc[bad.idxmax()].to_dict()}"
+        )
+
+
+def assert_matches_golden(actual, ledger, name):
+    assert_same_amounts(actual, read_golden(ledger, name), f"{ledger}/{name}")
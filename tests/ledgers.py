@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from schema import prepare_ledger
+
+
+# ✅ Ledgers the golden outputs are captured from
+# "workbook" is sale_data.xlsx, "workbook_undated" the same sheet with the
+# largest opening balance left undated (prepare_ledger keeps such rows, so
+# every due must still include them); the synthetic ledgers are generated
+# from a fixed seed in the same sheet layout (opening balances, two of them
+# undated, sales with returns, deposits, cashback and commissions in whole
+# paisa, some blank cells, shared order numbers, customers moved between
+# executives).
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKBOOK = os.path.join(ROOT, "sale_data.xlsx")
+SYNTHETIC_SEEDS = (0, 1, 2)
+LEDGERS = ("workbook", "workbook_undated") + tuple(f"synthetic_{seed}" for seed in SYNTHETIC_SEEDS)
+
+
+def _money(rng, low, high, size):
+    return np.round(rng.uniform(low, high, size), 2)
+
+
+def synthetic_sheet(seed, rows=400, executives=6, customers=40, days=150):
+    rng = np.random.default_rng(seed)
+    exec_names = [f"Executive {chr(65 + i)}" for i in range(executives)]
+    cust_names = [f"Customer {i:02d}" for i in range(customers)]
+    cust_types = rng.choice(["Dealership", "Retail Shop", "B2B", "Corporate"], customers)
+    cust_exec = rng.integers(0, executives, customers)
+    start = pd.Timestamp("2025-01-01") + pd.Timedelta(days=int(rng.integers(0, 200)))
+
+    # One opening row per customer on the first day, then the day-to-day rows
+    opening = pd.DataFrame({
+        "date": start,
+        "order_no": "OPENNING",
+        "customer_type": cust_types,
+        "customer_name": cust_names,
+        "sales_executive": [exec_names[i] for i in cust_exec],
+        "openning_balance": _money(rng, -5000, 250000, customers),
+    })
+    who = rng.integers(0, customers, rows)
+    kind = rng.choice(["sale", "deposit", "return", "cashback"], rows, p=[0.5, 0.35, 0.1, 0.05])
+    sales = np.where(kind == "sale", _money(rng, 500, 90000, rows), 0.0)
+    executive = cust_exec[who].copy()
+    moved = rng.random(rows) < 0.05
+    executive[moved] = rng.integers(0, executives, moved.sum())
+    days_in = np.sort(rng.integers(1, days, rows))
+    body = pd.DataFrame({
+        "date": start + pd.to_timedelta(days_in, unit="D"),
+        "order_no": [f"SO-{n}" for n in rng.integers(1000, 1000 + rows // 2, rows)],
+        "customer_type": cust_types[who],
+        "customer_name": [cust_names[i] for i in who],
+        "sales_executive": [exec_names[i] for i in executive],
+        "sales_amount": sales,
+        "sales_return": np.where(kind == "return", _money(rng, 100, 8000, rows), 0.0),
+        "paid_amount": np.where(kind == "deposit", _money(rng, 1000, 120000, rows), 0.0),
+        "customer_cashback": np.where(kind == "cashback", _money(rng, 50, 2500, rows), 0.0),
+        "executive_commission": np.round(sales * 0.02, 2),
+        "teamleader_commission": np.round(sales * 0.005, 2),
+        "gm_commission": np.round(sales * 0.0025, 2),
+        "company_profit": np.round(sales * 0.1, 2),
+        "offer_name": np.where(rng.random(rows) < 0.1, "Eid Offer", None),
+    })
+    sheet = pd.concat([opening, body], ignore_index=True)
+
+    # Blank cells the loader has to cope with, including opening balances
+    # without a date (kept by prepare_ledger, they count towards every due)
+    sheet.loc[rng.choice(customers, 2, replace=False), "date"] = pd.NaT
+    sheet.loc[rng.random(len(sheet)) < 0.03, "customer_type"] = np.nan
+    sheet.loc[rng.random(len(sheet)) < 0.03, "sales_return"] = np.nan
+    sheet.loc[sheet["order_no"].ne("OPENNING") & (rng.random(len(sheet)) < 0.2), "order_no"] = np.nan
+    return sheet
+
+
+def load_ledger(name):
+    if name.startswith("workbook"):
+        raw = pd.read_excel(WORKBOOK)
+        if name == "workbook_undated":
+            raw.loc[raw["openning_balance"].idxmax(), "date"] = pd.NaT
+    else:
+        raw = synthetic_sheet(int(name.rsplit("_", 1)[1]))
+    df, _ = prepare_ledger(raw)
+    return df
+
+
+# Inputs the pages are captured with: "today" is the last day of the data
+# (so the current-month pages are not empty) and the date range is the
+# middle of the data, so range filters cut rows on both sides.
+def page_inputs(df):
+    dates = df["date"].dropna().sort_values()
+    return {
+        "today": dates.iloc[-1],
+        "date_range": (dates.quantile(0.25).date(), dates.quantile(0.75).date()),
+    }
@@ -0,0 +1,196 @@
+import pandas as pd
+
+
+# ✅ Reference outputs: the pandas code of the original page branches in
+# main.py, kept as it was written there (only the Streamlit calls removed).
+# The golden files are written from these; faster paths are tested against them.
+
+
+def _date_filter(df, date_range):
+    return df[
+        (df["date"] >= pd.to_datetime(date_range[0])) &
+        (df["date"] <= pd.to_datetime(date_range[1]))
+    ].copy()
+
+
+def _current_month(df, today):
+    return df[(df['date'].dt.month == today.month) & (df['date'].dt.year == today.year)]
+
+
+# 1. Home: KPI cards
+def kpis(df, today):
+    df_current_month = _current_month(df, today)
+    sales_amount = df_current_month["sales_amount"].sum()
+    deposit_amount = df_current_month["paid_amount"].sum()
+    sales_return = df_current_month["sales_return"].sum()
+    customer_cashback = df_current_month["customer_cashback"].sum()
+    actual_sales = sales_amount - sales_return
+    total_market_due = df["customer_outstanding"].sum()
+    return pd.DataFrame([{
+        "sales_amount": sales_amount,
+        "deposit_amount": deposit_amount,
+        "sales_return": sales_return,
+        "customer_cashback": customer_cashback,
+        "actual_sales": actual_sales,
+        "total_market_due": total_market_due,
+    }])
+
+
+# 1. Home / 2. Dashboard: executive-wise sales and due (current month)
+def exec_summary(df, today):
+    df_current_month = _current_month(df, today)
+    exec_summary = df_current_month.groupby("sales_executive").agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum"
+    }).reset_index()
+    exec_due = df.groupby("sales_executive")["customer_outstanding"].sum().reset_index().rename(columns={"customer_outstanding": "due_amount"})
+    return exec_summary.merge(exec_due, on="sales_executive", how="left").fillna(0)
+
+
+# 1. Home: month-wise sales and deposit
+def month_summary(df):
+    df = df.assign(month=df['date'].dt.to_period('M').astype(str))
+    return df.groupby('month').agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum"
+    }).reset_index()
+
+
+# 1. Home / 2. Dashboard: top 10 customers (current month)
+def top_customers(df, today):
+    df_current_month = _current_month(df, today)
+    return df_current_month.groupby("customer_name")["sales_amount"].sum().reset_index().sort_values(by="sales_amount", ascending=False).head(10)
+
+
+# 3. Sales: executive-wise summary
+def grouped_exec(df):
+    return df.groupby("sales_executive")[
+        ["openning_balance", "sales_amount", "sales_return", "paid_amount", "customer_cashback", "customer_outstanding"]
+    ].sum().reset_index()
+
+
+# 8. Exec Dues: customer-wise outstanding, for every executive in turn
+def exec_dues(df):
+    parts = []
+    for selected_exec in sorted(df["sales_executive"].dropna().unique()):
+        exec_df = df[df["sales_executive"] == selected_exec].copy()
+        customer_outstanding = exec_df.groupby("customer_name")["customer_outstanding"].sum().reset_index()
+        parts.append(customer_outstanding.assign(sales_executive=selected_exec))
+    return pd.concat(parts, ignore_index=True)
+
+
+# 9. Exec Sales: customer-wise totals, for every executive in turn
+def exec_sales(df, date_range):
+    parts = []
+    for selected_exec in sorted(df["sales_executive"].dropna().unique()):
+        filtered = df[
+            (df["sales_executive"] == selected_exec) &
+            (df["date"] >= pd.to_datetime(date_range[0])) &
+            (df["date"] <= pd.to_datetime(date_range[1]))
+        ].copy()
+        summary = filtered.groupby("customer_name").agg({
+            "sales_amount": "sum",
+            "paid_amount": "sum",
+            "sales_return": "sum",
+            "customer_cashback": "sum",
+            "executive_commission": "sum",
+            "teamleader_commission": "sum",
+            "gm_commission": "sum"
+        }).reset_index()
+        parts.append(summary.assign(sales_executive=selected_exec))
+    return pd.concat(parts, ignore_index=True)
+
+
+# 10. Date Summary
+def date_summary(df, date_range):
+    filtered = _date_filter(df, date_range)
+    return filtered.groupby(
+        [filtered["date"].dt.date, "sales_executive"]
+    ).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum"
+    }).reset_index().rename(columns={"date": "Date", "sales_executive": "Sales Executive"})
+
+
+# 12. Type Sales: customer-wise and executive-wise totals for all customer types
+def type_sales(df, date_range):
+    selected_categories = list(df["customer_type"].dropna().unique())
+    filtered = df[
+        (df["customer_type"].isin(selected_categories)) &
+        (df["date"] >= pd.to_datetime(date_range[0])) &
+        (df["date"] <= pd.to_datetime(date_range[1]))
+    ].copy()
+    measures = {
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum",
+        "executive_commission": "sum",
+        "teamleader_commission": "sum",
+        "gm_commission": "sum"
+    }
+    summary = filtered.groupby("customer_name").agg(measures).reset_index()
+    exec_summary = filtered.groupby("sales_executive").agg(measures).reset_index().rename(columns={"sales_executive": "Executive"})
+    return summary, exec_summary
+
+
+# 13. Daily Recap: (daily_summary, cust_daily, exec_daily)
+def daily_recap(df, date_range):
+    filtered = _date_filter(df, date_range)
+    daily_summary = filtered.groupby(filtered["date"].dt.date).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_cashback": "sum",
+        "customer_outstanding": "sum"
+    }).reset_index().rename(columns={"date": "Date"})
+    cust_daily = filtered.groupby([filtered["date"].dt.date, "customer_name"]).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum"
+    }).reset_index().rename(columns={"date": "Date", "customer_name": "Customer"})
+    exec_daily = filtered.groupby([filtered["date"].dt.date, "sales_executive"]).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum"
+    }).reset_index().rename(columns={"date": "Date", "sales_executive": "Executive"})
+    return daily_summary, cust_daily, exec_daily
+
+
+# 15. Commissions
+def exec_comm(df, date_range):
+    filtered = _date_filter(df, date_range)
+    return filtered.groupby("sales_executive").agg({
+        "executive_commission": "sum",
+        "teamleader_commission": "sum",
+        "gm_commission": "sum"
+    }).reset_index().rename(columns={
+        "sales_executive": "Executive",
+        "executive_commission": "Executive Commission",
+        "teamleader_commission": "Team Leader Commission",
+        "gm_commission": "GM Commission"
+    })
+
+
+# Every golden output of a ledger: name -> DataFrame
+def page_outputs(df, today, date_range):
+    daily_summary, cust_daily, exec_daily = daily_recap(df, date_range)
+    type_customers, type_executives = type_sales(df, date_range)
+    return {
+        "kpis": kpis(df, today),
+        "exec_summary": exec_summary(df, today),
+        "month_summary": month_summary(df),
+        "top_customers": top_customers(df, today),
+        "grouped_exec": grouped_exec(df),
+        "exec_dues": exec_dues(df),
+        "exec_sales": exec_sales(df, date_range),
+        "date_summary": date_summary(df, date_range),
+        "type_sales_customers": type_customers,
+        "type_sales_executives": type_executives,
+        "daily_summary": daily_summary,
+        "cust_daily": cust_daily,
+        "exec_daily": exec_daily,
+        "exec_comm": exec_comm(df, date_range),
+    }
@@ -0,0 +1,34 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+from api import accepts_gzip, encode_response, etag_matches
+
+
+# ✅ Response encoding: ETags that survive reloads and Accept-Encoding negotiation
+def test_etag_follows_the_summary_not_the_version():
+    result = {"total": 1250.5, "rows": [{"customer_name": "Rahim Store", "due": 10.0}]}
+    body, gzipped, etag = encode_response(SimpleNamespace(version="a"), result)
+    assert json.loads(gzip.decompress(gzipped)) == json.loads(body) == {"version": "a", "data": result}
+    assert encode_response(SimpleNamespace(version="b"), result)[2] == etag
+    assert encode_response(SimpleNamespace(version="a"), {**result, "total": 1250.0})[2] != etag
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches("", etag)
+
+
+def test_accept_encoding():
+    assert accepts_gzip("gzip")
+    assert accepts_gzip("br, gzip;q=0.8, deflate")
+    assert accepts_gzip("GZIP; q=1.0")
+    assert accepts_gzip("*")
+    assert accepts_gzip("x-gzip")
+    assert not accepts_gzip("")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("gzip;q=0.000, *")
+    assert not accepts_gzip("*;q=0")
+    assert not accepts_gzip("br, deflate")
@@ -0,0 +1,137 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import refresher
+
+from cache import DiskCache, ResultCache
+from hierarchy import HIERARCHY_FILE, UNASSIGNED
+from ledgers import ROOT, synthetic_sheet
+from products import BUNDLED_CATALOG, LINE_ITEMS_FILE, PRODUCT_CATALOG_FILE
+from refresher import _file_signature, build_dataset
+from schema import prepare_ledger
+from search import NAME_ALIASES_FILE
+from sqlite_store import LedgerStore
+from summaries import ledger_reader
+from warmup import _whole_range, get_result
+
+
+# ✅ Files next to the workbook are part of the dataset, wherever the app runs from
+def _workbook(folder):
+    os.makedirs(folder, exist_ok=True)
+    shutil.copy(os.path.join(ROOT, PRODUCT_CATALOG_FILE), os.path.join(folder, PRODUCT_CATALOG_FILE))
+    path = os.path.join(folder, "sale_data.xlsx")
+    synthetic_sheet(0, rows=80).to_excel(path, index=False)
+    return path
+
+
+def test_hierarchy_is_read_next_to_the_workbook(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = _workbook(str(tmp_path / "data"))
+    data = build_dataset(path)
+    assert (data.hierarchy["team_leader"] == UNASSIGNED).all()
+
+    signature = _file_signature(path)
+    executives = data.catalog.executives
+    pd.DataFrame({"sales_executive": executives, "team_leader": "Leader", "gm": "GM"}).to_csv(
+        tmp_path / "data" / HIERARCHY_FILE, index=False)
+    assert _file_signature(path) != signature
+    assert (build_dataset(path).hierarchy["team_leader"] == "Leader").all()
+
+
+# Results cached on disk are keyed by the dataset version, which covers the
+# files next to the ledger: a new hierarchy is not answered from the old one
+def test_companion_files_change_the_version(tmp_path):
+    folder = tmp_path / "data"
+    path = _workbook(str(folder))
+    data = build_dataset(path)
+    cache_dir = str(tmp_path / "cache")
+    inputs = _whole_range(data)
+    before = get_result(ResultCache(store=DiskCache(cache_dir)), data, ledger_reader(data.df), "hierarchy_rollup", inputs)
+    assert (before["team_leader"]["team_leader"] == UNASSIGNED).all()
+
+    pd.DataFrame({"sales_executive": data.catalog.executives, "team_leader": "Leader", "gm": "GM"}).to_csv(
+        folder / HIERARCHY_FILE, index=False)
+    edited = build_dataset(path, previous=data)
+    assert edited.version != data.version
+    assert edited.changes.empty
+    after = get_result(ResultCache(store=DiskCache(cache_dir)), edited, ledger_reader(edited.df), "hierarchy_rollup", inputs)
+    assert after["team_leader"]["team_leader"].tolist() == ["Leader"]
+
+    customers = data.catalog.customers
+    pd.DataFrame({"alias": [customers[0]], "name": [customers[1]]}).to_csv(folder / NAME_ALIASES_FILE, index=False)
+    assert build_dataset(path).version not in (data.version, edited.version)
+    assert build_dataset(path).version == build_dataset(path).version
+
+
+# The SQLite store moves to a new version only with a complete dataset, and
+# pages of the dataset still served read its own rows meanwhile
+def test_store_keeps_the_served_version(tmp_path, monkeypatch):
+    path = _workbook(str(tmp_path / "data"))
+    store = LedgerStore(str(tmp_path / "ledger.db"))
+    data = build_dataset(path, store=store)
+    assert store.version() == data.version
+
+    sheet = synthetic_sheet(0, rows=80)
+    sheet.loc[5, "paid_amount"] = 999.0
+    sheet.to_excel(path, index=False)
+    with monkeypatch.context() as patch:
+        patch.setattr(refresher, "build_aging", lambda df: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            build_dataset(path, store=store, previous=data)
+    assert store.version() == data.version
+
+    edited = build_dataset(path, store=store, previous=data)
+    assert store.version() == edited.version
+    served = ledger_reader(data.df, store, data.version)()
+    assert served["paid_amount"].sum() == data.df["paid_amount"].sum()
+    assert ledger_reader(edited.df, store, edited.version)()["paid_amount"].sum() == edited.df["paid_amount"].sum()
+    assert store.transactions(version=data.version) is None
+    store.close()
+
+
+# A workbook imported from the command line carries the version the app gives
+# it; rows stored without a version match no dataset
+def test_imported_store_version(tmp_path):
+    path = _workbook(str(tmp_path / "data"))
+    store = LedgerStore(str(tmp_path / "ledger.db"))
+    store.replace(prepare_ledger(synthetic_sheet(1, rows=20))[0], "stale")
+    df, _ = store.import_excel(path)
+    data = build_dataset(path)
+    assert store.version() == data.version
+    assert len(ledger_reader(None, store, data.version)()) == len(data.df)
+
+    store.replace(df)
+    assert store.version() is None
+    assert store.transactions(version=data.version) is None
+    store.close()
+
+
+# Broken or missing product files are reported; the ledger still loads
+def test_product_files_never_fail_the_build(tmp_path):
+    folder = tmp_path / "data"
+    os.makedirs(folder)
+    path = str(folder / "sale_data.xlsx")
+    synthetic_sheet(0, rows=80).to_excel(path, index=False)
+    bundled = pd.read_csv(BUNDLED_CATALOG)
+
+    data = build_dataset(path)
+    rows = len(data.df)
+    assert len(data.products) == len(bundled)
+    assert data.product_issues["problem"].str.startswith("not found").tolist() == [True]
+
+    pd.concat([bundled, bundled.head(1)]).to_csv(folder / PRODUCT_CATALOG_FILE, index=False)
+    (folder / LINE_ITEMS_FILE).write_bytes(b"not a workbook")
+    data = build_dataset(path)
+    assert len(data.df) == rows and len(data.products) == len(bundled)
+    assert data.line_items is None and data.product_cube is None
+    problems = data.product_issues.set_index("file")["problem"]
+    assert "Duplicate SKU" in problems[str(folder / PRODUCT_CATALOG_FILE)]
+    assert problems[str(folder / LINE_ITEMS_FILE)].startswith("not used")
+
+    pd.DataFrame({"sku": ["FP-16"]}).to_excel(folder / LINE_ITEMS_FILE, index=False)
+    data = build_dataset(path)
+    assert data.line_items is None
+    assert "Missing required column" in data.product_issues.set_index("file")["problem"][str(folder / LINE_ITEMS_FILE)]
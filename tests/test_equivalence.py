@@ -0,0 +1,171 @@
+import os
+import shutil
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aging import AGING_BUCKETS, _items, build_aging, fifo_match
+from bitmaps import ActivityIndex
+from changes import diff_ledgers
+from cube import DIMENSIONS, build_daily_cube, update_daily_cube
+from goldens import assert_same_amounts
+from ledgers import ROOT, synthetic_sheet
+from products import PRODUCT_CATALOG_FILE
+from refresher import build_dataset
+from rolling import ROLLING_KEYS, build_rolling, rolling_metrics
+from schema import prepare_ledger
+from summaries import select_rows
+
+
+# ✅ Incremental and indexed structures against a plain recomputation
+# Edits and filters are drawn from fixed seeds, so a failure always reproduces.
+EDIT_SEEDS = (0, 1, 2)
+
+
+def _sorted_cube(cube):
+    return cube.sort_values(["date"] + DIMENSIONS, kind="mergesort", na_position="last").reset_index(drop=True)
+
+
+# A few corrected amounts, a moved day and a reassigned executive, as in a real re-save of the sheet
+def _edited(df, seed):
+    rng = np.random.default_rng(seed)
+    edited = df.copy()
+    rows = rng.choice(edited.index[edited["date"].notna()], 6, replace=False)
+    edited.loc[rows[:3], "paid_amount"] = np.round(edited.loc[rows[:3], "paid_amount"] + 1234.5, 2)
+    edited.loc[rows[3], "date"] = edited.loc[rows[3], "date"] + pd.Timedelta(days=1)
+    edited.loc[rows[4], "sales_executive"] = edited["sales_executive"].dropna().iloc[0]
+    edited.loc[rows[5], "sales_amount"] = 0.0
+    edited, _ = prepare_ledger(edited.drop(columns=["month", "customer_outstanding"]))
+    return edited
+
+
+@pytest.mark.parametrize("seed", EDIT_SEEDS)
+def test_incremental_cube_and_rolling(case, seed):
+    edited = _edited(case.df, seed)
+    changes = diff_ledgers(case.df, edited)
+    assert not changes.empty
+
+    cube = update_daily_cube(case.cube, edited, changes.dates)
+    assert_same_amounts(cube, _sorted_cube(build_daily_cube(edited)), f"{case.name}/cube")
+
+    rolling = build_rolling(cube, build_rolling(case.cube), changes.since)
+    for key in ROLLING_KEYS:
+        assert_same_amounts(rolling[key], rolling_metrics(cube, key), f"{case.name}/rolling {key}")
+
+
+def test_rolling_equals_window_sums(case):
+    for key in ROLLING_KEYS:
+        rolling = rolling_metrics(case.cube, key)
+        sample = rolling.sample(min(len(rolling), 40), random_state=0)
+        for _, row in sample.iterrows():
+            rows = case.cube[case.cube[key] == row[key]]
+            for window in (7, 30, 90):
+                in_window = rows[(rows["date"] > row["date"] - pd.Timedelta(days=window)) & (rows["date"] <= row["date"])]
+                assert abs(row[f"sales_{window}d"] - in_window["sales_amount"].sum()) <= 0.005
+                assert abs(row[f"deposits_{window}d"] - in_window["paid_amount"].sum()) <= 0.005
+
+
+def _random_ranges(df, n, seed):
+    rng = np.random.default_rng(seed)
+    days = df["date"].dropna().sort_values().unique()
+    for _ in range(n):
+        start, end = np.sort(rng.choice(len(days), 2))
+        yield pd.Timestamp(days[start]), pd.Timestamp(days[end])
+
+
+def test_activity_index_equals_nunique(case):
+    index = ActivityIndex(case.df)
+    known = case.df[case.df["customer_name"].notna()]
+    for date_range in list(_random_ranges(case.df, 20, seed=1)) + [None]:
+        rows = known if date_range is None else select_rows(known, date_range=date_range)
+        buying, paying = rows[rows["sales_amount"] > 0], rows[rows["paid_amount"] > 0]
+        assert index.distinct("buying", date_range) == buying["customer_name"].nunique()
+        assert index.distinct("paying", date_range) == paying["customer_name"].nunique()
+        assert index.distinct("any", date_range) == rows[rows["date"].notna()]["customer_name"].nunique()
+        per_exec = buying.groupby("sales_executive")["customer_name"].nunique()
+        by_exec = index.distinct("buying", date_range, by="sales_executive")
+        assert (by_exec.reindex(per_exec.index, fill_value=0) == per_exec).all()
+        assert (by_exec.drop(per_exec.index) == 0).all()
+
+
+# Customer by customer: credits pay the oldest debits first
+def _brute_force_fifo(df):
+    debits, credits = _items(df)
+    open_amounts = {}
+    for customer, customer_debits in debits.groupby("customer_name", sort=False):
+        queue = deque([row.sales_executive, row.date, row.amount] for row in customer_debits.itertuples())
+        credit = int(credits.loc[credits["customer_name"] == customer, "amount"].sum())
+        while queue and credit > 0:
+            paid = min(queue[0][2], credit)
+            queue[0][2] -= paid
+            credit -= paid
+            if queue[0][2] == 0:
+                queue.popleft()
+        for executive, date, amount in queue:
+            key = (customer, executive, date)
+            open_amounts[key] = open_amounts.get(key, 0) + amount
+    return open_amounts
+
+
+# Open items less unapplied credits are the outstanding of every named row,
+# undated opening balances included (aged as the oldest items)
+def test_fifo_aging_reconciles(case):
+    matches, open_items, unapplied = fifo_match(case.df)
+    known = case.df[case.df["customer_name"].notna()]
+    outstanding = known.groupby("customer_name")["customer_outstanding"].sum()
+    net = open_items.groupby("customer_name")["open_amount"].sum().sub(
+        unapplied.groupby("customer_name")["unapplied_amount"].sum(), fill_value=0)
+    assert ((net.reindex(outstanding.index, fill_value=0) - outstanding).abs() <= 0.005).all()
+
+    aging = build_aging(case.df)
+    for key in ("customer", "executive"):
+        metrics = aging[key]
+        assert abs(metrics["open_amount"].sum() - open_items["open_amount"].sum()) <= 0.005 * len(metrics)
+        buckets = metrics[[label for _, _, label in AGING_BUCKETS]].sum(axis=1)
+        assert ((buckets - metrics["open_amount"]).abs() <= 0.005).all()
+    undated = open_items[open_items["debit_date"].isna()]
+    oldest = aging["customer"].set_index("customer_name")[AGING_BUCKETS[-1][2]]
+    assert (oldest.reindex(undated["customer_name"]).to_numpy() >= undated["open_amount"].to_numpy() - 0.005).all()
+
+    expected = _brute_force_fifo(case.df)
+    actual = {(row.customer_name, row.sales_executive, row.debit_date): round(row.open_amount * 100)
+              for row in open_items.itertuples() if round(row.open_amount * 100) != 0}
+    assert actual == {key: amount for key, amount in expected.items() if amount != 0}
+
+
+def test_sqlite_rows_equal_pandas_rows(case):
+    rng = np.random.default_rng(2)
+    columns = list(case.df.columns)
+    for date_range in _random_ranges(case.df, 10, seed=3):
+        executive = rng.choice(case.catalog.executives + [None])
+        types = [t for t in case.catalog.types if rng.random() < 0.5] or None
+        filters = {"executive": executive, "customer_types": types, "date_range": (date_range[0].date(), date_range[1].date())}
+        expected = select_rows(case.df, **filters).reset_index(drop=True)
+        actual = case.store.transactions(**filters)[columns].reset_index(drop=True)
+        assert_same_amounts(actual, expected, f"{case.name}/sqlite {filters}")
+
+
+# A workbook edited between two reloads: the incremental build equals a full one
+def test_incremental_build_dataset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(os.path.join(ROOT, PRODUCT_CATALOG_FILE), tmp_path / PRODUCT_CATALOG_FILE)
+    path = str(tmp_path / "sale_data.xlsx")
+    sheet = synthetic_sheet(0, rows=150)
+    sheet.to_excel(path, index=False)
+    previous = build_dataset(path)
+
+    sheet.loc[10, "paid_amount"] = 777.77
+    sheet.loc[40, "sales_executive"] = sheet.loc[41, "sales_executive"]
+    sheet = pd.concat([sheet, sheet.tail(2).assign(sales_amount=5000.0)], ignore_index=True)
+    sheet.to_excel(path, index=False)
+    incremental = build_dataset(path, previous=previous)
+    full = build_dataset(path)
+
+    assert incremental.version == full.version
+    assert not incremental.changes.empty
+    assert_same_amounts(incremental.cube, _sorted_cube(full.cube), "cube")
+    for key in ROLLING_KEYS:
+        assert_same_amounts(incremental.rolling[key], full.rolling[key], f"rolling {key}")
+    assert_same_amounts(incremental.anomalies, full.anomalies, "anomalies")
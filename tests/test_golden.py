@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import reference
+from cache import DiskCache, ResultCache
+from compare import compare_all
+from goldens import assert_matches_golden, assert_same_amounts, updating, write_golden
+from hierarchy import rollup
+from snapshots import monthly_totals
+from summaries import (
+    commission_summary,
+    customer_dues,
+    customer_sales,
+    daily_recap,
+    date_summary,
+    home_kpis,
+    ledger_reader,
+    month_overview,
+)
+from warmup import get_result
+
+
+# ✅ Every faster path the pages use, against the goldens of the original page code
+SALES_MEASURES = ["sales_amount", "paid_amount", "sales_return", "customer_cashback",
+                  "executive_commission", "teamleader_commission", "gm_commission"]
+COMMISSION_COLUMNS = {
+    "sales_executive": "Executive",
+    "executive_commission": "Executive Commission",
+    "teamleader_commission": "Team Leader Commission",
+    "gm_commission": "GM Commission",
+}
+
+
+# Pages read the ledger through pandas masks, or SQLite when a store is configured
+@pytest.fixture(params=["pandas", "sqlite"])
+def rows(request, case):
+    return ledger_reader(case.df, case.store if request.param == "sqlite" else None)
+
+
+def test_reference_matches_golden(case):
+    for name, frame in reference.page_outputs(case.df, case.today, case.date_range).items():
+        if updating():
+            write_golden(frame, case.name, name)
+        assert_matches_golden(frame, case.name, name)
+
+
+def test_month_overview(case):
+    overview = month_overview(case.df, case.snapshots, case.today.strftime("%Y-%m"))
+    assert_matches_golden(pd.DataFrame([overview["kpis"]]), case.name, "kpis")
+    assert_matches_golden(pd.DataFrame([home_kpis(case.df, case.today)]), case.name, "kpis")
+    assert_matches_golden(overview["executives"], case.name, "exec_summary")
+    assert_matches_golden(overview["top_customers"], case.name, "top_customers")
+
+
+def test_month_summary_from_snapshots(case):
+    totals = monthly_totals(case.snapshots)[["month", "sales_amount", "paid_amount"]]
+    assert_matches_golden(totals, case.name, "month_summary")
+
+
+def test_grouped_exec_from_cube_and_snapshots(case):
+    columns = ["openning_balance", "sales_amount", "sales_return", "paid_amount", "customer_cashback", "customer_outstanding"]
+    # The daily cube has dated rows only; the snapshots carry the undated ones too
+    undated = case.df[case.df["date"].isna()]
+    for source in (pd.concat([case.cube, undated], ignore_index=True), case.snapshots):
+        grouped = source.groupby("sales_executive")[columns].sum().reset_index()
+        assert_matches_golden(grouped, case.name, "grouped_exec")
+
+
+def test_exec_dues(case, rows):
+    dues = pd.concat([
+        customer_dues(rows(executive=executive)).assign(sales_executive=executive)
+        for executive in case.catalog.executives_sorted
+    ], ignore_index=True)
+    assert_matches_golden(dues, case.name, "exec_dues")
+
+
+def test_exec_sales(case, rows):
+    sales = pd.concat([
+        customer_sales(rows(executive=executive, date_range=case.date_range)).assign(sales_executive=executive)
+        for executive in case.catalog.executives_sorted
+    ], ignore_index=True)
+    assert_matches_golden(sales, case.name, "exec_sales")
+
+
+def test_date_summary(case, rows):
+    assert_matches_golden(date_summary(rows(date_range=case.date_range)), case.name, "date_summary")
+
+
+def test_type_sales(case, rows):
+    filtered = rows(customer_types=case.catalog.types, date_range=case.date_range)
+    measures = {measure: "sum" for measure in SALES_MEASURES}
+    assert_matches_golden(customer_sales(filtered), case.name, "type_sales_customers")
+    executives = filtered.groupby("sales_executive").agg(measures).reset_index().rename(columns={"sales_executive": "Executive"})
+    assert_matches_golden(executives, case.name, "type_sales_executives")
+
+
+def test_daily_recap(case, rows):
+    daily_summary, cust_daily, exec_daily = daily_recap(rows(date_range=case.date_range))
+    assert_matches_golden(daily_summary, case.name, "daily_summary")
+    assert_matches_golden(cust_daily, case.name, "cust_daily")
+    assert_matches_golden(exec_daily, case.name, "exec_daily")
+
+
+def test_exec_comm(case, rows):
+    assert_matches_golden(commission_summary(rows(date_range=case.date_range)), case.name, "exec_comm")
+
+
+# The hierarchy rollup and the period comparison sum the daily cube instead of the ledger
+def test_cube_rollup_and_compare(case):
+    by_exec = rollup(case.cube, case.hierarchy, case.date_range)["sales_executive"]
+    comm = by_exec[list(COMMISSION_COLUMNS)].rename(columns=COMMISSION_COLUMNS)
+    assert_matches_golden(comm.sort_values("Executive", kind="mergesort"), case.name, "exec_comm")
+
+    compared = compare_all(case.cube, case.date_range, case.date_range)["sales_executive"]
+    for period in ("a", "b"):
+        comm = compared[["sales_executive"] + [f"{c}_{period}" for c in list(COMMISSION_COLUMNS)[1:]]]
+        comm.columns = list(COMMISSION_COLUMNS.values())
+        assert_matches_golden(comm, case.name, "exec_comm")
+    assert (compared.filter(like="_delta") == 0).all().all()
+
+
+# Results served through the result cache: built once, then read back from
+# disk by a fresh cache (as after a restart)
+def test_cached_results(case, tmp_path):
+    data = SimpleNamespace(version=case.name, df=case.df, snapshots=case.snapshots, cube=case.cube, hierarchy=case.hierarchy)
+    rows = ledger_reader(case.df, case.store)
+    requests = [
+        ("month_overview", (case.today.strftime("%Y-%m"),)),
+        ("exec_comm", case.date_range),
+        ("daily_recap", case.date_range),
+        ("date_summary", case.date_range),
+    ]
+    for attempt in ("built", "from disk"):
+        cache = ResultCache(store=DiskCache(str(tmp_path / "cache")))
+        results = {name: get_result(cache, data, rows, name, inputs) for name, inputs in requests}
+        assert_matches_golden(results["month_overview"]["executives"], case.name, "exec_summary")
+        assert_matches_golden(results["month_overview"]["top_customers"], case.name, "top_customers")
+        assert_matches_golden(results["exec_comm"], case.name, "exec_comm")
+        assert_matches_golden(results["date_summary"], case.name, "date_summary")
+        for frame, name in zip(results["daily_recap"], ("daily_summary", "cust_daily", "exec_daily")):
+            assert_matches_golden(frame, case.name, name)
+        if attempt == "from disk":
+            assert cache.store.hits == len(requests)
+
+
+def test_fast_paths_agree_exactly_on_row_selection(case):
+    # Same rows from pandas and SQLite, so any golden difference is in the sums
+    pandas_rows = ledger_reader(case.df)(date_range=case.date_range)
+    sqlite_rows = ledger_reader(case.df, case.store)(date_range=case.date_range)
+    assert len(pandas_rows) == len(sqlite_rows)
+    assert_same_amounts(
+        sqlite_rows[SALES_MEASURES].sum().to_frame().T,
+        pandas_rows[SALES_MEASURES].sum().to_frame().T,
+        f"{case.name}/range totals",
+    )
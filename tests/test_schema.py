@@ -0,0 +1,22 @@
+import pandas as pd
+
+from schema import prepare_ledger
+
+
+# ✅ Sheet validation: blank and whitespace-only cells
+def test_whitespace_only_cells_are_missing():
+    raw = pd.DataFrame({
+        "Date": ["2025-01-05", "2025-01-06", "2025-01-07", None],
+        "Customer Name": [" Rahim Store ", "   ", "Karim Store", "  "],
+        "Sales Executive": ["Nirob", "Nirob", "\t", None],
+        "Sales Amount": [100, 200, 300, 0],
+        "Paid Amount": [0, 0, 50, 0],
+    })
+    df, issues = prepare_ledger(raw)
+    assert len(df) == 3
+    assert df["customer_name"].tolist()[::2] == ["Rahim Store", "Karim Store"]
+    assert df["customer_name"].isna().tolist() == [False, True, False]
+    assert issues[["excel_row", "column", "problem"]].values.tolist() == [
+        [3, "customer_name", "missing value"],
+        [4, "sales_executive", "missing value"],
+    ]
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from goldens import assert_same_amounts
+from search import NameIndex, build_name_indexes, name_key
+from summaries import customer_sales, ledger_reader
+
+
+# ✅ Name search: merged spellings, prefix / fuzzy matches and the rows of a merged name
+def test_spellings_share_one_id():
+    assert name_key("Al - Madina Crockeries") == name_key("Al- Madina Crockeries") == "almadinacrockeries"
+    assert name_key("S.M Crockeries") == name_key("SM Crockeries")
+    assert name_key("M/S Sheikh & Sons") == name_key("Sheikh and Sons")
+    assert name_key("Jononi Enterprise (Mirpur-2)") != name_key("Jononi Enterprise")
+
+
+def test_search_ranks_prefix_then_fuzzy():
+    index = NameIndex(pd.Series({"Rahim Store": 5, "Karim Store": 9, "Rahman Traders": 2, "Store Rahim": 1}))
+    assert [entry.name for entry in index.search("rah")] == ["Rahim Store", "Rahman Traders", "Store Rahim"]
+    assert [entry.name for entry in index.search("store")][0] == "Store Rahim"
+    assert [entry.name for entry in index.search("rahin store")][0] == "Rahim Store"
+    assert [entry.name for entry in index.search("", limit=2)] == ["Karim Store", "Rahim Store"]
+    assert index.search("xyz") == []
+
+
+def test_aliases_and_possible_duplicates():
+    counts = pd.Series({"Bismillah Store": 3, "Bismilliah Store": 2, "Rahim Store": 4, "Rahim Store 2": 1, "Karim Store": 1})
+    duplicates = NameIndex(counts).possible_duplicates()
+    assert duplicates[["name", "similar_name"]].values.tolist() == [["Bismillah Store", "Bismilliah Store"]]
+
+    merged = NameIndex(counts, {"Bismilliah Store": "Bismillah Store"})
+    entry = merged.entry(merged.canonical("Bismilliah Store"))
+    assert (entry.name, entry.names, entry.rows) == ("Bismillah Store", ("Bismillah Store", "Bismilliah Store"), 5)
+    assert merged.possible_duplicates().empty
+
+
+# A merged customer's rows are the rows of all its spellings, from pandas and SQLite
+def test_merged_customer_rows(case):
+    index = build_name_indexes(case.df, aliases_path=str(case.folder / "no_aliases.csv"))["customer_name"]
+    assert sum(len(entry.names) for entry in index.entries) == case.df["customer_name"].nunique()
+    for entry in index.entries:
+        spellings = case.df[case.df["customer_name"].isin(entry.names)]
+        for store in (None, case.store):
+            rows = ledger_reader(case.df, store)(customer=entry.names)
+            assert len(rows) == len(spellings) == entry.rows
+            assert_same_amounts(customer_sales(rows), customer_sales(spellings), f"{case.name}/{entry.name}")
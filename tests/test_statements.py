@@ -0,0 +1,51 @@
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+
+from statements import build_statements, statements_zip, unique_file_names
+
+
+# ✅ Customer statements: the full-range closing due is the customer's outstanding
+def test_full_range_closing_due(case):
+    dates = case.df["date"].dropna()
+    summary, lines = build_statements(case.df, dates.min(), dates.max())
+    outstanding = case.df.groupby("customer_name")["customer_outstanding"].sum()
+    closing = summary.set_index("customer_name")["closing_due"].reindex(outstanding.index, fill_value=0.0)
+    assert ((closing - outstanding).abs() <= 0.005).all(), case.name
+
+    # The last running balance of a customer is their closing due
+    last = lines.groupby("customer_name")["running_balance"].last()
+    assert ((last - closing.reindex(last.index)).abs() <= 0.005).all(), case.name
+
+
+# A period after the first one starts from everything before it, undated rows included
+def test_opening_balance_carries_undated_rows(case):
+    start = case.date_range[0]
+    summary, _ = build_statements(case.df, start, case.date_range[1])
+    named = case.df[case.df["customer_name"].notna()]
+    before = named[named["date"].isna() | (named["date"] < pd.to_datetime(start))]
+    expected = before.groupby("customer_name")["customer_outstanding"].sum()
+    opening = summary.set_index("customer_name")["opening_balance"].reindex(expected.index, fill_value=0.0)
+    assert ((opening - expected).abs() <= 0.005).all(), case.name
+
+
+def test_file_names_are_unique():
+    names = ["A/B Store", "A?B Store", "a_b store", "A_B Store_2", "", "Rahim Store"]
+    assert unique_file_names(names) == ["A_B Store", "A_B Store_2", "a_b store_3", "A_B Store_2_2", "customer", "Rahim Store"]
+
+    df = pd.DataFrame({
+        "customer_name": ["A/B Store", "A?B Store"],
+        "date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+        "order_no": ["1", "2"],
+        "sales_executive": ["Nirob", "Nirob"],
+        "openning_balance": 0.0,
+        "sales_amount": [100.0, 200.0],
+        "sales_return": 0.0,
+        "paid_amount": 0.0,
+        "customer_cashback": 0.0,
+    })
+    df["customer_outstanding"] = df["sales_amount"]
+    summary, lines = build_statements(df, "2025-01-01", "2025-01-31")
+    with zipfile.ZipFile(BytesIO(statements_zip(summary, lines, "2025-01-01", "2025-01-31"))) as archive:
+        assert len(set(archive.namelist())) == len(archive.namelist()) == 3
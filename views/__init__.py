@@ -0,0 +1,64 @@
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+
+
+# ✅ Sidebar menu: page label -> module in views/
+# A page module is imported the first time the page is shown, so heavy
+# libraries (plotly, PIL) are loaded only by the pages that use them.
+PAGES = {
+    "🏠 Home": "home",                      #1
+    "📍 Dashboard": "dashboard",            #2
+    "💸 Sales": "sales",                    #3
+    "🧑‍💼 Exec Txns": "exec_txns",          #4
+    "🧑‍💳 Cust Txns": "cust_txns",          #5
+    "🧾 Cust Dues": "cust_dues",            #6
+    "🤝 Exec → Cust": "exec_cust",          #7
+    "📉 Exec Dues": "exec_dues",            #8
+    "📤 Exec Sales": "exec_sales",          #9
+    "🗓️ Date Summary": "date_summary",      #10
+    "🏷️ Cust by Type": "cust_by_type",      #11
+    "🗃️ Type Sales": "type_sales",          #12
+    "📆 Daily Recap": "daily_recap",        #13
+    "📈 Performance": "performance",        #14
+    "💸 Commissions": "commissions",        #15
+    "🛒 Products": "products",              #16
+    "👨‍💻 Analyst Bio": "analyst_bio",       #17
+    "💡 About": "about",                    #18
+    "🔀 Compare": "comparison",             #19
+    "👥 Cohorts": "cohorts",                #20
+    "🛠️ Admin": "admin",                    #21
+    "🧾 Changes": "audit",                  #22
+}
+
+
+# Shared objects the pages read (built once per rerun in main.py)
+@dataclass
+class PageContext:
+    data: object
+    df: object
+    catalog: object
+    cached: object
+    ledger_rows: object
+    refresher: object
+    result_cache: object
+    usage: object
+
+
+# Seconds spent importing each page module on its first visit (this process)
+import_seconds = {}
+
+
+def load_page(label):
+    name = f"views.{PAGES[label]}"
+    module = sys.modules.get(name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        import_seconds[PAGES[label]] = time.perf_counter() - started
+    return module
+
+
+def render_page(label, ctx):
+    load_page(label).render(ctx)
@@ -0,0 +1,55 @@
+import streamlit as st
+from PIL import Image
+
+
+# 14. About Us
+def render(ctx):
+    st.title("💼 About Us")
+    st.markdown("---")
+
+    # Company logo
+    logo = Image.open("logo.png")
+    st.image(logo, width=150, caption="WELBURG METAL PVT LTD")
+
+    st.subheader("🏢 Company Overview")
+    st.markdown("""
+**WELBURG METAL PVT LTD** is a Bangladesh-based company focused on delivering high-quality **All kinds of kitchenware and cockware importer and manufucrar**. We are committed to excellence, durability, and customer satisfaction across all our operations.
+    """)
+
+    st.subheader("📍 Company Details")
+    st.markdown("""
+- **Name:** WELBURG METAL PVT LTD  
+- **Address:** Sadapur, Nagorkonda, Savar, Dhaka, Bangladesh  
+- **Contact:** 01787933422  
+- **Email:** welburgmetal2021@gmail.com
+    """)
+
+    st.subheader("👨‍💼 Owner Information")
+
+    # Managing Director photo
+    md_pic = Image.open("md_pic.jpg")
+    st.image(md_pic, width=150, caption="Md. Hasanuzzaman Helal")
+
+    st.markdown("""
+- **Name:** Md. Hasanuzzaman Helal  
+- **Position:** Managing Director  
+- **Contact:** 01958385999  
+- **Email:** hazanuzzaman@welburgmetal.com
+    """)
+
+    st.subheader("🛠️ Our Products")
+    st.markdown("""
+We specialize in:
+- All kinds of cock and kitchenware Products
+- Customized metal solutions (as per demand)
+- Industrial-grade cookware and accessories
+    """)
+
+    st.subheader("🎯 Our Mission")
+    st.markdown("To be a reliable leader in the steel industry, providing top-quality products and services that exceed customer expectations.")
+
+    st.subheader("🌱 Our Vision")
+    st.markdown("To support Bangladesh's industrial growth through innovation, quality, and long-term partnerships.")
+
+    st.subheader("🤝 Get in Touch")
+    st.markdown("We welcome your queries, suggestions, and partnership opportunities. Let’s build the future together!")
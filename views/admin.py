@@ -0,0 +1,116 @@
+import pandas as pd
+import streamlit as st
+
+from cache import estimate_size
+from search import NAME_ALIASES_FILE
+from views import import_seconds
+
+
+# 21. Admin: data & cache statistics
+def render(ctx):
+    data, df, cached, refresher, result_cache, usage = ctx.data, ctx.df, ctx.cached, ctx.refresher, ctx.result_cache, ctx.usage
+    st.title("🛠️ Data & Cache Statistics")
+    st.markdown("---")
+
+    # Loaded dataset (one shared copy per server process)
+    st.markdown("### 📦 Dataset")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Rows", f"{len(df):,}")
+    col2.metric("Memory", f"{estimate_size(df) / 1024 / 1024:,.2f} MB")
+    col3.metric("Reloads", refresher.reloads)
+    col4.metric("Last Build", f"{refresher.last_build_seconds or 0:.2f} s")
+    st.write(f"**Version:** {data.version} | **Data as of:** {data.modified_at:%Y-%m-%d %H:%M:%S} | "
+             f"**Built at:** {data.built_at:%Y-%m-%d %H:%M:%S} | **Failed reloads:** {refresher.failures}")
+
+    # Result cache
+    st.markdown("### 🗄️ Result Cache")
+    summary = result_cache.summary()
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Entries", summary["entries"])
+    col2.metric("Size", f"{summary['bytes'] / 1024 / 1024:,.2f} / {summary['max_bytes'] / 1024 / 1024:,.0f} MB")
+    col3.metric("Hit Ratio", f"{summary['hit_ratio']:.0%}")
+    col4.metric("Hits / Misses", f"{summary['hits']} / {summary['misses']}")
+    col5.metric("Evictions", summary["evictions"])
+    st.write(f"**Coalesced requests (single-flight):** {summary['coalesced']} | **In flight now:** {summary['in_flight']}")
+
+    st.markdown("#### Entries")
+    st.dataframe(result_cache.entries(), use_container_width=True)
+
+    st.markdown("#### Eviction Log")
+    st.dataframe(result_cache.eviction_log(), use_container_width=True)
+
+    # Disk tier (survives restarts, shared by worker processes)
+    if result_cache.store is not None:
+        disk = result_cache.store.summary()
+        st.markdown("#### 💾 Disk Cache")
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Files", disk["files"])
+        col2.metric("Size", f"{disk['bytes'] / 1024 / 1024:,.2f} / {disk['max_bytes'] / 1024 / 1024:,.0f} MB")
+        col3.metric("Hit Ratio", f"{disk['hit_ratio']:.0%}")
+        col4.metric("Hits / Misses", f"{disk['hits']} / {disk['misses']}")
+        col5.metric("Evictions", disk["evictions"])
+        st.write(f"**Directory:** {disk['directory']} | **Writes:** {disk['writes']} | "
+                 f"**Not stored (unsupported type):** {disk['skipped']} | **Errors:** {disk['errors']}")
+
+    if st.button("🧹 Clear Result Cache", key="clear_result_cache"):
+        result_cache.clear()
+        st.success("Result cache cleared.")
+
+    # Warm-up of the latest dataset and the requests that drive it (see warmup.py)
+    st.markdown("### 🔥 Warm-up")
+    warmup = refresher.last_warmup
+    if warmup is None:
+        st.info("No warm-up has run in this process.")
+    else:
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Results Warmed", len(warmup["results"]))
+        col2.metric("Warm-up Time", f"{warmup['seconds']:.2f} s")
+        col3.metric("Errors", len(warmup["errors"]))
+        st.write(f"**Version:** {warmup['version']} | **Finished at:** {warmup['finished_at']:%Y-%m-%d %H:%M:%S}")
+        st.dataframe(
+            pd.DataFrame([{"name": name, "inputs": repr(inputs)} for name, inputs in warmup["results"]], columns=["name", "inputs"]),
+            use_container_width=True
+        )
+        for error in warmup["errors"]:
+            st.warning(error)
+    st.markdown("#### Most Requested Results (last 7 days)")
+    st.caption("WARMUP_VIEWS lists the results always warmed, WARMUP_TOP how many of these are warmed too.")
+    st.dataframe(usage.table().assign(inputs=lambda t: t["inputs"].map(repr)), use_container_width=True)
+
+    # Names merged under one ID, and similar ones that may need an alias (see search.py)
+    st.markdown("### 🔎 Name Search")
+    for column, title in (("customer_name", "Customers"), ("sales_executive", "Executives")):
+        index = data.names[column]
+        merged = [{"name": entry.name, "also recorded as": ", ".join(entry.names[1:]), "rows": entry.rows}
+                  for entry in index.entries if len(entry.names) > 1]
+        st.write(f"**{title}:** {len(index):,} names, {len(merged):,} with more than one spelling")
+        if merged:
+            st.dataframe(pd.DataFrame(merged), use_container_width=True)
+    if st.button("Find Possible Duplicate Customers", key="possible_duplicates"):
+        duplicates = cached("possible_duplicates", (), lambda: data.names["customer_name"].possible_duplicates())
+        st.caption(f"Merge the real ones with {NAME_ALIASES_FILE} next to the workbook (columns: alias, name).")
+        st.dataframe(duplicates, use_container_width=True)
+
+    # Page modules imported so far in this process (first visit only)
+    st.markdown("### ⏱️ Page Import Times")
+    st.caption("Each page module is imported on its first visit; run `python importtime.py` for cold-start timings.")
+    st.dataframe(
+        pd.DataFrame({"page": list(import_seconds), "import_ms": [s * 1000 for s in import_seconds.values()]}),
+        use_container_width=True
+    )
+
+    # Metrics export
+    st.download_button(
+        label="Download Metrics (Prometheus text)",
+        data=result_cache.metrics_text(),
+        file_name="cache_metrics.prom",
+        mime="text/plain",
+        key="metrics_download"
+    )
+    st.download_button(
+        label="Download Cache Entries as CSV",
+        data=result_cache.entries().to_csv(index=False),
+        file_name="cache_entries.csv",
+        mime="text/csv",
+        key="cache_entries_download"
+    )
@@ -0,0 +1,34 @@
+import streamlit as st
+
+
+# 16. About data analyst
+def render(ctx):
+    st.title("📊 About Data Analyst")
+    st.write("""
+A **Data Analyst** is a professional who collects, processes, and analyzes data to help organizations make informed decisions.
+
+As a **Data Analyst**, I work with raw data, clean and transform it, then generate insights through reports, dashboards, and visualizations.
+
+#### 🔍 Responsibilities:
+- Gathering data from various sources (e.g., Excel, databases, APIs)
+- Cleaning and preprocessing data using Python or tools like Excel
+- Using tools like **Pandas**, **NumPy**, **Google Sheets**, or **SQL**
+- Creating reports, dashboards, and visual insights using **Streamlit**, **Plotly**, or **Matplotlib**
+- Supporting business decisions with data-driven insights
+
+#### 🧠 Key Tools I Use:
+- **Python** – Core language for data manipulation
+- **Pandas & NumPy** – Data wrangling and computation
+- **Streamlit** – Interactive dashboards
+- **Google Sheets** – Simple but powerful analytics
+- **SQL** – Querying structured data
+- **Plotly / Seaborn / Matplotlib** – For stunning visualizations
+
+#### 💡 My Experience:
+With experience in **pharmacy, inventory, and sales data**, I specialize in turning raw business data into easy-to-understand dashboards and reports for decision-makers.
+
+Whether it's **tracking sales**, **managing customer dues**, or **monitoring executive performance**, I bring real-world data into action.
+
+    """)
+
+    st.success("Let data talk, and let businesses grow smarter with insights!")
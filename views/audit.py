@@ -0,0 +1,61 @@
+import pandas as pd
+import streamlit as st
+
+from changes import changes_workbook
+
+
+# 22. Data change audit
+def render(ctx):
+    data, refresher, result_cache = ctx.data, ctx.refresher, ctx.result_cache
+    st.title("🧾 Data Change Audit")
+    st.markdown("---")
+    st.caption("Rows inserted, deleted or edited in the workbook since the app started, "
+               "and how much of the derived data each reload had to rebuild.")
+
+    if not refresher.change_log:
+        st.info(f"No rows have changed since the app started (version {data.version}).")
+        st.stop()
+
+    log = list(reversed(refresher.change_log))
+    labels = [
+        f"{c.detected_at:%Y-%m-%d %H:%M:%S}: {c.previous_version} → {c.version} ({len(c.rows)} row(s))"
+        for c in log
+    ]
+    selected = st.selectbox("Reload", range(len(log)), format_func=lambda i: labels[i], key="audit_reload")
+    changes = log[selected]
+
+    counts = changes.counts()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Inserted", counts["inserted"])
+    col2.metric("Deleted", counts["deleted"])
+    col3.metric("Modified", counts["modified"])
+    col4.metric("Days Rebuilt", f"{changes.stats.get('cube_days_rebuilt', 0)} / {changes.stats.get('cube_days', 0)}")
+    st.write(
+        f"**Executives touched:** {len(changes.since['sales_executive'])} | "
+        f"**Customers touched:** {len(changes.since['customer_name'])} | "
+        f"**Cached results carried forward (all reloads):** {result_cache.carried}"
+    )
+
+    st.markdown("### 📝 Changed Rows")
+    st.caption("old_row / new_row are ledger row positions (0-based, blank sheet rows skipped) in the previous and new version.")
+    st.dataframe(changes.rows, use_container_width=True)
+
+    st.markdown("### 🔍 Before / After")
+    st.dataframe(changes.fields, use_container_width=True)
+
+    st.markdown("### 📅 Affected Days & Keys")
+    st.write(", ".join(f"{day:%Y-%m-%d}" for day in changes.dates) or "No dated rows changed.")
+    touched = pd.concat(
+        [since.rename("first_changed_day").rename_axis("value").reset_index().assign(dimension=dimension)
+         for dimension, since in changes.since.items()],
+        ignore_index=True
+    )[["dimension", "value", "first_changed_day"]]
+    st.dataframe(touched, use_container_width=True)
+
+    st.download_button(
+        label="Download Changes as Excel",
+        data=changes_workbook(changes),
+        file_name=f"changes_{changes.previous_version}_{changes.version}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="audit_download"
+    )
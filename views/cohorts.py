@@ -0,0 +1,48 @@
+import plotly.express as px
+import streamlit as st
+
+from cohorts import RETENTION_MONTHS, cohorts_workbook
+
+
+# 20. Customer cohorts & retention
+def render(ctx):
+    cached = ctx.cached
+    st.title("👥 Customer Cohorts & Retention")
+    st.markdown("---")
+    st.caption("Customers are grouped by the month of their first purchase; columns are months since that purchase.")
+
+    cohorts = cached("cohorts", ())
+    if cohorts["summary"].empty:
+        st.info("No sales in the data yet.")
+        st.stop()
+
+    views = {
+        "Retention %": "retention",
+        "Active Customers": "customers",
+        "Revenue": "revenue",
+        "Revenue per Cohort Customer": "revenue_per_customer",
+    }
+    selected_view = st.radio("Show", list(views), horizontal=True, key="cohort_view")
+    matrix = cohorts[views[selected_view]]
+
+    fig_cohort = px.imshow(
+        matrix,
+        text_auto=".1f" if views[selected_view] == "retention" else ",.0f",
+        aspect="auto",
+        color_continuous_scale="Blues",
+        labels={"x": "Months Since First Purchase", "y": "Cohort", "color": selected_view},
+        title=f"{selected_view} by Cohort"
+    )
+    st.plotly_chart(fig_cohort, use_container_width=True)
+    st.dataframe(matrix, use_container_width=True)
+
+    st.markdown(f"### 📋 Retention after {', '.join(str(m) for m in RETENTION_MONTHS)} Months")
+    st.dataframe(cohorts["summary"], use_container_width=True)
+
+    st.download_button(
+        label="Download Cohort Workbook as Excel",
+        data=cohorts_workbook(cohorts),
+        file_name="customer_cohorts.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="cohort_download"
+    )
@@ -0,0 +1,67 @@
+from io import BytesIO
+
+import streamlit as st
+
+from hierarchy import UNASSIGNED
+
+
+# 17. Sales commission
+def render(ctx):
+    data, df, cached = ctx.data, ctx.df, ctx.cached
+    st.title("💸 Date Range Wise Executive, Team Leader & GM Commission")
+    st.markdown("---")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="commission_date")
+
+    # Show commission summary (rows in the date range grouped by executive, see warmup.RESULTS)
+    st.markdown("### 🧑‍💼 Executive-wise Commission Summary")
+    exec_comm = cached("exec_comm", date_range)
+    st.dataframe(exec_comm, use_container_width=True)
+
+    # Show totals
+    totals = exec_comm[["Executive Commission", "Team Leader Commission", "GM Commission"]].sum()
+    st.success(
+        f"**Total Executive Commission:** {totals['Executive Commission']:,.2f} | "
+        f"**Total Team Leader Commission:** {totals['Team Leader Commission']:,.2f} | "
+        f"**Total GM Commission:** {totals['GM Commission']:,.2f}"
+    )
+
+    # Download button for commission summary
+    output_comm = BytesIO()
+    exec_comm.to_excel(output_comm, index=False, engine='openpyxl')
+    output_comm.seek(0)
+    st.download_button(
+        label="Download Commission Summary as Excel",
+        data=output_comm,
+        file_name=f"commission_summary_{date_range[0]}_{date_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="commission_download"
+    )
+
+    st.markdown("---")
+
+    # --- Hierarchy drill-down: GM -> Team Leader -> Executive ---
+    st.markdown("### 🏢 Commission Rollup (GM → Team Leader → Executive)")
+    levels = cached("hierarchy_rollup", date_range)
+    if (data.hierarchy["team_leader"] == UNASSIGNED).all():
+        st.info("No sales_hierarchy.csv found (columns: sales_executive, team_leader, gm), all executives are shown as Unassigned.")
+
+    st.markdown("#### GM-wise")
+    st.dataframe(levels["gm"], use_container_width=True)
+
+    gm_names = levels["gm"]["gm"].tolist()
+    selected_gm = st.selectbox("Drill down into GM", gm_names, key="rollup_gm")
+    gm_leaders = levels["team_leader"][levels["team_leader"]["gm"] == selected_gm]
+    st.markdown(f"#### Team Leaders under {selected_gm}")
+    st.dataframe(gm_leaders, use_container_width=True)
+
+    leader_names = gm_leaders["team_leader"].tolist()
+    selected_leader = st.selectbox("Drill down into Team Leader", leader_names, key="rollup_leader")
+    leader_execs = levels["sales_executive"][
+        (levels["sales_executive"]["gm"] == selected_gm) &
+        (levels["sales_executive"]["team_leader"] == selected_leader)
+    ]
+    st.markdown(f"#### Executives under {selected_leader}")
+    st.dataframe(leader_execs, use_container_width=True)
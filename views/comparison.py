@@ -0,0 +1,56 @@
+import pandas as pd
+import streamlit as st
+
+
+# 19. Period comparison
+def render(ctx):
+    df, cached = ctx.df, ctx.cached
+    from compare import comparison_workbook, previous_period
+
+    st.title("🔀 Period-over-Period Comparison")
+    st.markdown("---")
+
+    mode = st.radio("Compare", ["Month over Month", "Year over Year", "Custom"], horizontal=True, key="compare_mode")
+
+    # Period B defaults to the latest month in the data
+    min_date, max_date = df["date"].min(), df["date"].max()
+    latest_month_start = max(max_date.replace(day=1), min_date)
+    period_b = st.date_input("Period B (current)", [latest_month_start, max_date], key="compare_period_b")
+    if len(period_b) < 2:
+        st.stop()
+
+    if mode == "Custom":
+        period_a = st.date_input("Period A (baseline)", [min_date, latest_month_start - pd.Timedelta(days=1)], key="compare_period_a")
+        if len(period_a) < 2:
+            st.stop()
+    else:
+        period_a = previous_period(period_b, "MoM" if mode == "Month over Month" else "YoY")
+        st.write(f"**Period A (baseline):** {period_a[0]} to {period_a[1]}")
+
+    results = cached("compare", (*period_a, *period_b))
+
+    dimension_labels = {"Executive": "sales_executive", "Customer": "customer_name", "Customer Type": "customer_type"}
+    selected_dimension = st.selectbox("Compare by", list(dimension_labels), key="compare_by")
+    comparison = results[dimension_labels[selected_dimension]]
+
+    st.subheader(f"{selected_dimension}-wise: {period_a[0]} – {period_a[1]} vs {period_b[0]} – {period_b[1]}")
+    number_cols = [col for col in comparison.columns if col != dimension_labels[selected_dimension]]
+    st.dataframe(
+        comparison.style.format({col: "{:,.2f}" for col in number_cols}, na_rep="–"),
+        use_container_width=True
+    )
+
+    totals = comparison[["sales_amount_a", "sales_amount_b", "paid_amount_a", "paid_amount_b"]].sum()
+    st.success(
+        f"**Sales:** {totals['sales_amount_a']:,.2f} → {totals['sales_amount_b']:,.2f} | "
+        f"**Deposit:** {totals['paid_amount_a']:,.2f} → {totals['paid_amount_b']:,.2f}"
+    )
+
+    # Download button for all comparisons (one sheet per dimension)
+    st.download_button(
+        label="Download Comparison Workbook as Excel",
+        data=comparison_workbook(results, period_a, period_b),
+        file_name=f"comparison_{period_a[0]}_{period_a[1]}_vs_{period_b[0]}_{period_b[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="compare_download"
+    )
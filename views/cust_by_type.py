@@ -0,0 +1,78 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 11. Customer Category-wise Transactions
+def render(ctx):
+    data, df, catalog, ledger_rows = ctx.data, ctx.df, ctx.catalog, ctx.ledger_rows
+    st.header("📅 Date Range & Customer Category-wise Sales, Deposit, Return & Commission")
+
+    # Select customer category
+    categories = catalog.types
+    selected_category = st.selectbox("Select Customer Category", categories, key="cust_cat")
+
+    # Optionally one customer of the category (type -> customers from the catalog)
+    customers = [None] + sorted(catalog.customers_of_type(selected_category))
+    selected_customer = st.selectbox(
+        "Select Customer", customers, format_func=lambda name: "All customers" if name is None else name, key="cust_cat_customer"
+    )
+    if selected_customer is not None:
+        st.caption(f"Sales executive(s): {', '.join(catalog.executives_for(selected_customer))}")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="cust_cat_date")
+
+    # Filter data by category and date range
+    if selected_category is not None:
+        filtered = ledger_rows(customer=selected_customer, customer_types=[selected_category], date_range=date_range)
+
+        # Group by customer
+        summary = filtered.groupby("customer_name").agg({
+            "sales_amount": "sum",
+            "paid_amount": "sum",
+            "sales_return": "sum",
+            "customer_cashback": "sum",
+            "executive_commission": "sum",
+            "teamleader_commission": "sum",
+            "gm_commission": "sum"
+        }).reset_index()
+
+        st.subheader(f"Summary for '{selected_category}' from {date_range[0]} to {date_range[1]}")
+        st.dataframe(summary, use_container_width=True)
+
+        # Show totals
+        totals = summary[[
+            "sales_amount", "paid_amount", "sales_return", "customer_cashback",
+            "executive_commission", "teamleader_commission", "gm_commission"
+        ]].sum()
+        st.success(
+            f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+            f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+            f"**Total Return:** {totals['sales_return']:,.2f} | "
+            f"**Total Customer Cashback:** {totals['customer_cashback']:,.2f} | "
+            f"**Total Executive Commission:** {totals['executive_commission']:,.2f} | "
+            f"**Total Team Leader Commission:** {totals['teamleader_commission']:,.2f} | "
+            f"**Total GM Commission:** {totals['gm_commission']:,.2f}"
+        )
+
+        # Distinct active customers of the category in the range (bitmap index, see bitmaps.py)
+        active = data.activity.distinct_table(date_range, by="customer_type").set_index("customer_type")
+        active = active.reindex([selected_category], fill_value=0).iloc[0]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("👥 Buying Customers", active["buying_customers"])
+        col2.metric("💳 Paying Customers", active["paying_customers"])
+        col3.metric("🤝 Active Customers", active["any_customers"])
+
+        # Download button for summary
+        output_cat = BytesIO()
+        summary.to_excel(output_cat, index=False, engine='openpyxl')
+        output_cat.seek(0)
+        st.download_button(
+            label="Download Category-wise Transactions as Excel",
+            data=output_cat,
+            file_name=f"{selected_category}_transactions_{date_range[0]}_{date_range[1]}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="cat_download"
+        )
@@ -0,0 +1,64 @@
+import streamlit as st
+
+from views.pickers import name_picker
+
+
+# 6. Customer Outstanding
+def render(ctx):
+    data, df, cached, ledger_rows = ctx.data, ctx.df, ctx.cached, ctx.ledger_rows
+    st.header("📅 Customer-wise Date Range Summary")
+
+    # 1. Select customer
+    customer = name_picker(data.names["customer_name"], "Customer", key="summary_customer", select_label="Select Customer for Summary")
+    selected_customer = customer.name
+
+    # 2. Select date range
+    min_date, max_date = df['date'].min(), df['date'].max()
+    cust_range = st.date_input(
+        "Select Date Range for Customer Summary",
+        [min_date, max_date],
+        key="summary_customer_date"
+    )
+
+    # 3. Filter data
+    cust_filtered = ledger_rows(customer=customer.names, date_range=cust_range)
+
+    # 5. Calculate totals
+    cust_totals = {
+        "Total Sales": cust_filtered["sales_amount"].sum(),
+        "Total Deposit": cust_filtered["paid_amount"].sum(),
+        "Total Return": cust_filtered["sales_return"].sum(),
+        "Total Customer Cashback": cust_filtered["customer_cashback"].sum(),
+        "Total Outstanding": cust_filtered["customer_outstanding"].sum()
+    }
+
+    # 6. Show totals
+    st.subheader(f"Summary for {selected_customer} ({cust_range[0]} to {cust_range[1]})")
+    for k, v in cust_totals.items():
+        st.write(f"**{k}:** {v:,.2f}")
+
+    # 7. Show transactions
+    with st.expander("Show Transactions for Customer in Date Range"):
+        st.dataframe(cust_filtered, use_container_width=True)
+
+    st.markdown("---")
+
+    # 8. Month-end statements for every customer (opening, running balance, closing due)
+    st.subheader("📦 Statements for All Customers")
+    statement_range = st.date_input(
+        "Select Statement Period",
+        [min_date, max_date],
+        key="statement_date"
+    )
+    if st.button("Generate Statements", key="statement_generate"):
+        from statements import build_statements, statements_zip
+
+        summary, lines = cached("statements", statement_range, lambda: build_statements(df, *statement_range[:2]))
+        st.dataframe(summary, use_container_width=True)
+        st.download_button(
+            label=f"Download {len(summary):,} Customer Statements (zip)",
+            data=statements_zip(summary, lines, *statement_range[:2]),
+            file_name=f"customer_statements_{statement_range[0]}_{statement_range[1]}.zip",
+            mime="application/zip",
+            key="statement_download"
+        )
@@ -0,0 +1,40 @@
+from io import BytesIO
+
+import streamlit as st
+
+from views.pickers import name_picker
+
+
+# 5. Customer-wise Transactions
+def render(ctx):
+    data, df, ledger_rows = ctx.data, ctx.df, ctx.ledger_rows
+    # --- Customer-wise Section ---
+    st.header("Customer-wise Transactions")
+    customer = name_picker(data.names["customer_name"], "Customer", key="cust")
+    selected_customer = customer.name
+
+    # Date range for customer
+    min_date, max_date = df["date"].min(), df["date"].max()
+    cust_date_range = st.date_input("Select Date Range (Customer)", [min_date, max_date], key="cust_date")
+
+    cust_filtered = ledger_rows(customer=customer.names, date_range=cust_date_range)
+
+    st.subheader(f"All Transactions for: {selected_customer}")
+    st.dataframe(cust_filtered, use_container_width=True)
+    st.success(f"Total Outstanding: {cust_filtered['customer_outstanding'].sum():,.2f} BDT")
+    st.success(f"Sales Amount: {cust_filtered['sales_amount'].sum():,.2f} BDT")   
+    st.success(f"Paid Amount: {cust_filtered['paid_amount'].sum():,.2f} BDT")  
+    st.success(f"Sales Return: {cust_filtered['sales_return'].sum():,.2f} BDT")
+    st.success(f"Cashback: {cust_filtered['customer_cashback'].sum():,.2f} BDT")
+
+    # Download button for customer
+    output_cust = BytesIO()
+    cust_filtered.to_excel(output_cust, index=False, engine='openpyxl')
+    output_cust.seek(0)
+    st.download_button(
+        label="Download Customer Transactions as Excel",
+        data=output_cust,
+        file_name=f"{selected_customer}_transactions.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="cust_download"
+    )
@@ -0,0 +1,82 @@
+from io import BytesIO
+
+import plotly.express as px
+import streamlit as st
+
+
+# 13. Daily Sales Summary
+def render(ctx):
+    df, cached = ctx.df, ctx.cached
+    st.header("📅 Daily Sales, Deposit, Return & Due Summary")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="daily_sales")
+
+    # Filter data by date range and build the three daily summaries (see summaries.py)
+    daily_summary, cust_daily, exec_daily = cached("daily_recap", date_range)
+
+    st.subheader(f"Daily Summary from {date_range[0]} to {date_range[1]}")
+    st.dataframe(daily_summary, use_container_width=True)
+
+    st.markdown("### 👤 Customer-wise Daily Summary")
+    st.dataframe(cust_daily, use_container_width=True)
+
+    st.markdown("### 🧑‍💼 Executive-wise Daily Summary")
+    st.dataframe(exec_daily, use_container_width=True)
+
+    # Show totals
+    totals = daily_summary[["sales_amount", "paid_amount", "sales_return", "customer_cashback", "customer_outstanding"]].sum()
+    st.success(
+        f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+        f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+        f"**Total Return:** {totals['sales_return']:,.2f} | "
+        f"**Total Cashback:** {totals['customer_cashback']:,.2f} | "
+        f"**Total Due:** {totals['customer_outstanding']:,.2f}"
+    )
+
+    # Daily sales and deposit line chart
+    st.markdown("### 📈 Daily Sales & Deposit Trend")
+    fig_comm = px.line(
+        daily_summary,
+        x="Date",
+        y=["sales_amount", "paid_amount"],
+        markers=True,
+        labels={"value": "Amount", "Date": "Date", "variable": "Type"},
+        title="Daily Sales & Deposit Trend"
+    )
+    st.plotly_chart(fig_comm, use_container_width=True)
+
+    # Download buttons
+    output_daily = BytesIO()
+    daily_summary.to_excel(output_daily, index=False, engine='openpyxl')
+    output_daily.seek(0)
+    st.download_button(
+        label="Download Daily Sales Summary as Excel",
+        data=output_daily,
+        file_name=f"daily_sales_summary_{date_range[0]}_{date_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="daily_download"
+    )
+
+    output_cust = BytesIO()
+    cust_daily.to_excel(output_cust, index=False, engine='openpyxl')
+    output_cust.seek(0)
+    st.download_button(
+        label="Download Customer-wise Daily Summary as Excel",
+        data=output_cust,
+        file_name=f"customer_daily_summary_{date_range[0]}_{date_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="cust_daily_download"
+    )
+
+    output_exec = BytesIO()
+    exec_daily.to_excel(output_exec, index=False, engine='openpyxl')
+    output_exec.seek(0)
+    st.download_button(
+        label="Download Executive-wise Daily Summary as Excel",
+        data=output_exec,
+        file_name=f"executive_daily_summary_{date_range[0]}_{date_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_daily_download"
+    )
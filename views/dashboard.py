@@ -0,0 +1,92 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from snapshots import monthly_totals
+
+
+# 2. Dashboard
+def render(ctx):
+    data, cached = ctx.data, ctx.cached
+    st.header("🏢 WELBURG METAL PVT LTD")
+    st.title("📊 Sales & Deposit Dashboard")
+
+    # Current month metrics and total market due (all time), shared with Home
+    today = pd.Timestamp.today()
+    overview = cached("month_overview", (today.strftime("%Y-%m"),))
+    kpis = overview["kpis"]
+    deposit_amount = kpis["deposit_amount"]
+    sales_return = kpis["sales_return"]
+    customer_cashback = kpis["customer_cashback"]
+    actual_sales = kpis["actual_sales"]
+    total_market_due = kpis["total_market_due"]
+
+    # Executive-wise sales and due (current month)
+    exec_summary = overview["executives"]
+    snaps = data.snapshots
+
+    # Month-wise sales and deposit (bar chart)
+    month_summary = monthly_totals(snaps)[["month", "sales_amount", "paid_amount"]]
+
+    # KPI Cards
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    col1.metric("📅 Current Month", today.strftime("%B %Y"))
+    col2.metric("💰 Sales Amount", f"{actual_sales:,.2f}")
+    col3.metric("🏦 Deposit Amount", f"{deposit_amount:,.2f}")
+    col4.metric("🔄 Sales Return", f"{sales_return:,.2f}")
+    col5.metric("🎁 Cashback", f"{customer_cashback:,.2f}")
+    col6.metric("🧾 Market Due", f"{total_market_due:,.2f}")
+
+    st.markdown("---")
+
+    # Executive-wise Sales & Due Table
+    st.markdown("### Executive-wise Sales & Due (Current Month)")
+    st.dataframe(exec_summary, use_container_width=True)
+
+    st.markdown("---")
+
+    # Executive-wise Sales Bar Chart
+    st.markdown("### 🧑‍💼 Executive-wise Sales Bar Chart (Current Month)")
+    fig_exec = px.bar(
+        exec_summary,
+        x="sales_executive",
+        y=["sales_amount", "paid_amount", "due_amount"],
+        barmode="group",
+        labels={"value": "Amount", "sales_executive": "Executive", "variable": "Type"},
+        title="Executive-wise Sales, Deposit & Due"
+    )
+    st.plotly_chart(fig_exec, use_container_width=True)
+
+    st.markdown("---")
+
+    # Month-wise sales and deposit bar chart
+    st.markdown("### 📊 Month-wise Sales & Deposit")
+    fig = px.bar(
+        month_summary,
+        x="month",
+        y=["sales_amount", "paid_amount"],
+        barmode="group",
+        labels={"value": "Amount", "month": "Month", "variable": "Type"},
+        title="Month-wise Sales & Deposit"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("---")
+
+    # Sales Trend Line Chart (last 6 months)
+    st.markdown("### 📈 Sales Trend (Last 6 Months)")
+    last_6_months = month_summary.tail(6)
+    fig_trend = px.line(
+        last_6_months,
+        x="month",
+        y="sales_amount",
+        markers=True,
+        title="Sales Trend (Last 6 Months)"
+    )
+    st.plotly_chart(fig_trend, use_container_width=True)
+    st.markdown("---")
+
+    # Top 10 Customers by Sales in Current Month
+    st.markdown("### 🏅 Top 10 Customers by Sales (Current Month)")
+    top_customers = overview["top_customers"]
+    st.dataframe(top_customers, use_container_width=True)
@@ -0,0 +1,48 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 10. Date wise sales summary
+def render(ctx):
+    data, df, cached = ctx.data, ctx.df, ctx.cached
+    st.header("📅 Date-wise Sales Executive-wise Sales & Deposit Transactions")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="datewise_sales")
+
+    # Filter data by date range and group by date and sales executive (see summaries.py)
+    summary = cached("date_summary", date_range)
+
+    st.subheader(f"Summary from {date_range[0]} to {date_range[1]}")
+    st.dataframe(summary, use_container_width=True)
+
+    # Show totals
+    totals = summary[["sales_amount", "paid_amount", "sales_return", "customer_cashback"]].sum()
+    st.success(
+        f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+        f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+        f"**Total Return:** {totals['sales_return']:,.2f} | "
+        f"**Total Customer Cashback:** {totals['customer_cashback']:,.2f}"
+    )
+
+    # Distinct active customers in the range (bitmap index, see bitmaps.py)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("👥 Buying Customers", data.activity.distinct("buying", date_range))
+    col2.metric("💳 Paying Customers", data.activity.distinct("paying", date_range))
+    col3.metric("🤝 Active Customers", data.activity.distinct("any", date_range))
+    with st.expander("Distinct customers per executive"):
+        st.dataframe(data.activity.distinct_table(date_range, by="sales_executive"), use_container_width=True)
+
+    # Download button for summary
+    output_datewise = BytesIO()
+    summary.to_excel(output_datewise, index=False, engine='openpyxl')
+    output_datewise.seek(0)
+    st.download_button(
+        label="Download Date-wise Sales Summary as Excel",
+        data=output_datewise,
+        file_name=f"datewise_sales_summary_{date_range[0]}_{date_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="datewise_download"
+    )
@@ -0,0 +1,49 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 7. Executive wise customer
+def render(ctx):
+    catalog, ledger_rows = ctx.catalog, ctx.ledger_rows
+    st.header("Executive-wise Customer Transactions")
+
+    # Select sales executive
+    executives = catalog.executives
+    selected_exec = st.selectbox("Select Sales Executive", executives, key="exec_cust")
+
+    # Select customer (from the executive's customers in the catalog)
+    customers = catalog.customers_for(selected_exec)
+    selected_customer = st.selectbox("Select Customer", customers, key="exec_cust_select")
+
+    # Filter data for selected executive and customer
+    cust_filtered = ledger_rows(executive=selected_exec, customer=selected_customer)
+
+    # Show transactions
+    st.subheader(f"Transactions for {selected_customer} by {selected_exec}")
+    st.dataframe(cust_filtered, use_container_width=True)
+
+    # Show total outstanding for the customer
+    total_outstanding = cust_filtered["customer_outstanding"].sum()
+    st.success(f"Total Outstanding for {selected_customer}: {total_outstanding:,.2f} BDT")  
+    # Show total sales and deposit for the customer
+    total_sales = cust_filtered["sales_amount"].sum()
+    total_deposit = cust_filtered["paid_amount"].sum()
+    st.success(f"Total Sales for {selected_customer}: {total_sales:,.2f} BDT")
+    st.success(f"Total Deposit for {selected_customer}: {total_deposit:,.2f} BDT")
+    # Show total sales return and cashback for the customer
+    total_return = cust_filtered["sales_return"].sum()
+    total_cashback = cust_filtered["customer_cashback"].sum()
+    st.success(f"Total Sales Return for {selected_customer}: {total_return:,.2f} BDT")
+    st.success(f"Total Cashback for {selected_customer}: {total_cashback:,.2f} BDT")
+    # Download button for executive customer transactions
+    output_exec_cust = BytesIO()
+    cust_filtered.to_excel(output_exec_cust, index=False, engine='openpyxl')
+    output_exec_cust.seek(0)
+    st.download_button(
+        label="Download Executive Customer Transactions as Excel",
+        data=output_exec_cust,
+        file_name=f"{selected_exec}_{selected_customer}_transactions.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_cust_download"
+    )
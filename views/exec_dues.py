@@ -0,0 +1,79 @@
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from summaries import customer_dues
+
+
+# 8. Executive-wise Customer outstanding
+def render(ctx):
+    data, catalog, ledger_rows = ctx.data, ctx.catalog, ctx.ledger_rows
+    # Executive-wise, customer-wise total outstanding
+
+    st.header("🔎 Executive-wise Customer Outstanding")
+
+    # Select executive
+    exec_names = catalog.executives_sorted
+    selected_exec = st.selectbox("Select Sales Executive for Outstanding", exec_names, key="outstanding_exec")
+
+    # Filter for selected executive
+    exec_df = ledger_rows(executive=selected_exec)
+
+    # Group by customer and sum outstanding
+    customer_outstanding = customer_dues(exec_df)
+
+    st.subheader(f"Customer-wise Total Outstanding for {selected_exec}")
+    st.dataframe(customer_outstanding, use_container_width=True)
+
+    # Show total outstanding amount for the executive
+    total_outstanding = customer_outstanding["customer_outstanding"].sum()
+    st.success(f"Total Outstanding Amount for {selected_exec}: {total_outstanding:,.2f} BDT")
+    st.success(f"Total Sales Amount for {selected_exec}: {exec_df['sales_amount'].sum():,.2f} BDT")
+    st.success(f"Total Deposit Amount for {selected_exec}: {exec_df['paid_amount'].sum():,.2f} BDT")
+    st.success(f"Total Sales Return for {selected_exec}: {exec_df['sales_return'].sum():,.2f} BDT")
+    st.success(f"Total Customer Cashback for {selected_exec}: {exec_df['customer_cashback'].sum():,.2f} BDT")
+    # Download button for executive customer outstanding
+    output_exec_outstanding = BytesIO()
+    customer_outstanding.to_excel(output_exec_outstanding, index=False, engine='openpyxl')
+    output_exec_outstanding.seek(0)
+
+    st.download_button(
+        label="Download Executive Customer Outstanding as Excel",
+        data=output_exec_outstanding,
+        file_name=f"{selected_exec}_customer_outstanding.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_outstanding_download"
+    )
+
+    # --- Aging & collection (FIFO matching of deposits to sales, see aging.py) ---
+    st.markdown("---")
+    st.subheader(f"⏳ Aging & Collection for {selected_exec}")
+    exec_metrics = data.aging["executive"]
+    exec_metrics = exec_metrics[exec_metrics["sales_executive"] == selected_exec]
+    if exec_metrics.empty:
+        st.info("No sales or deposits to match for this executive.")
+    else:
+        row = exec_metrics.iloc[0]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("🚩 Overdue (> 30 days)", f"{row['overdue_amount']:,.2f}")
+        col2.metric("⏱️ Avg Collection Days", "-" if pd.isna(row["avg_collection_days"]) else f"{row['avg_collection_days']:.1f}")
+        col3.metric("📅 DSO (90 days)", "-" if pd.isna(row["dso_days"]) else f"{row['dso_days']:.0f}")
+
+    customer_aging = data.aging["executive_customer"]
+    customer_aging = customer_aging[customer_aging["sales_executive"] == selected_exec].drop(columns="sales_executive")
+    st.dataframe(customer_aging.sort_values("overdue_amount", ascending=False), use_container_width=True)
+
+    with st.expander("All executives"):
+        st.dataframe(data.aging["executive"], use_container_width=True)
+
+    output_exec_aging = BytesIO()
+    customer_aging.to_excel(output_exec_aging, index=False, engine='openpyxl')
+    output_exec_aging.seek(0)
+    st.download_button(
+        label="Download Aging & Collection as Excel",
+        data=output_exec_aging,
+        file_name=f"{selected_exec}_aging.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_aging_download"
+    )
@@ -0,0 +1,51 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 9. Executive Transaction
+def render(ctx):
+    df, catalog, cached = ctx.df, ctx.catalog, ctx.cached
+    st.header("📅 Executive-wise Sales, Deposit, Return & Customer Cashback (Custom Date Range)")
+
+    # Executive selection
+    exec_names = catalog.executives_sorted
+    selected_exec = st.selectbox("Select Sales Executive", exec_names, key="custom_exec")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="custom_exec_date")
+
+    # Customer-wise summary of the executive's rows in the range (see summaries.py)
+    summary = cached("exec_sales", (selected_exec, *date_range))
+
+    st.subheader(f"Summary for {selected_exec} ({date_range[0]} to {date_range[1]})")
+    st.dataframe(summary, use_container_width=True)
+
+    # Show totals
+    totals = summary[[
+        "sales_amount", "paid_amount", "sales_return", "customer_cashback",
+        "executive_commission", "teamleader_commission", "gm_commission"
+    ]].sum()
+    st.success(
+        f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+        f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+        f"**Total Return:** {totals['sales_return']:,.2f} | "
+        f"**Total Customer Cashback:** {totals['customer_cashback']:,.2f} | "
+        f"**Total Executive Commission:** {totals['executive_commission']:,.2f} | "
+        f"**Total Team Leader Commission:** {totals['teamleader_commission']:,.2f} | "
+        f"**Total GM Commission:** {totals['gm_commission']:,.2f}|"
+        #f" **Total Outstanding:** {filtered['customer_outstanding'].sum():,.2f} BDT"
+    )
+
+    # Optional: Download button for executive transaction summary
+    output_exec_trans = BytesIO()
+    summary.to_excel(output_exec_trans, index=False, engine='openpyxl')
+    output_exec_trans.seek(0)
+    st.download_button(
+        label="Download Executive Transaction Summary as Excel",
+        data=output_exec_trans,
+        file_name=f"{selected_exec}_transaction_summary.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_trans_download"
+    )
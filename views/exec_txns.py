@@ -0,0 +1,41 @@
+from io import BytesIO
+
+import streamlit as st
+
+from views.pickers import name_picker
+
+
+# 4. Executive-wise Transactions
+def render(ctx):
+    data, df, ledger_rows = ctx.data, ctx.df, ctx.ledger_rows
+    # --- Executive-wise Section ---
+    st.header("Executive-wise Transactions")
+    executive = name_picker(data.names["sales_executive"], "Sales Executive", key="exec")
+    selected_exec = executive.name
+
+    # Date range for executive
+    min_date, max_date = df["date"].min(), df["date"].max()
+    exec_date_range = st.date_input("Select Date Range (Executive)", [min_date, max_date], key="exec_date")
+
+    exec_filtered = ledger_rows(executive=executive.names, date_range=exec_date_range)
+
+    st.subheader(f"All Transactions for: {selected_exec}")
+    st.dataframe(exec_filtered, use_container_width=True)
+    st.success(f"Total Outstanding: {exec_filtered['customer_outstanding'].sum():,.2f} BDT")
+    st.success(f"Sales Amount: {exec_filtered['sales_amount'].sum():,.2f} BDT")
+    st.success(f"Deposit Amount: {exec_filtered['paid_amount'].sum():,.2f} BDT")
+    st.success(f"Sales Return: {exec_filtered['sales_return'].sum():,.2f} BDT")
+    st.success(f"Customer Cashback: {exec_filtered['customer_cashback'].sum():,.2f} BDT")
+    st.success(f"Executive Commission: {exec_filtered['executive_commission'].sum():,.2f} BDT")
+
+    # Download button for executive
+    output_exec = BytesIO()
+    exec_filtered.to_excel(output_exec, index=False, engine='openpyxl')
+    output_exec.seek(0)
+    st.download_button(
+        label="Download Executive Transactions as Excel",
+        data=output_exec,
+        file_name=f"{selected_exec}_transactions.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_download"
+    )
@@ -0,0 +1,120 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from snapshots import monthly_totals
+
+
+# 1. Main Dashboard
+def render(ctx):
+    data, cached = ctx.data, ctx.cached
+    st.header("🏢 WELBURG METAL PVT LTD.")
+    st.title("🚀 Sales & Deposit Dashboard")
+
+    # Current month metrics, total market due (all time), executive sales & due
+    # and top customers, see summaries.month_overview (warmed up at startup)
+    today = pd.Timestamp.today()
+    overview = cached("month_overview", (today.strftime("%Y-%m"),))
+    kpis = overview["kpis"]
+    deposit_amount = kpis["deposit_amount"]
+    sales_return = kpis["sales_return"]
+    customer_cashback = kpis["customer_cashback"]
+    actual_sales = kpis["actual_sales"]
+    total_market_due = kpis["total_market_due"]
+
+    # Executive-wise sales and due (current month)
+    snaps = data.snapshots
+    exec_summary = overview["executives"]
+
+    # Month-wise sales and deposit (bar chart)
+    month_summary = monthly_totals(snaps)[["month", "sales_amount", "paid_amount"]]
+
+    # --- Compact KPI Cards (4 columns + 1 below) ---
+    def format_compact(val):
+        if abs(val) >= 1_000_000:
+            return f"{val/1_000_000:.2f}M"
+        elif abs(val) >= 1_000:
+            return f"{val/1_000:.2f}K"
+        else:
+            return f"{val:,.2f}"
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("💰 Sales", format_compact(actual_sales))
+    col2.metric("🏦 Deposit", format_compact(deposit_amount))
+    col3.metric("🔄 Return", format_compact(sales_return))
+    col4.metric("🧾 Due", format_compact(total_market_due))
+    col5, col6 = st.columns(2)
+    col5.metric("🎁 Cashback", format_compact(customer_cashback))
+    col6.metric("📅 Month", today.strftime("%B %Y"))
+    # Distinct customers this month (bitmap index, see bitmaps.py)
+    month_range = (today.replace(day=1).normalize(), today)
+    col7, col8 = st.columns(2)
+    col7.metric("👥 Buying Customers", data.activity.distinct("buying", month_range))
+    col8.metric("💳 Paying Customers", data.activity.distinct("paying", month_range))
+
+    st.markdown("---")
+
+    # Anomaly flags (scored per data version, see anomalies.py)
+    st.markdown("### 🚨 Anomalies (Last 30 Days of Data)")
+    flags = data.anomalies
+    if flags.empty:
+        st.success("No unusual deposits, returns or cashback found.")
+    else:
+        recent_flags = flags[flags["date"] > flags["date"].max() - pd.Timedelta(days=30)]
+        col_a1, col_a2, col_a3 = st.columns(3)
+        col_a1.metric("📈 Spikes", int((recent_flags["flag"] == "spike").sum()))
+        col_a2.metric("📉 Drops", int((recent_flags["flag"] == "drop").sum()))
+        col_a3.metric("🏦 Missing Deposits", int((recent_flags["flag"] == "missing deposit").sum()))
+        st.dataframe(recent_flags.sort_values("date", ascending=False), use_container_width=True)
+        with st.expander(f"All {len(flags):,} flags"):
+            st.dataframe(flags, use_container_width=True)
+
+    st.markdown("---")
+
+    st.markdown("### Executive-wise Sales & Due (Current Month)")
+    st.dataframe(exec_summary, use_container_width=True)
+    st.markdown("---")
+
+    # Bar chart: Month-wise sales and deposit
+    st.markdown("### 📊 Month-wise Sales & Deposit")
+    fig = px.bar(
+        month_summary,
+        x="month",
+        y=["sales_amount", "paid_amount"],
+        barmode="group",
+        labels={"value": "Amount", "month": "Month", "variable": "Type"},
+        title="Month-wise Sales & Deposit")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("---")
+
+    # Bar chart: Executive-wise sales and due
+    st.markdown("### 🧑‍💼 Executive-wise Sales Bar Chart (Current Month)" \
+    "")
+    fig_exec = px.bar(
+        exec_summary,
+        x="sales_executive",
+        y=["sales_amount", "paid_amount", "due_amount"],
+        barmode="group",
+        labels={"value": "Amount", "sales_executive": "Executive", "variable": "Type"},
+        title="Executive-wise Sales, Deposit & Due"
+    )
+    st.plotly_chart(fig_exec, use_container_width=True)
+    st.markdown("---")
+    # Line chart: Sales trend (last 6 months)
+    st.markdown("### 📈 Sales Trend (Last 6 Months)")
+    last_6_months = month_summary.tail(6)
+    fig_trend = px.line(
+        last_6_months,
+        x="month",
+        y="sales_amount",
+        markers=True,
+        title="Sales Trend (Last 6 Months)"
+    )
+    st.plotly_chart(fig_trend, use_container_width=True)
+    st.markdown("---")
+    # Top 10 Customers by Sales in Current Month
+    st.markdown("### 🏅 Top 10 Customers by Sales (Current Month)")
+    top_customers = overview["top_customers"]
+    st.dataframe(top_customers, use_container_width=True)
+    st.markdown("---")
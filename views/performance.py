@@ -0,0 +1,165 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+
+# 15. Sales & Deposit performance
+def render(ctx):
+    data, df, catalog, ledger_rows = ctx.data, ctx.df, ctx.catalog, ctx.ledger_rows
+    st.title("📈 Executive & Customer Performance Statistics")
+    st.markdown("---")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="performance_date")
+
+    # Filter data by date range
+    filtered = ledger_rows(date_range=date_range)
+
+    # --- Executive Performance Bar Chart ---
+    st.markdown("### 🧑‍💼 Executive-wise Sales & Deposit (Bar Chart)")
+    exec_perf = filtered.groupby("sales_executive").agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum"
+    }).reset_index().rename(columns={"sales_executive": "Executive"})
+    fig_exec = px.bar(
+        exec_perf,
+        x="Executive",
+        y=["sales_amount", "paid_amount", "sales_return"],
+        barmode="group",
+        labels={"value": "Amount", "variable": "Type"},
+        title="Executive-wise Sales, Deposit & Return"
+    )
+    st.plotly_chart(fig_exec, use_container_width=True)
+
+    # --- Customer Performance Bar Chart ---
+    st.markdown("### 👤 Top 10 Customers by Sales (Bar Chart)")
+    cust_perf = filtered.groupby("customer_name")["sales_amount"].sum().reset_index().sort_values(by="sales_amount", ascending=False).head(10)
+    fig_cust = px.bar(
+        cust_perf,
+        x="customer_name",
+        y="sales_amount",
+        labels={"customer_name": "Customer", "sales_amount": "Sales Amount"},
+        title="Top 10 Customers by Sales"
+    )
+    st.plotly_chart(fig_cust, use_container_width=True)
+
+    # --- Executive Sales Trend Line Chart ---
+    st.markdown("### 📈 Executive-wise Sales Trend (Line Chart)")
+    exec_trend = filtered.groupby(["month", "sales_executive"])["sales_amount"].sum().reset_index()
+    fig_exec_trend = px.line(
+        exec_trend,
+        x="month",
+        y="sales_amount",
+        color="sales_executive",
+        markers=True,
+        labels={"month": "Month", "sales_amount": "Sales Amount", "sales_executive": "Executive"},
+        title="Executive-wise Monthly Sales Trend"
+    )
+    st.plotly_chart(fig_exec_trend, use_container_width=True)
+
+    # --- Customer Sales Trend Line Chart ---
+    st.markdown("### 📈 Top 5 Customers Sales Trend (Line Chart)")
+    top5_customers = cust_perf["customer_name"].head(5).tolist()
+    cust_trend = filtered[filtered["customer_name"].isin(top5_customers)]
+    cust_trend = cust_trend.groupby(["month", "customer_name"])["sales_amount"].sum().reset_index()
+    fig_cust_trend = px.line(
+        cust_trend,
+        x="month",
+        y="sales_amount",
+        color="customer_name",
+        markers=True,
+        labels={"month": "Month", "sales_amount": "Sales Amount", "customer_name": "Customer"},
+        title="Top 5 Customers Monthly Sales Trend"
+    )
+    st.plotly_chart(fig_cust_trend, use_container_width=True)
+
+    # --- Rolling window metrics (precomputed per data version, see rolling.py) ---
+    st.markdown("### 📉 Rolling Sales, Deposits & Collection Ratio")
+    rolling_levels = {"Executive": "sales_executive", "Customer": "customer_name"}
+    rolling_level = st.radio("Rolling metrics for", list(rolling_levels), horizontal=True, key="rolling_level")
+    rolling_key = rolling_levels[rolling_level]
+    window = st.radio("Window", ["7d", "30d", "90d"], index=1, horizontal=True, key="rolling_window")
+
+    if rolling_key == "sales_executive":
+        default_names = exec_perf.sort_values("sales_amount", ascending=False)["Executive"].head(5).tolist()
+        options = catalog.executives_sorted
+    else:
+        default_names = cust_perf["customer_name"].head(5).tolist()
+        options = catalog.customers_sorted
+    selected_names = st.multiselect(f"Select {rolling_level}(s)", options, default=default_names, key="rolling_names")
+
+    rolling = data.rolling[rolling_key]
+    rolling = rolling[
+        rolling[rolling_key].isin(selected_names) &
+        (rolling["date"] >= pd.to_datetime(date_range[0])) &
+        (rolling["date"] <= pd.to_datetime(date_range[1]))
+    ]
+    fig_rolling = px.line(
+        rolling,
+        x="date",
+        y=f"sales_{window}",
+        color=rolling_key,
+        markers=True,
+        labels={"date": "Date", f"sales_{window}": f"Sales ({window})", rolling_key: rolling_level},
+        title=f"Rolling {window} Sales"
+    )
+    st.plotly_chart(fig_rolling, use_container_width=True)
+    fig_rolling_dep = px.line(
+        rolling,
+        x="date",
+        y=f"deposits_{window}",
+        color=rolling_key,
+        markers=True,
+        labels={"date": "Date", f"deposits_{window}": f"Deposits ({window})", rolling_key: rolling_level},
+        title=f"Rolling {window} Deposits"
+    )
+    st.plotly_chart(fig_rolling_dep, use_container_width=True)
+    fig_rolling_ratio = px.line(
+        rolling,
+        x="date",
+        y=f"collection_ratio_{window}",
+        color=rolling_key,
+        markers=True,
+        labels={"date": "Date", f"collection_ratio_{window}": "Deposits / Sales", rolling_key: rolling_level},
+        title=f"Rolling {window} Collection Ratio"
+    )
+    st.plotly_chart(fig_rolling_ratio, use_container_width=True)
+
+    # --- Month-end projection (model fitted per data version, see forecast.py) ---
+    st.markdown("### 🔮 Month-end Projection")
+    projection = data.forecast
+    if projection is None or projection.empty:
+        st.info("Not enough data to project the month end.")
+    else:
+        as_of = pd.Timestamp(projection.attrs["as_of"])
+        st.caption(
+            f"Projected for {as_of:%B %Y} as of {as_of:%d %b %Y}: month-to-date actual plus the "
+            f"forecast for the remaining days (exponential smoothing / seasonal naive on closed months)."
+        )
+        projection_levels = {"Executive": "sales_executive", "Customer Type": "customer_type"}
+        projection_level = st.radio("Projection by", list(projection_levels), horizontal=True, key="projection_level")
+        projected = projection[projection["dimension"] == projection_levels[projection_level]]
+        projected = projected.pivot_table(
+            index="name", columns="measure", values=["month_to_date", "projected_month_end"], aggfunc="sum"
+        )
+        projected.columns = [f"{measure}_{value}" for value, measure in projected.columns]
+        projected = projected.rename_axis(projection_level).reset_index()
+        st.dataframe(projected, use_container_width=True)
+
+        fig_projection = px.bar(
+            projected,
+            x=projection_level,
+            y=["sales_amount_month_to_date", "sales_amount_projected_month_end"],
+            barmode="group",
+            title=f"Sales: Month-to-date vs Projected Month-end by {projection_level}"
+        )
+        st.plotly_chart(fig_projection, use_container_width=True)
+        st.download_button(
+            label="Download Projection (CSV)",
+            data=projection.to_csv(index=False),
+            file_name=f"month_end_projection_{as_of:%Y-%m}.csv",
+            mime="text/csv",
+            key="projection_download"
+        )
@@ -0,0 +1,19 @@
+import streamlit as st
+
+from search import SEARCH_LIMIT
+
+
+# ✅ Name picker: a search box and the best matches (see search.py) instead of
+# every name in one selectbox. Returns the picked NameEntry (canonical name and
+# every spelling of it); when nothing matches, the busiest names are offered.
+def name_picker(index, label, key, select_label=None, limit=SEARCH_LIMIT):
+    query = st.text_input(f"🔎 Search {label}", key=f"{key}_search", placeholder="Type part of a name")
+    matches = {entry.id: entry for entry in index.search(query, limit)}
+    if not matches:
+        st.info(f"No {label.lower()} matches '{query}', showing the most active ones.")
+        matches = {entry.id: entry for entry in index.search("", limit)}
+    selected = st.selectbox(select_label or f"Select {label}", list(matches), format_func=lambda entry_id: matches[entry_id].label, key=key)
+    entry = matches[selected]
+    if len(entry.names) > 1:
+        st.caption(f"Also recorded as: {', '.join(entry.names[1:])}")
+    return entry
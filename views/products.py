@@ -0,0 +1,77 @@
+from io import BytesIO
+
+import streamlit as st
+
+from products import LINE_ITEMS_FILE, PRODUCT_GROUPS, price_table, product_mix, tier_mix
+
+
+# 18. Products
+def render(ctx):
+    data = ctx.data
+    st.title("📊 Our product prices")
+    st.markdown("---")
+
+    st.markdown("### 🏷️ Product Information")
+    for issue in data.product_issues.itertuples():
+        st.warning(f"{issue.file}: {issue.problem}")
+
+    # Price list from products.csv, one table per group (prices in BDT)
+    for group in PRODUCT_GROUPS:
+        st.markdown(f"#### {group}")
+        st.dataframe(
+            price_table(data.products, group).style.format(
+                {"Regular Price": "{:,.2f}", "Premium Price": "{:,.2f}"}, na_rep=""
+            ),
+            use_container_width=True
+        )
+
+    # --- Product sales (optional line-item sheet, see products.py) ---
+    st.markdown("---")
+    st.markdown("### 📦 Product Sales")
+    if data.product_cube is None:
+        st.info(f"Add {LINE_ITEMS_FILE} next to the sales workbook (date, order_no, sku, quantity, tier) to see product sales.")
+        return
+    if data.line_item_issues is not None and not data.line_item_issues.empty:
+        with st.expander(f"⚠️ {len(data.line_item_issues)} line item(s) skipped"):
+            st.dataframe(data.line_item_issues, use_container_width=True)
+
+    cube = data.product_cube
+    months = sorted(cube["month"].unique())
+    month_range = st.select_slider("Months", options=months, value=(months[0], months[-1]), key="product_months")
+    cube = cube[(cube["month"] >= month_range[0]) & (cube["month"] <= month_range[1])]
+
+    level_labels = {"Product (SKU)": "sku", "Item": "item_name", "Group": "group"}
+    level_label = st.radio("Product level", list(level_labels), horizontal=True, key="product_level")
+    level = level_labels[level_label]
+
+    import plotly.express as px
+
+    mix = product_mix(cube, by="month", level=level)
+    fig_mix = px.bar(
+        mix,
+        x="month",
+        y="amount",
+        color=level,
+        labels={"month": "Month", "amount": "Amount", level: level_label},
+        title=f"Product Mix by Month ({level_label})"
+    )
+    st.plotly_chart(fig_mix, use_container_width=True)
+
+    st.markdown(f"#### {level_label} × Executive")
+    by_exec = cube.pivot_table(index=level, columns="sales_executive", values="amount", aggfunc="sum", observed=True, fill_value=0.0)
+    st.dataframe(by_exec, use_container_width=True)
+
+    st.markdown("#### 💎 Regular vs Premium by Executive")
+    tiers = tier_mix(cube)
+    st.dataframe(tiers, use_container_width=True)
+
+    output_products = BytesIO()
+    cube.to_excel(output_products, index=False, engine='openpyxl')
+    output_products.seek(0)
+    st.download_button(
+        label="Download Product Sales Cube as Excel",
+        data=output_products,
+        file_name=f"product_sales_{month_range[0]}_{month_range[1]}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="product_download"
+    )
@@ -0,0 +1,66 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 3. Sales History
+def render(ctx):
+    df, catalog, ledger_rows = ctx.df, ctx.catalog, ctx.ledger_rows
+    st.write("# 📜 Sales History ")
+    st.title("📊 Sales & Deposit Dashboard")
+
+    # ✅ Sales Executive Wise Summary
+    st.subheader("Sales Executive Wise Summary")
+    grouped_exec = df.groupby("sales_executive")[
+        ["openning_balance", "sales_amount", "sales_return", "paid_amount", "customer_cashback","customer_outstanding"]
+    ].sum().reset_index()
+
+    # ✅ number columns format
+    number_cols = [
+        "openning_balance",
+        "sales_amount",
+        "sales_return", 
+        "paid_amount", 
+        "customer_cashback",
+        "customer_outstanding"]
+    st.dataframe(
+        grouped_exec.style.format({col: "{:,.2f}" for col in number_cols}),
+        use_container_width=True
+    )
+    st.success("Total Outstanding Amount: {:.2f} BDT".format(df["customer_outstanding"].sum()))
+    st.success("Total Sales Amount: {:.2f} BDT".format(df["sales_amount"].sum()))
+    st.success("Total Deposit Amount: {:.2f} BDT".format(df["paid_amount"].sum()))
+    st.success("Total Sales Return: {:.2f} BDT".format(df["sales_return"].sum()))
+    st.success("Total Customer Cashback: {:.2f} BDT".format(df["customer_cashback"].sum()))
+    st.success("Total Executive Commission: {:.2f} BDT".format(df["executive_commission"].sum()))
+    st.success("Total Team Leader Commission: {:.2f} BDT".format(df["teamleader_commission"].sum()))
+    st.success("Total GM Commission: {:.2f} BDT".format(df["gm_commission"].sum()))
+
+    st.markdown("---")
+
+    # ✅ Sales Executive Selection
+    executives = catalog.executives
+    selected_exec = st.selectbox("🔍 Select Sales Executive", executives)
+
+    # ✅ Filter Data for Selected Executive
+    filtered_df = ledger_rows(executive=selected_exec)
+    st.subheader(f"📄 Detailed Transactions for: {selected_exec}")
+    st.dataframe(filtered_df)
+    st.success(f"Total Outstanding for {selected_exec}: {filtered_df['customer_outstanding'].sum():,.2f} BDT")
+    st.success(f"Total Sales Amount for {selected_exec}: {filtered_df['sales_amount'].sum():,.2f} BDT")
+    st.success(f"Total Deposit Amount for {selected_exec}: {filtered_df['paid_amount'].sum():,.2f} BDT")
+    st.success(f"Total Sales Return for {selected_exec}: {filtered_df['sales_return'].sum():,.2f} BDT")
+    st.success(f"Total Customer Cashback for {selected_exec}: {filtered_df['customer_cashback'].sum():,.2f} BDT")
+    st.markdown("---")
+    # ✅ Download Button for Executive Transactions
+    output_exec = BytesIO()
+    filtered_df.to_excel(output_exec, index=False, engine='openpyxl')
+    output_exec.seek(0)
+    st.download_button(
+        label="Download Executive Transactions as Excel",
+        data=output_exec,
+        file_name=f"{selected_exec}_transactions.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="exec_download"
+    )
+    st.markdown("---")
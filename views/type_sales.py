@@ -0,0 +1,90 @@
+from io import BytesIO
+
+import streamlit as st
+
+
+# 12. Category-wise Transactions
+def render(ctx):
+    df, catalog, ledger_rows = ctx.df, ctx.catalog, ctx.ledger_rows
+    st.header("📅 Date Range & Customer Category-wise Sales, Deposit, Return & Commission")
+
+    # Multi-select customer types
+    categories = catalog.types
+    selected_categories = st.multiselect("Select Customer Type(s)", categories, default=list(categories), key="cust_cat_multi")
+
+    # Optionally some customers of the selected types (none selected = all of them)
+    customers = sorted({name for category in selected_categories for name in catalog.customers_of_type(category)})
+    selected_customers = st.multiselect("Select Customer(s)", customers, key="cust_cat_multi_customers")
+
+    # Date range selection
+    min_date, max_date = df['date'].min(), df['date'].max()
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="cust_cat_date")
+
+    # Filter data by selected customer types and date range
+    if selected_categories:
+        filtered = ledger_rows(customer=selected_customers or None, customer_types=selected_categories, date_range=date_range)
+
+        # Group by customer
+        summary = filtered.groupby("customer_name").agg({
+            "sales_amount": "sum",
+            "paid_amount": "sum",
+            "sales_return": "sum",
+            "customer_cashback": "sum",
+            "executive_commission": "sum",
+            "teamleader_commission": "sum",
+            "gm_commission": "sum"
+        }).reset_index()
+
+        st.subheader(f"Summary for {', '.join(selected_categories)} from {date_range[0]} to {date_range[1]}")
+        st.dataframe(summary, use_container_width=True)
+
+        # Executive-wise summary for selected customer types and date range
+        st.markdown("### 🧑‍💼 Executive-wise Summary for Selected Customer Types")
+        exec_summary = filtered.groupby("sales_executive").agg({
+            "sales_amount": "sum",
+            "paid_amount": "sum",
+            "sales_return": "sum",
+            "customer_cashback": "sum",
+            "executive_commission": "sum",
+            "teamleader_commission": "sum",
+            "gm_commission": "sum"
+        }).reset_index().rename(columns={"sales_executive": "Executive"})
+        st.dataframe(exec_summary, use_container_width=True)
+
+        # Show totals
+        totals = summary[[
+            "sales_amount", "paid_amount", "sales_return", "customer_cashback",
+            "executive_commission", "teamleader_commission", "gm_commission"
+        ]].sum()
+        st.success(
+            f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+            f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+            f"**Total Return:** {totals['sales_return']:,.2f} | "
+            f"**Total Customer Cashback:** {totals['customer_cashback']:,.2f} | "
+            f"**Total Executive Commission:** {totals['executive_commission']:,.2f} | "
+            f"**Total Team Leader Commission:** {totals['teamleader_commission']:,.2f} | "
+            f"**Total GM Commission:** {totals['gm_commission']:,.2f}"
+        )
+
+        # Download button for summary
+        output_cat = BytesIO()
+        summary.to_excel(output_cat, index=False, engine='openpyxl')
+        output_cat.seek(0)
+        st.download_button(
+            label="Download Category-wise Transactions as Excel",
+            data=output_cat,
+            file_name=f"category_transactions_{date_range[0]}_{date_range[1]}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="cat_download"
+        )
+
+        # Download button for executive summary
+        output_exec = BytesIO()
+        exec_summary.to_excel(output_exec, index=False, engine='openpyxl')
+        output_exec.seek(0)
+        st.download_button(
+            label="Download Executive-wise Summary as Excel",
+            data=output_exec,
+            file_name=f"executive_summary_{date_range[0]}_{date_range[1]}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="exec_download")
@@ -0,0 +1,180 @@
+import atexit
+import datetime
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from cohorts import build_cohorts
+from compare import compare_all
+from hierarchy import rollup
+from summaries import commission_summary, customer_sales, daily_recap, date_summary, month_overview
+
+
+# ✅ Page results that can be computed outside a page
+# name -> (builder(data, ledger_rows, *inputs), date ranges the result reads
+# or None). The pages ask for them with cached(name, inputs), the warm-up
+# builds the same keys ahead of the first visitor.
+RESULTS = {
+    "month_overview": (lambda data, rows, month: month_overview(data.df, data.snapshots, month), None),
+    "exec_comm": (lambda data, rows, *date_range: commission_summary(rows(date_range=date_range)), lambda inputs: [inputs]),
+    "daily_recap": (lambda data, rows, *date_range: daily_recap(rows(date_range=date_range)), lambda inputs: [inputs]),
+    "date_summary": (lambda data, rows, *date_range: date_summary(rows(date_range=date_range)), lambda inputs: [inputs]),
+    "exec_sales": (
+        lambda data, rows, executive, *date_range: customer_sales(rows(executive=executive, date_range=date_range)),
+        lambda inputs: [inputs[1:]],
+    ),
+    "hierarchy_rollup": (lambda data, rows, *date_range: rollup(data.cube, data.hierarchy, date_range), None),
+    "compare": (
+        lambda data, rows, a_start, a_end, b_start, b_end: compare_all(data.cube, (a_start, a_end), (b_start, b_end)),
+        lambda inputs: [inputs[:2], inputs[2:]],
+    ),
+    "cohorts": (lambda data, rows: build_cohorts(data.df), None),
+}
+
+
+# Inputs of the results as the pages first show them (current month, whole data range)
+def _current_month(data):
+    return (pd.Timestamp.today().strftime("%Y-%m"),)
+
+
+def _whole_range(data):
+    return (data.df["date"].min().date(), data.df["date"].max().date())
+
+
+DEFAULT_INPUTS = {
+    "month_overview": _current_month,
+    "exec_comm": _whole_range,
+    "daily_recap": _whole_range,
+    "date_summary": _whole_range,
+    "hierarchy_rollup": _whole_range,
+    "cohorts": lambda data: (),
+}
+# Home / Dashboard, Commissions and Daily Recap
+DEFAULT_WARMUP = ["month_overview", "exec_comm", "hierarchy_rollup", "daily_recap"]
+
+
+def get_result(cache, data, ledger_rows, name, inputs):
+    build, dates = RESULTS[name]
+    inputs = tuple(inputs)
+    return cache.get_or_build((data.version, name) + inputs, lambda: build(data, ledger_rows, *inputs),
+                              dates(inputs) if dates is not None else None)
+
+
+# JSON form of widget inputs (dates, timestamps, text and numbers)
+def _encode_input(value):
+    if isinstance(value, datetime.datetime):
+        return {"timestamp": pd.Timestamp(value).isoformat()}
+    if isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"{type(value).__name__} inputs are not recorded")
+
+
+def _decode_input(value):
+    if isinstance(value, dict):
+        if "timestamp" in value:
+            return pd.Timestamp(value["timestamp"])
+        return datetime.date.fromisoformat(value["date"])
+    return value
+
+
+# Which results (and inputs) the pages ask for, and how often. Counts are
+# merged into a JSON file shared by all worker processes (at most every
+# `save_interval` seconds and at exit), so the warm-up set follows real use
+# over restarts.
+class UsageLog:
+
+    def __init__(self, path, save_interval=30.0):
+        self.path = path
+        self.save_interval = save_interval
+        self._pending = {}
+        self._last_save = time.time()
+        self._lock = threading.Lock()
+        atexit.register(self.save)
+
+    def record(self, name, inputs):
+        try:
+            key = json.dumps([name, [_encode_input(v) for v in inputs]])
+        except TypeError:
+            return
+        now = time.time()
+        with self._lock:
+            count, _ = self._pending.get(key, (0, now))
+            self._pending[key] = (count + 1, now)
+            due = now - self._last_save >= self.save_interval
+        if due:
+            self.save()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_save = time.time()
+        if not pending:
+            return
+        counts = self._load()
+        for key, (count, last_seen) in pending.items():
+            stored = counts.get(key, {"count": 0, "last_seen": 0})
+            counts[key] = {"count": stored["count"] + count, "last_seen": max(stored["last_seen"], last_seen)}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(counts, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    # Requests seen in the last `max_age_days`, most frequent first (saved and pending)
+    def table(self, max_age_days=7):
+        counts = self._load()
+        with self._lock:
+            for key, (count, last_seen) in self._pending.items():
+                stored = counts.get(key, {"count": 0, "last_seen": 0})
+                counts[key] = {"count": stored["count"] + count, "last_seen": max(stored["last_seen"], last_seen)}
+        cutoff = time.time() - max_age_days * 86400
+        rows = [
+            {"name": json.loads(key)[0], "inputs": json.loads(key)[1], "count": entry["count"],
+             "last_seen": pd.Timestamp.fromtimestamp(entry["last_seen"])}
+            for key, entry in counts.items() if entry["last_seen"] >= cutoff
+        ]
+        table = pd.DataFrame(rows, columns=["name", "inputs", "count", "last_seen"])
+        return table.sort_values(["count", "last_seen"], ascending=False, kind="mergesort").reset_index(drop=True)
+
+    def top(self, n=10, max_age_days=7):
+        table = self.table(max_age_days)
+        return [(name, tuple(_decode_input(v) for v in inputs)) for name, inputs in zip(table["name"].head(n), table["inputs"].head(n))]
+
+
+# Build the default results of `views` and the `top` most requested ones for a
+# new dataset. Returns what was warmed, for the Admin page.
+def warm_up(data, cache, ledger_rows, usage=None, views=DEFAULT_WARMUP, top=10):
+    started = time.perf_counter()
+    requests = [(name, DEFAULT_INPUTS[name](data)) for name in views if name in DEFAULT_INPUTS]
+    if usage is not None and top:
+        requests += usage.top(top)
+    warmed, errors = [], []
+    for name, inputs in dict.fromkeys(requests):
+        if name not in RESULTS:
+            continue
+        try:
+            get_result(cache, data, ledger_rows, name, inputs)
+            warmed.append((name, inputs))
+        except Exception as e:
+            errors.append(f"{name}{inputs}: {e}")
+    return {
+        "version": data.version,
+        "results": warmed,
+        "errors": errors,
+        "seconds": time.perf_counter() - started,
+        "finished_at": pd.Timestamp.now(),
+    }